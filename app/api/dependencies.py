@@ -1,11 +1,11 @@
+from dataclasses import replace
 from fastapi import Depends, HTTPException, Request
 from jose import jwt, JWTError
 from app.auth.token_decoder import AuthJSDecoder
 from app.core.config import settings
 from sqlalchemy.orm import Session
 from app.db.session import get_db
-from app.crud import user as user_crud
-from app.models.workspace import WorkspaceMember
+from app.services.principal_cache import Principal, get_principal
 
 async def get_current_user(request: Request):
     authorization = request.headers.get("Authorization")
@@ -95,25 +95,19 @@ async def get_current_user(request: Request):
         except JWTError:
             raise HTTPException(status_code=401, detail="Invalid cookie token")
 
-async def get_current_user_with_workspace(request: Request, db: Session = Depends(get_db)):
-    """Get current user and their workspace context for proper data isolation."""
+async def get_current_principal(request: Request, db: Session = Depends(get_db)) -> Principal:
+    """Authenticated caller with user row, workspace memberships and roles, cached for a few seconds."""
     current_user = await get_current_user(request)
-    
-    # Get user from database to access tenant_id
-    user = user_crud.get_user_by_email(db, current_user["email"])
-    if not user:
+    principal = get_principal(db, current_user["email"]) if current_user else None
+    if not principal:
         raise HTTPException(status_code=401, detail="User not authenticated")
-    
-    # Get user's workspace membership
-    workspace_membership = db.query(WorkspaceMember).filter(
-        WorkspaceMember.user_id == user.user_id
-    ).first()
-    
-    workspace_id = workspace_membership.workspace_id if workspace_membership else None
-    
+    return replace(principal, current_user=current_user)
+
+async def get_current_user_with_workspace(principal: Principal = Depends(get_current_principal)):
+    """Get current user and their workspace context for proper data isolation."""
     return {
-        "user": user,
-        "workspace_id": workspace_id,
-        "tenant_id": user.tenant_id,
-        "current_user": current_user
+        "user": principal.user,
+        "workspace_id": principal.workspace_id,
+        "tenant_id": principal.tenant_id,
+        "current_user": principal.current_user
     }
@@ -1,12 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, Body
 from sqlalchemy.orm import Session
 from app.db.session import get_db
-from app.crud.channel import get_channels_by_workspace_id  # Fetch channels by workspace
-from app.schemas.channel import ChannelResponse
+from app.crud.channel import get_channel_by_id, get_channels_by_workspace_id, set_channel_digest  # Fetch channels by workspace
+from app.schemas.channel import ChannelDigestSettings, ChannelResponse
 from app.services.slack_service import SlackService
 from app.schemas.message import Message  # Import the Message model
-from app.api.dependencies import get_current_user
-from app.crud import user as user_crud
+from app.api.dependencies import get_current_principal, get_current_user
+from app.services.principal_cache import Principal, get_cached_user
 
 from typing import List, Dict
 
@@ -17,7 +17,7 @@ def get_all_channels(workspace_id: str,
                      db: Session = Depends(get_db),
                      current_user: dict = Depends(get_current_user)):
     """API endpoint to fetch all channels for a specific workspace."""
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     channels = get_channels_by_workspace_id(db, workspace_id)
@@ -25,13 +25,26 @@ def get_all_channels(workspace_id: str,
         raise HTTPException(status_code=404, detail="No channels found for this workspace.")
     return channels 
 
+@router.put("/channels/{channel_id}/digest", response_model=ChannelResponse)
+def update_channel_digest(channel_id: str,
+                          settings: ChannelDigestSettings,
+                          db: Session = Depends(get_db),
+                          principal: Principal = Depends(get_current_principal)):
+    """Turn digest mode on or off for a channel: updates posted to it are batched and sent once per window."""
+    channel = get_channel_by_id(db, channel_id)
+    if not channel:
+        raise HTTPException(status_code=404, detail="Channel not found")
+    if not principal.role_in(channel.workspace_id):
+        raise HTTPException(status_code=403, detail="Not a member of this channel's workspace")
+    return set_channel_digest(db, channel_id, settings.enabled, settings.window_minutes)
+
 # @router.post("/channels/{channel_id}/message")
 # async def post_message(channel_id: str, 
 #                        db: Session = Depends(get_db), 
 #                        current_user: dict = Depends(get_current_user),
 #                        message: Message = Body(...)):  # Use the Message model
 #     """API endpoint to post a message to a specific channel."""
-#     user = user_crud.get_user_by_email(db, current_user["email"])
+#     user = get_cached_user(db, current_user["email"])
 #     if not user:
 #         raise HTTPException(status_code=401, detail="User not authenticated, please login")
 #     slack_service = SlackService(db=db)  # Initialize your Slack service
@@ -1,14 +1,15 @@
 # app/api/endpoints/initiative_dependencies.py
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
 from sqlalchemy.orm import Session
 from app.crud import dependencies
 from app.db.session import get_db  # Assuming you have a database connection setup
 from app.schemas.dependencies import InitiativeDependencyCreate, InitiativeDependencyResponse, \
-    ProjectDependencyCreate, ProjectDependencyResponse
-from typing import List
+    ProjectDependencyCreate, ProjectDependencyResponse, DependencyClosureResponse, CriticalPathResponse
+from typing import List, Optional
 from app.api.dependencies import get_current_user
-from app.crud import user as user_crud
+from app.services.principal_cache import get_cached_user
 from fastapi import Header
+from app.services.dependency_graph import PROJECT_GRAPH, INITIATIVE_GRAPH
 
 router = APIRouter()
 
@@ -20,7 +21,7 @@ def create_initiative_dependency(
     current_user: dict = Depends(get_current_user),
     authorization: str = Header(...)
 ):
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     return dependencies.create_initiative_dependency(db, initiative_id, dependency)
@@ -30,7 +31,7 @@ def get_initiative_dependencies(initiative_id: str,
                                 db: Session = Depends(get_db),
                                 current_user: dict = Depends(get_current_user),
                                 authorization: str = Header(...)):
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     return dependencies.get_initiative_dependencies(db, initiative_id)
@@ -43,7 +44,7 @@ def create_project_dependency(
     current_user: dict = Depends(get_current_user),
     authorization: str = Header(...)
 ):
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     return dependencies.create_project_dependency(db, project_id, dependency)
@@ -55,7 +56,85 @@ def get_project_dependencies(
     current_user: dict = Depends(get_current_user),
     authorization: str = Header(...)
 ):
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     return dependencies.get_project_dependencies(db, project_id)
+
+@router.get("/dependencies/graph/projects/critical-path", response_model=CriticalPathResponse)
+def get_project_critical_path(
+    workspace_id: str = Query(...),
+    project_id: Optional[str] = Query(None, description="End the path at this project instead of the latest finishing one"),
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+    authorization: str = Header(...)
+):
+    user = get_cached_user(db, current_user["email"])
+    if not user:
+        raise HTTPException(status_code=401, detail="User not authenticated, please login")
+    return dependencies.get_critical_path(db, PROJECT_GRAPH, workspace_id, project_id)
+
+@router.get("/dependencies/graph/initiatives/critical-path", response_model=CriticalPathResponse)
+def get_initiative_critical_path(
+    workspace_id: str = Query(...),
+    initiative_id: Optional[str] = Query(None, description="End the path at this initiative instead of the latest finishing one"),
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+    authorization: str = Header(...)
+):
+    user = get_cached_user(db, current_user["email"])
+    if not user:
+        raise HTTPException(status_code=401, detail="User not authenticated, please login")
+    return dependencies.get_critical_path(db, INITIATIVE_GRAPH, workspace_id, initiative_id)
+
+@router.get("/dependencies/graph/projects/{project_id}/upstream", response_model=DependencyClosureResponse)
+def get_project_upstream(
+    project_id: str,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+    authorization: str = Header(...)
+):
+    """Every project this project transitively depends on."""
+    user = get_cached_user(db, current_user["email"])
+    if not user:
+        raise HTTPException(status_code=401, detail="User not authenticated, please login")
+    return dependencies.get_dependency_closure(db, PROJECT_GRAPH, project_id, "upstream")
+
+@router.get("/dependencies/graph/projects/{project_id}/downstream", response_model=DependencyClosureResponse)
+def get_project_downstream(
+    project_id: str,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+    authorization: str = Header(...)
+):
+    """Every project that transitively depends on this project."""
+    user = get_cached_user(db, current_user["email"])
+    if not user:
+        raise HTTPException(status_code=401, detail="User not authenticated, please login")
+    return dependencies.get_dependency_closure(db, PROJECT_GRAPH, project_id, "downstream")
+
+@router.get("/dependencies/graph/initiatives/{initiative_id}/upstream", response_model=DependencyClosureResponse)
+def get_initiative_upstream(
+    initiative_id: str,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+    authorization: str = Header(...)
+):
+    """Every initiative this initiative transitively depends on."""
+    user = get_cached_user(db, current_user["email"])
+    if not user:
+        raise HTTPException(status_code=401, detail="User not authenticated, please login")
+    return dependencies.get_dependency_closure(db, INITIATIVE_GRAPH, initiative_id, "upstream")
+
+@router.get("/dependencies/graph/initiatives/{initiative_id}/downstream", response_model=DependencyClosureResponse)
+def get_initiative_downstream(
+    initiative_id: str,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+    authorization: str = Header(...)
+):
+    """Every initiative that transitively depends on this initiative."""
+    user = get_cached_user(db, current_user["email"])
+    if not user:
+        raise HTTPException(status_code=401, detail="User not authenticated, please login")
+    return dependencies.get_dependency_closure(db, INITIATIVE_GRAPH, initiative_id, "downstream")
@@ -9,7 +9,7 @@ from app.schemas.initiative_interactions import (
 from app.crud import initiative_interactions as crud
 from app.api.dependencies import get_current_user
 from fastapi import Header
-from app.crud import user as user_crud
+from app.services.principal_cache import get_cached_user
 
 router = APIRouter()
 
@@ -22,7 +22,7 @@ def create_initiative_comment(
     authorization: str = Header(...)
 
 ):
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     crud.create_initiative_comment(
@@ -41,7 +41,7 @@ def get_initiative_interactions(
     current_user: dict = Depends(get_current_user),
     authorization: str = Header(...)    
 ):
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     return crud.get_initiative_interactions(db=db, update_id=update_id)
@@ -55,7 +55,7 @@ def react_to_initiative_update(
     current_user: dict = Depends(get_current_user),
     authorization: str = Header(...)
 ):
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     crud.add_initiative_reaction(
@@ -76,7 +76,7 @@ def update_initiative_comment(
     current_user: dict = Depends(get_current_user),
     authorization: str = Header(...)
 ):
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     crud.update_initiative_comment(db=db, comment_id=comment_id, comment=comment)
@@ -91,7 +91,7 @@ def delete_initiative_comment(
     current_user: dict = Depends(get_current_user),
     authorization: str = Header(...)
 ):
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     crud.delete_initiative_comment(db=db, comment_id=comment_id)
@@ -107,7 +107,7 @@ def update_initiative_reaction(
     current_user: dict = Depends(get_current_user),
     authorization: str = Header(...)
 ):
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     crud.update_initiative_reaction(db=db, reaction_id=reaction_id, reaction=reaction)
@@ -122,7 +122,7 @@ def delete_initiative_reaction(
     current_user: dict = Depends(get_current_user),
     authorization: str = Header(...)
 ):
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     crud.delete_initiative_reaction(db=db, reaction_id=reaction_id)
@@ -1,11 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.schemas.initiative import InitiativeCreate, InitiativeUpdate, InitiativeResponse
 from app.crud import initiative as crud_initiative
+from app.utils.etag import make_etag, etag_matches, not_modified, set_etag
 from app.db.session import get_db
 from app.api.dependencies import get_current_user, get_current_user_with_workspace
-from app.crud import user as user_crud
+from app.services.principal_cache import get_cached_user
 from jose import jwt, JWTError
 from app.core.config import settings
 from app.models.teams import TeamMember
@@ -39,7 +40,7 @@ def create_initiative_api(initiative: InitiativeCreate,
     email = _extract_email(current_user)
     if not email:
         raise HTTPException(status_code=401, detail="User email missing from token")
-    user = user_crud.get_user_by_email(db, email)
+    user = get_cached_user(db, email)
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     return crud_initiative.create_initiative(db=db, initiative=initiative)
@@ -51,7 +52,7 @@ def update_initiative(initiative_id: str, initiative: InitiativeUpdate,
     email = _extract_email(current_user)
     if not email:
         raise HTTPException(status_code=401, detail="User email missing from token")
-    user = user_crud.get_user_by_email(db, email)
+    user = get_cached_user(db, email)
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     return crud_initiative.update_initiative(db=db, initiative_id=initiative_id, initiative=initiative)
@@ -126,14 +127,16 @@ def list_initiatives_api(
 
 @router.get("/initiatives/{initiative_id}", response_model=InitiativeResponse)
 def get_initiative(initiative_id: str, 
+                    request: Request,
+                    response: Response,
                     db: Session = Depends(get_db),
                     current_user: dict = Depends(get_current_user),
                     team_id: Optional[str] = Query(None)):
-    """Get a specific initiative by ID"""
+    """Get a specific initiative by ID. Answers 304 when If-None-Match matches the current ETag."""
     email = _extract_email(current_user)
     if not email:
         raise HTTPException(status_code=401, detail="User email missing from token")
-    user = user_crud.get_user_by_email(db, email)
+    user = get_cached_user(db, email)
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     # If team_id is provided, allow access if the requester is a member of that team
@@ -171,5 +174,10 @@ def get_initiative(initiative_id: str,
         if not linked:
             raise HTTPException(status_code=404, detail="Initiative not linked to the requested team")
 
-    return crud_initiative.get_initiative(db, initiative_id=initiative_id)
+    etag = make_etag(crud_initiative.get_initiative_version(db, initiative_id=initiative_id))
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    initiative = crud_initiative.get_initiative(db, initiative_id=initiative_id)
+    set_etag(response, etag)
+    return initiative
 
@@ -1,6 +1,6 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from app.db.session import get_db
 from app.api.dependencies import get_current_user
 from app.schemas.issue_interactions import (
@@ -34,14 +34,16 @@ def create_issue_comment(
 @router.get(
     "/issues/{issue_id}/comments",
     response_model=IssueInteractionResponse,
-    summary="Get all comments with reactions, reply counts & last‑reply timestamp"
+    summary="Get a page of top-level comments with reactions, reply counts & last‑reply timestamp"
 )
 def get_issue_comment_interactions(
     issue_id: str,
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(crud.DEFAULT_COMMENT_PAGE_SIZE, ge=1, le=200),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
-    return crud.get_issue_interactions(db=db, issue_id=issue_id)
+    return crud.get_issue_interactions(db=db, issue_id=issue_id, cursor=cursor, limit=limit)
 
 
 @router.post(
@@ -108,14 +110,16 @@ def delete_comment(
 @router.get(
     "/issues/{issue_id}/comments/{comment_id}/replies",
     response_model=IssueInteractionResponse,
-    summary="Fetch all direct replies to a comment"
+    summary="Fetch a page of direct replies to a comment"
 )
 def list_comment_replies(
     issue_id: str,
     comment_id: str,
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(crud.DEFAULT_COMMENT_PAGE_SIZE, ge=1, le=200),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
-    return crud.get_replies(db=db, comment_id=comment_id)
+    return crud.get_replies(db=db, issue_id=issue_id, comment_id=comment_id, cursor=cursor, limit=limit)
 
 
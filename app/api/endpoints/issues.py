@@ -1,10 +1,12 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
 from app.api.dependencies import get_current_user
 from app.crud import issues as issues_crud
+from app.utils.etag import make_etag, etag_matches, not_modified, set_etag
+from app.core.responses import FastJSONResponse
 from app.schemas.issues import IssueCreate, IssueUpdate, IssueArchive, IssueUnarchive
 
 router = APIRouter()
@@ -28,19 +30,25 @@ def list_issues(
     include_archived: bool = Query(False, description="Include archived issues in results")
 ):
     """List all issues with pagination and optional filtering."""
-    return issues_crud.list_issues(
+    issues = issues_crud.list_issues(
         db=db, offset=offset, limit=limit, 
         team_id=team_id, statuses=statuses, 
         assignee=assignee, priority=priority, 
         cycle_id=cycle_id, include_archived=include_archived
     )
+    # Returned directly so the DTOs are serialized by orjson without a jsonable_encoder pass
+    return FastJSONResponse(content=issues)
 
 @router.get("/{issue_id}")
-def get_issue(*, db: Session = Depends(get_db), issue_id: str, current_user: dict = Depends(get_current_user)):
-    """Get a specific issue by ID."""
+def get_issue(*, db: Session = Depends(get_db), issue_id: str, request: Request, response: Response, current_user: dict = Depends(get_current_user)):
+    """Get a specific issue by ID. Answers 304 when If-None-Match matches the current ETag."""
+    etag = make_etag(issues_crud.get_issue_version(db=db, issue_id=issue_id))
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
     issue = issues_crud.get_issue(db=db, issue_id=issue_id)
     if not issue:
         raise HTTPException(status_code=404, detail="Issue not found")
+    set_etag(response, etag)
     return issue
 
 @router.patch("/{issue_id}")
@@ -4,10 +4,12 @@ from sqlalchemy.orm import Session
 from typing import Optional
 
 from app.db.session import get_db
+from app.api.dependencies import get_current_user
 from app.crud import magic_link as crud_magic_link
 from app.crud import user as user_crud
 from app.schemas.magic_link import MagicLinkCreate, MagicLinkResponse, MagicLinkSend
 from app.services.email_service import email_service
+from app.services.token_sweeper import token_sweeper
 from app.core.config import settings
 from app.core.security import create_access_token
 from app.schemas.auth import UserAuth
@@ -257,3 +259,15 @@ def cleanup_expired_magic_links(
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Cleanup failed: {str(e)}")
+
+
+@router.get("/auth/magic/cleanup/metrics")
+def get_token_sweeper_metrics(current_user: dict = Depends(get_current_user)):
+    """
+    Rows removed by this worker's background sweeper of expired magic links and invitations. Auth required.
+    """
+    return {
+        "interval_seconds": token_sweeper.interval,
+        "batch_size": token_sweeper.batch_size,
+        "tables": token_sweeper.metrics()
+    }
@@ -8,7 +8,7 @@ from app.db.session import SessionLocal
 from app.db.session import get_db
 from app.api.dependencies import get_current_user
 from fastapi import Header
-from app.crud import user as user_crud
+from app.services.principal_cache import get_cached_user
 
 router = APIRouter(
     tags=["milestones"]
@@ -21,7 +21,7 @@ def list_milestones(project_id: str,
                     authorization: str = Header(...)
                     ):
     """Get all milestones for a project"""
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     return crud_milestone.get_project_milestones(db=db, project_id=project_id)
@@ -35,7 +35,7 @@ def create_milestone(
     authorization: str = Header(...)
 ):
     """Create a new milestone for a project"""
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     return crud_milestone.create_milestone(db=db, project_id=project_id, milestone=milestone)
@@ -49,7 +49,7 @@ async def update_milestone(
     authorization: str = Header(...)
 ):
     """Update a milestone"""
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     db_milestone = crud_milestone.update_milestone(db=db, milestone_id=milestone_id, milestone=milestone)
@@ -64,7 +64,7 @@ def get_milestone(milestone_id: str,
                   authorization: str = Header(...)
                   ):
     """Get a specific milestone by ID"""
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     db_milestone = crud_milestone.get_milestone(db, milestone_id=milestone_id)
@@ -7,7 +7,7 @@ from app.schemas.project_interactions import (
     ProjectReactionCreate
 )
 from app.crud import project_interactions as crud
-from app.crud import user as user_crud
+from app.services.principal_cache import get_cached_user
 from fastapi import HTTPException, Header   
 from app.api.dependencies import get_current_user, get_current_user_with_workspace
 
@@ -22,7 +22,7 @@ def create_project_comment(
     current_user: dict = Depends(get_current_user),
     authorization: str = Header(...)
 ):
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     crud.create_project_comment(
@@ -52,7 +52,7 @@ def react_to_project_update(
     current_user: dict = Depends(get_current_user),
     authorization: str = Header(...)
 ):
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     crud.add_project_reaction(
@@ -73,7 +73,7 @@ def update_project_comment(
     current_user: dict = Depends(get_current_user),
     authorization: str = Header(...)
 ):
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     crud.update_project_comment(db=db, comment_id=comment_id, comment=comment)
@@ -88,7 +88,7 @@ def delete_project_comment(
     current_user: dict = Depends(get_current_user),
     authorization: str = Header(...)
 ):
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     crud.delete_project_comment(db=db, comment_id=comment_id)
@@ -104,7 +104,7 @@ def update_project_reaction_endpoint(
     current_user: dict = Depends(get_current_user),
     authorization: str = Header(...)
 ):
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     return crud.update_project_reaction(db=db, reaction_id=reaction_id, reaction=reaction)
@@ -118,7 +118,7 @@ def delete_project_reaction_endpoint(
     current_user: dict = Depends(get_current_user),
     authorization: str = Header(...)
 ):
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     return crud.delete_project_reaction(db=db, reaction_id=reaction_id)
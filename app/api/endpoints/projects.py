@@ -1,11 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, Header
+from fastapi import APIRouter, Depends, HTTPException, Query, Header, Request, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.schemas.project import Project, ProjectCreate, ProjectUpdate, ProjectResponse
 from app.crud import project as crud_project
+from app.utils.etag import make_etag, etag_matches, not_modified, set_etag
 from app.db.session import get_db
 from app.api.dependencies import get_current_user
-from app.crud import user as user_crud
+from app.services.principal_cache import get_cached_user
 router = APIRouter()
 
 @router.post("/projects", response_model=ProjectResponse)
@@ -16,7 +17,7 @@ def create_project(
     authorization: str = Header(...)
 ):
     """Only authenticated users can create projects"""
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     return crud_project.create_project(db=db, project=project)
@@ -26,7 +27,7 @@ def update_project(project_id: str, project: ProjectUpdate,
                    db: Session = Depends(get_db),
                    current_user: dict = Depends(get_current_user),
                    authorization: str = Header(...)):
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     return crud_project.update_project(db=db, project_id=project_id, project=project)
@@ -42,22 +43,29 @@ def list_projects(
     authorization: str = Header(...)
 ):
     """Get all projects, optionally filtered by user IDs and team IDs."""
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     return crud_project.get_projects(db=db, dris=dris, teams=teams, status=status, workspace_id=workspace_id)
 
 @router.get("/projects/{project_id}", response_model=ProjectResponse)
 def get_project(project_id: str,
+                request: Request,
+                response: Response,
                 db: Session = Depends(get_db),
                 current_user: dict = Depends(get_current_user),
                 authorization: str = Header(...)
                 ):
-    """Get a specific project by ID"""
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    """Get a specific project by ID. Answers 304 when If-None-Match matches the current ETag."""
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
-    return crud_project.get_project(db, project_id=project_id)
+    etag = make_etag(crud_project.get_project_version(db, project_id=project_id))
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    project = crud_project.get_project(db, project_id=project_id)
+    set_etag(response, etag)
+    return project
 
 @router.get("/initiatives/{initiative_id}/projects", response_model=List[ProjectResponse])
 def get_initiative_projects(initiative_id: str, 
@@ -65,7 +73,7 @@ def get_initiative_projects(initiative_id: str,
                             current_user: dict = Depends(get_current_user),
                             authorization: str = Header(...)):
     """Get all projects for a specific initiative"""
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     return crud_project.get_initiative_projects(db, initiative_id=initiative_id)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 from app.db.session import get_db
 from app.schemas.teams import (
@@ -13,8 +13,9 @@ from app.schemas.teams import (
     TeamCreateWithSettings,
 )
 from app.crud import teams as crud
+from app.utils.etag import make_etag, etag_matches, not_modified, set_etag
 from app.api.dependencies import get_current_user
-from app.crud import user as user_crud
+from app.services.principal_cache import get_cached_user
 
 router = APIRouter()
 
@@ -24,7 +25,7 @@ def create_team_api(
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     if not team.workspace_id:
@@ -55,7 +56,7 @@ def create_team_with_settings_api(
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     if not payload.workspace_id:
@@ -69,7 +70,7 @@ def add_team_members_api(
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     return crud.add_team_members(db=db, team_id=team_id, members=members)
@@ -81,7 +82,7 @@ def remove_team_members_api(
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     return crud.remove_team_members(db=db, team_id=team_id, members=members)
@@ -92,7 +93,7 @@ def list_teams_api(
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     return crud.get_all_teams(db=db, member_id=user.user_id, workspace_id=workspace_id)
@@ -103,7 +104,7 @@ def get_team_members_api(
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     return crud.get_team_members(db=db, team_id=team_id)
@@ -111,13 +112,20 @@ def get_team_members_api(
 @router.get("/teams/{team_id}", response_model=TeamResponse)
 def get_team_details_api(
     team_id: str,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
-    return crud.get_team_details(db=db, team_id=team_id)
+    etag = make_etag(crud.get_team_version(db=db, team_id=team_id))
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    team = crud.get_team_details(db=db, team_id=team_id)
+    set_etag(response, etag)
+    return team
 
 @router.patch("/teams", response_model=TeamResponse)
 def update_team_api(
@@ -125,7 +133,7 @@ def update_team_api(
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     return crud.update_team(db=db, payload=payload)
@@ -133,13 +141,22 @@ def update_team_api(
 @router.get("/teams/{team_id}/settings", response_model=TeamSettingsResponse)
 def get_team_settings_api(
     team_id: str,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
-    return crud.get_team_settings(db=db, team_id=team_id)
+    version = crud.get_team_version(db=db, team_id=team_id)
+    # Settings and details share the team version, so tag the representation as well
+    etag = make_etag(("settings",) + version if version else None)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    team_settings = crud.get_team_settings(db=db, team_id=team_id)
+    set_etag(response, etag)
+    return team_settings
 
 @router.patch("/teams/{team_id}/settings", response_model=TeamSettingsResponse)
 def update_team_settings_api(
@@ -148,7 +165,7 @@ def update_team_settings_api(
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     payload.team_id = team_id
@@ -37,9 +37,12 @@ def list_tenants_api(db: Session = Depends(get_db)):
     return crud.get_all_tenants(db=db)
 
 @router.get("/tenants/{tenant_id}/channels/refresh")
-async def refresh_channels(tenant_id: str, db: Session = Depends(get_db), 
-                           authorization: str = Header(...)):
-    """API endpoint to fetch all channels for a specific tenant."""
+def refresh_channels(tenant_id: str, db: Session = Depends(get_db), 
+                     authorization: str = Header(...)):
+    """API endpoint to fetch all channels for a specific tenant.
+
+    Sync on purpose: paging through Slack blocks, including Retry-After waits, so it runs in the threadpool.
+    """
     try:
         slack_service = SlackService(db=db)
         print(f"Refreshing channels for tenant {tenant_id}")
@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, Header
+from fastapi import APIRouter, Depends, HTTPException, Header, Query
 from sqlalchemy.orm import Session
-from typing import List
-from app.schemas.updates import UpdateCreate, ProjectUpdateResponse, InitiativeUpdateResponse
+from typing import Optional
+from app.schemas.updates import (
+    UpdateCreate, ProjectUpdateResponse, InitiativeUpdateResponse, ProjectUpdatePage, InitiativeUpdatePage
+)
 from app.schemas.project import ProjectUpdate as UpdateProjectRequest
 from app.schemas.initiative import InitiativeUpdate as UpdateInitiativeRequest
 from app.crud import updates as crud_updates
@@ -9,7 +11,7 @@ from app.crud import initiative as crud_initiative
 from app.crud import project as crud_project
 from app.db.session import get_db
 from app.api.dependencies import get_current_user
-from app.crud import user as user_crud
+from app.services.principal_cache import get_cached_user
 from app.services.slack_service import SlackService
 from app.core.config import settings
 
@@ -24,7 +26,7 @@ async def create_project_update(
     authorization: str = Header(...),
 ):
     """Create a project update. Auth required."""
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     
@@ -59,31 +61,40 @@ async def create_project_update(
             }
         }
 
-        for channel in update.channels_to_post:
-            try:
-                response = await slack_service.post_message_to_channel(
-                    update.tenant_id, 
-                    channel, 
-                    enhanced_message_data
-                )
-            except Exception as e:
-                slack_errors.append(f"Failed to post to channel {channel}: {str(e)}")
-                continue
+        try:
+            project_update.slack_results = await slack_service.post_message_to_channels(
+                update.tenant_id,
+                update.channels_to_post,
+                enhanced_message_data
+            )
+        except Exception as e:
+            slack_errors.append(f"Failed to post to Slack: {str(e)}")
+        else:
+            slack_errors.extend(
+                f"Failed to post to channel {channel}: {result['error']}"
+                for channel, result in project_update.slack_results.items() if not result["ok"]
+            )
         if slack_errors:
             print(f"Some Slack messages failed to post: {', '.join(slack_errors)}")
     
     return project_update
 
-@router.get("/projects/{project_id}/updates", response_model=List[ProjectUpdateResponse])
-def list_project_updates(project_id: str, 
+@router.get("/projects/{project_id}/updates", response_model=ProjectUpdatePage)
+def list_project_updates(project_id: str,
+                         cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+                         limit: int = Query(crud_updates.DEFAULT_UPDATE_PAGE_SIZE, ge=1, le=100, description="Page size"),
+                         summary: bool = Query(False, description="Return a plain-text preview instead of the full content"),
                          db: Session = Depends(get_db),
                          current_user: dict = Depends(get_current_user),
                          authorization: str = Header(...)):
-    """List project updates. Auth required."""
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    """List project updates, newest first. Auth required."""
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
-    return crud_updates.get_project_updates(db=db, project_id=project_id)
+    updates, next_cursor = crud_updates.get_project_updates(
+        db=db, project_id=project_id, cursor=cursor, limit=limit, summary=summary
+    )
+    return ProjectUpdatePage(updates=updates, next_cursor=next_cursor)
 
 @router.post("/initiatives/{initiative_id}/updates", response_model=InitiativeUpdateResponse)
 async def create_initiative_update(
@@ -94,7 +105,7 @@ async def create_initiative_update(
     authorization: str = Header(...),
 ):
     """Create an initiative update. Auth required."""
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     
@@ -130,28 +141,38 @@ async def create_initiative_update(
             }
         }
 
-        for channel in update.channels_to_post:
-            try:
-                response = await slack_service.post_message_to_channel(
-                    update.tenant_id, 
-                    channel, 
-                    enhanced_message_data
-                )
-            except Exception as e:
-                slack_errors.append(f"Failed to post to channel {channel}: {str(e)}")
-                continue
+        try:
+            initiative_update.slack_results = await slack_service.post_message_to_channels(
+                update.tenant_id,
+                update.channels_to_post,
+                enhanced_message_data
+            )
+        except Exception as e:
+            slack_errors.append(f"Failed to post to Slack: {str(e)}")
+        else:
+            slack_errors.extend(
+                f"Failed to post to channel {channel}: {result['error']}"
+                for channel, result in initiative_update.slack_results.items() if not result["ok"]
+            )
         if slack_errors:
             print(f"Some Slack messages failed to post: {', '.join(slack_errors)}")
     
     return initiative_update
 
-@router.get("/initiatives/{initiative_id}/updates", response_model=List[InitiativeUpdateResponse])
-def list_initiative_updates(initiative_id: str, 
+@router.get("/initiatives/{initiative_id}/updates", response_model=InitiativeUpdatePage)
+def list_initiative_updates(initiative_id: str,
+                            cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+                            limit: int = Query(crud_updates.DEFAULT_UPDATE_PAGE_SIZE, ge=1, le=100, description="Page size"),
+                            summary: bool = Query(False, description="Return a plain-text preview instead of the full content"),
                             db: Session = Depends(get_db),
                             current_user: dict = Depends(get_current_user),
                             authorization: str = Header(...)):
-    """List initiative updates. Auth required."""
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    """List initiative updates, newest first. Auth required."""
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
-    return crud_updates.get_initiative_updates(db=db, initiative_id=initiative_id) 
+    updates, next_cursor = crud_updates.get_initiative_updates(
+        db=db, initiative_id=initiative_id, cursor=cursor, limit=limit, summary=summary
+    )
+    return InitiativeUpdatePage(updates=updates, next_cursor=next_cursor)
+
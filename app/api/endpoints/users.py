@@ -18,6 +18,8 @@ from jose import jwe
 from app.auth.token_decoder import AuthJSDecoder
 from app.api.dependencies import get_current_user, get_current_user_with_workspace
 from app.models.workspace import WorkspaceMember
+from app.crud import email_digest as email_digest_crud
+from app.services.principal_cache import get_cached_user
 
 router = APIRouter()
 
@@ -42,6 +44,28 @@ async def get_all_users_api(
     )
 
 
+@router.put("/users/me/email-digest")
+def subscribe_email_digest(db: Session = Depends(get_db),
+                           current_user: dict = Depends(get_current_user)):
+    """Subscribe the current user to the daily email digest of changes in their projects and issues."""
+    user = get_cached_user(db, current_user["email"])
+    if not user:
+        raise HTTPException(status_code=401, detail="User not authenticated, please login")
+    email_digest_crud.subscribe(db, user.user_id)
+    return {"subscribed": True}
+
+
+@router.delete("/users/me/email-digest")
+def unsubscribe_email_digest(db: Session = Depends(get_db),
+                             current_user: dict = Depends(get_current_user)):
+    """Stop the daily email digest for the current user."""
+    user = get_cached_user(db, current_user["email"])
+    if not user:
+        raise HTTPException(status_code=401, detail="User not authenticated, please login")
+    email_digest_crud.unsubscribe(db, user.user_id)
+    return {"subscribed": False}
+
+
 @router.get("/users/{user_id}", response_model=UserResponse)
 def get_user_api(user_id: str, db: Session = Depends(get_db), 
                  authorization: str = Header(...),
@@ -1,14 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, Header
+import asyncio
+import json
+from fastapi import APIRouter, Depends, HTTPException, Query, Header, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from app.db.session import get_db
 from app.api.dependencies import get_current_user
-from app.crud import user as user_crud
+from app.services.principal_cache import get_cached_user
 from app.crud import workspace as crud_workspace
 from app.schemas.workspace import WorkspaceCreate, WorkspaceResponse, WorkspaceUpdate, WorkspaceMemberRoleUpdate, WorkspaceMemberRoleResponse, WorkspaceMemberDetailsResponse
 from app.schemas.teams import TeamResponse
 from app.crud import teams as crud_teams
+from app.crud import dashboard as crud_dashboard
+from app.schemas.dashboard import WorkspaceDashboardResponse, DASHBOARD_FIELDS, DEFAULT_DASHBOARD_FIELDS
+from app.crud import feed as crud_feed
+from app.schemas.feed import WorkspaceFeedResponse, FEED_ITEM_TYPES
+from app.services.change_stream import change_hub
+
+# Comment lines sent on idle streams so proxies do not close them
+SSE_KEEPALIVE_SECONDS = 15
 
 router = APIRouter()
 
@@ -22,7 +33,7 @@ def create_workspace_endpoint(
     authorization: str = Header(...),
 ):
     """Create a workspace for a given tenant. Auth required."""
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     return crud_workspace.create_workspace(
@@ -41,7 +52,7 @@ def get_workspace_endpoint(
     authorization: str = Header(...),
 ):
     """Get a workspace by ID. Auth required."""
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     ws = crud_workspace.get_workspace_by_id(db, workspace_id)
@@ -67,7 +78,7 @@ def list_workspaces_endpoint(
     authorization: str = Header(...),
 ):
     """List only teams you belong to in the given workspace. Auth required."""
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     effective_member_id = member_id if member_id else user.user_id
@@ -83,7 +94,7 @@ def update_member_role_endpoint(
     authorization: str = Header(...),
 ):
     """Creator/Admin can update a member's role to Admin/Member."""
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     ws = crud_workspace.get_workspace_by_id(db, workspace_id)
@@ -107,7 +118,7 @@ def list_member_roles_endpoint(
     authorization: str = Header(...),
 ):
     """List all workspace members with their user details (name, email) and roles. Auth required."""
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     ws = crud_workspace.get_workspace_by_id(db, workspace_id)
@@ -134,7 +145,7 @@ def list_workspace_members(
 
     Requires requester to be the creator or an Admin member of the workspace.
     """
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
 
@@ -161,7 +172,7 @@ def update_workspace_endpoint(
     authorization: str = Header(...),
 ):
     """Update workspace name/description. Auth required."""
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     ws = crud_workspace.get_workspace_by_id(db, payload.workspace_id)
@@ -172,3 +183,110 @@ def update_workspace_endpoint(
     return crud_workspace.update_workspace(db, payload)
 
 
+@router.get(
+    "/workspaces/{workspace_id}/dashboard",
+    response_model=WorkspaceDashboardResponse,
+    response_model_exclude_unset=True,
+)
+def get_workspace_dashboard_endpoint(
+    workspace_id: str,
+    fields: Optional[str] = Query(None, description="Comma-separated initiative/project fields to return, e.g. 'title,status,health'"),
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+    authorization: str = Header(...),
+):
+    """Initiatives with their projects, health and latest updates in one call. Workspace members only."""
+    user = get_cached_user(db, current_user["email"])
+    if not user:
+        raise HTTPException(status_code=401, detail="User not authenticated, please login")
+    ws = crud_workspace.get_workspace_by_id(db, workspace_id)
+    if not ws:
+        raise HTTPException(status_code=404, detail="Workspace not found")
+    if ws.created_by != user.user_id and not crud_workspace.get_workspace_member_by_user_id(db, workspace_id, user.user_id):
+        raise HTTPException(status_code=403, detail="Not a member of this workspace")
+
+    if fields:
+        requested = {field.strip() for field in fields.split(",") if field.strip()}
+        unknown = requested - DASHBOARD_FIELDS
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown dashboard fields: {', '.join(sorted(unknown))}")
+    else:
+        requested = DEFAULT_DASHBOARD_FIELDS
+    return crud_dashboard.get_workspace_dashboard(db, workspace_id, requested)
+
+
+@router.get("/workspaces/{workspace_id}/feed", response_model=WorkspaceFeedResponse)
+def get_workspace_feed_endpoint(
+    workspace_id: str,
+    types: Optional[str] = Query(None, description="Comma-separated item types, e.g. 'project_update,issue_comment'"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(crud_feed.DEFAULT_FEED_PAGE_SIZE, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+    authorization: str = Header(...),
+):
+    """Updates and comments across the workspace, newest first. Workspace members only."""
+    user = get_cached_user(db, current_user["email"])
+    if not user:
+        raise HTTPException(status_code=401, detail="User not authenticated, please login")
+    ws = crud_workspace.get_workspace_by_id(db, workspace_id)
+    if not ws:
+        raise HTTPException(status_code=404, detail="Workspace not found")
+    if ws.created_by != user.user_id and not crud_workspace.get_workspace_member_by_user_id(db, workspace_id, user.user_id):
+        raise HTTPException(status_code=403, detail="Not a member of this workspace")
+
+    if types:
+        requested = {item_type.strip() for item_type in types.split(",") if item_type.strip()}
+        unknown = requested - FEED_ITEM_TYPES
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown feed item types: {', '.join(sorted(unknown))}")
+    else:
+        requested = FEED_ITEM_TYPES
+    return crud_feed.get_workspace_feed(db, workspace_id, requested, cursor=cursor, limit=limit)
+
+
+def _authorize_event_stream(
+    workspace_id: str,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+) -> None:
+    """Membership check for the event stream; a sync dependency, so its queries run in the threadpool."""
+    user = get_cached_user(db, current_user["email"])
+    if not user:
+        raise HTTPException(status_code=401, detail="User not authenticated, please login")
+    ws = crud_workspace.get_workspace_by_id(db, workspace_id)
+    if not ws:
+        raise HTTPException(status_code=404, detail="Workspace not found")
+    if ws.created_by != user.user_id and not crud_workspace.get_workspace_member_by_user_id(db, workspace_id, user.user_id):
+        raise HTTPException(status_code=403, detail="Not a member of this workspace")
+    # The stream outlives the request's DB work; don't hold a pooled connection for it
+    db.close()
+
+
+@router.get("/workspaces/{workspace_id}/events", dependencies=[Depends(_authorize_event_stream)])
+async def stream_workspace_events_endpoint(workspace_id: str, request: Request):
+    """Server-sent events for issue, cycle and update changes in a workspace. Workspace members only.
+
+    Each event carries the entity, action and id; clients refetch what they display. A `resync`
+    event means events were dropped and the client should reload its view.
+    """
+    subscriber = await change_hub.subscribe(workspace_id)
+
+    async def event_stream():
+        try:
+            yield "retry: 5000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(subscriber.queue.get(), timeout=SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield f"event: {event['type']}\ndata: {json.dumps(event, separators=(',', ':'))}\n\n"
+        finally:
+            change_hub.unsubscribe(subscriber)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -6,7 +6,7 @@ from typing import List, Optional
 
 from app.db.session import get_db
 from app.api.dependencies import get_current_user
-from app.crud import user as user_crud
+from app.services.principal_cache import get_cached_user
 from app.crud import workspace_invitation as crud_invitation
 from app.schemas.workspace_invitation import (
     WorkspaceInvitationCreate, 
@@ -14,7 +14,10 @@ from app.schemas.workspace_invitation import (
     WorkspaceInvitationAccept, 
     WorkspaceInvitationListResponse,
     MagicLinkResponse,
-    WorkspaceInvitationLinkResponse
+    WorkspaceInvitationLinkResponse,
+    WorkspaceInvitationBulkCreate,
+    WorkspaceInvitationBulkResult,
+    WorkspaceInvitationBulkResponse
 )
 from app.services.email_service import email_service
 from app.core.config import settings
@@ -22,6 +25,60 @@ from app.core.config import settings
 router = APIRouter()
 
 
+def _invite_magic_link(
+    workspace_id: str,
+    invitation_id: str,
+    magic_token: str,
+    role: str,
+    redirect_base_url: Optional[str],
+    redirect_path: Optional[str],
+    cookie_domain: Optional[str],
+    next_path: Optional[str],
+    proxy_prefix: Optional[str],
+) -> str:
+    """Build the invitation magic link to the backend verify endpoint; include FE redirect and cookie domain."""
+    frontend_base = (redirect_base_url or settings.FRONTEND_URL).rstrip('/')
+    path = redirect_path or "/dashboard"
+    backend_base = settings.BACKEND_URL.rstrip('/')
+
+    # If testing locally or a proxy prefix is provided, build link to FE origin + proxy
+    use_frontend_proxy = False
+    if redirect_base_url:
+        lower_base = redirect_base_url.lower()
+        if "localhost" in lower_base or "127.0.0.1" in lower_base:
+            use_frontend_proxy = True
+    if cookie_domain and cookie_domain.lower() in ("localhost", "127.0.0.1"):
+        use_frontend_proxy = True
+    if proxy_prefix:
+        use_frontend_proxy = True
+
+    if use_frontend_proxy:
+        prefix = proxy_prefix or "/api/v1"
+        return (
+            f"{frontend_base}{prefix}/auth/verify-magic-link?token={magic_token}"
+            f"&redirect_base_url={frontend_base}"
+            f"&redirect_path={path}"
+            f"&next_path={next_path}"
+            f"{f'&cookie_domain={cookie_domain}' if cookie_domain else ''}"
+            f"&invite_id={invitation_id}"
+            f"&workspace_id={workspace_id}"
+            f"&role_to_assign={role}"
+            f"&action=accept_invite"
+        )
+    else:
+        return (
+            f"{backend_base}/auth/verify-magic-link?token={magic_token}"
+            f"&redirect_base_url={frontend_base}"
+            f"&redirect_path={path}"
+            f"&next_path={next_path}"
+            f"{f'&cookie_domain={cookie_domain}' if cookie_domain else ''}"
+            f"&invite_id={invitation_id}"
+            f"&workspace_id={workspace_id}"
+            f"&role_to_assign={role}"
+            f"&action=accept_invite"
+        )
+
+
 @router.post("/workspaces/{workspace_id}/invite", response_model=WorkspaceInvitationResponse)
 def send_workspace_invitation(
     workspace_id: str,
@@ -37,7 +94,7 @@ def send_workspace_invitation(
     request: Request = None,
 ):
     """Send a workspace invitation via email with magic link. Auth required."""
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     from app.crud import workspace as crud_workspace
@@ -58,47 +115,13 @@ def send_workspace_invitation(
         invited_by=user.user_id
     )
 
-    # Build magic link to backend verify endpoint; include FE redirect and cookie domain
-    frontend_base = (redirect_base_url or settings.FRONTEND_URL).rstrip('/')
-    path = redirect_path or "/dashboard"
-    backend_base = settings.BACKEND_URL.rstrip('/')
-
-    # If testing locally or a proxy prefix is provided, build link to FE origin + proxy
-    use_frontend_proxy = False
-    if redirect_base_url:
-        lower_base = redirect_base_url.lower()
-        if "localhost" in lower_base or "127.0.0.1" in lower_base:
-            use_frontend_proxy = True
-    if cookie_domain and cookie_domain.lower() in ("localhost", "127.0.0.1"):
-        use_frontend_proxy = True
-    if proxy_prefix:
-        use_frontend_proxy = True
-
-    if use_frontend_proxy:
-        prefix = proxy_prefix or "/api/v1"
-        magic_link = (
-            f"{frontend_base}{prefix}/auth/verify-magic-link?token={invitation_result['magic_token']}"
-            f"&redirect_base_url={frontend_base}"
-            f"&redirect_path={path}"
-            f"&next_path={next_path}"
-            f"{f'&cookie_domain={cookie_domain}' if cookie_domain else ''}"
-            f"&invite_id={invitation_result['invitation'].invitation_id}"
-            f"&workspace_id={workspace_id}"
-            f"&role_to_assign={invitation_data.role}"
-            f"&action=accept_invite"
-        )
-    else:
-        magic_link = (
-            f"{backend_base}/auth/verify-magic-link?token={invitation_result['magic_token']}"
-            f"&redirect_base_url={frontend_base}"
-            f"&redirect_path={path}"
-            f"&next_path={next_path}"
-            f"{f'&cookie_domain={cookie_domain}' if cookie_domain else ''}"
-            f"&invite_id={invitation_result['invitation'].invitation_id}"
-            f"&workspace_id={workspace_id}"
-            f"&role_to_assign={invitation_data.role}"
-            f"&action=accept_invite"
-        )
+    magic_link = _invite_magic_link(
+        workspace_id,
+        invitation_result['invitation'].invitation_id,
+        invitation_result['magic_token'],
+        invitation_data.role,
+        redirect_base_url, redirect_path, cookie_domain, next_path, proxy_prefix
+    )
     email_service.send_workspace_invitation_email(
         to_email=invitation_data.email,
         workspace_name=db_workspace.name,
@@ -110,6 +133,80 @@ def send_workspace_invitation(
     return invitation_result['invitation']
 
 
+@router.post("/workspaces/{workspace_id}/invitations/bulk", response_model=WorkspaceInvitationBulkResponse)
+def send_workspace_invitations_bulk(
+    workspace_id: str,
+    bulk_data: WorkspaceInvitationBulkCreate,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+    authorization: str = Header(...),
+    redirect_base_url: Optional[str] = Query(None, description="Override the frontend base URL for magic link (e.g., http://localhost:3000)"),
+    redirect_path: Optional[str] = Query("/auth-callback", description="Path on the frontend to open after clicking the invite"),
+    cookie_domain: Optional[str] = Query(None, description="Frontend host for cookie domain (e.g., app.example.com)"),
+    next_path: Optional[str] = Query("/dashboard", description="Target route after FE callback (e.g., /dashboard)"),
+    proxy_prefix: Optional[str] = Query(None, description="Optional proxy prefix when FE forwards to BE (e.g., /api/v1)"),
+):
+    """Invite many people at once. Existing members and repeated addresses are skipped, emails go out
+    concurrently, and the status of every address is returned. Auth required."""
+    user = get_cached_user(db, current_user["email"])
+    if not user:
+        raise HTTPException(status_code=401, detail="User not authenticated, please login")
+    from app.crud import workspace as crud_workspace
+    db_workspace = crud_workspace.get_workspace_by_id(db, workspace_id)
+    if not db_workspace:
+        raise HTTPException(status_code=404, detail="Workspace not found")
+    is_creator = (db_workspace.created_by == user.user_id)
+    current_user_member = crud_workspace.get_workspace_member_by_user_id(db, workspace_id, user.user_id)
+    is_admin = (current_user_member and current_user_member.role == "Admin")
+    if not (is_creator or is_admin):
+        raise HTTPException(status_code=403, detail="Not authorized to send invitations to this workspace")
+
+    results = crud_invitation.create_workspace_invitations_bulk(
+        db=db,
+        workspace_id=workspace_id,
+        invitations=bulk_data.invitations,
+        invited_by=user.user_id
+    )
+
+    created = [result for result in results if result["status"] == "created"]
+    sent = email_service.send_workspace_invitation_emails([
+        {
+            "to_email": result["email"],
+            "workspace_name": db_workspace.name,
+            "inviter_name": user.name,
+            "magic_link": _invite_magic_link(
+                workspace_id,
+                result["invitation"].invitation_id,
+                result["magic_token"],
+                result["invitation"].role,
+                redirect_base_url, redirect_path, cookie_domain, next_path, proxy_prefix
+            ),
+            "role": result["invitation"].role,
+        }
+        for result in created
+    ])
+
+    statuses = []
+    for result in results:
+        invitation = result.get("invitation")
+        if invitation is None:
+            statuses.append(WorkspaceInvitationBulkResult(email=result["email"], status=result["status"]))
+            continue
+        statuses.append(WorkspaceInvitationBulkResult(
+            email=result["email"],
+            status="sent" if sent.get(result["email"]) else "email_failed",
+            invitation_id=invitation.invitation_id,
+            expires_at=invitation.expires_at
+        ))
+
+    return WorkspaceInvitationBulkResponse(
+        workspace_id=workspace_id,
+        results=statuses,
+        invited_count=len(created),
+        skipped_count=len(results) - len(created)
+    )
+
+
 @router.post("/workspaces/{workspace_id}/invite-link", response_model=WorkspaceInvitationLinkResponse)
 def generate_workspace_invite_link(
     workspace_id: str,
@@ -125,7 +222,7 @@ def generate_workspace_invite_link(
     request: Request = None,
 ):
     """Generate a workspace invitation link without sending email. Auth required."""
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     from app.crud import workspace as crud_workspace
@@ -146,47 +243,13 @@ def generate_workspace_invite_link(
         invited_by=user.user_id
     )
 
-    # Build magic link to backend verify endpoint; include FE redirect and cookie domain
-    frontend_base = (redirect_base_url or settings.FRONTEND_URL).rstrip('/')
-    path = redirect_path or "/dashboard"
-    backend_base = settings.BACKEND_URL.rstrip('/')
-
-    # If testing locally or a proxy prefix is provided, build link to FE origin + proxy
-    use_frontend_proxy = False
-    if redirect_base_url:
-        lower_base = redirect_base_url.lower()
-        if "localhost" in lower_base or "127.0.0.1" in lower_base:
-            use_frontend_proxy = True
-    if cookie_domain and cookie_domain.lower() in ("localhost", "127.0.0.1"):
-        use_frontend_proxy = True
-    if proxy_prefix:
-        use_frontend_proxy = True
-
-    if use_frontend_proxy:
-        prefix = proxy_prefix or "/api/v1"
-        magic_link = (
-            f"{frontend_base}{prefix}/auth/verify-magic-link?token={invitation_result['magic_token']}"
-            f"&redirect_base_url={frontend_base}"
-            f"&redirect_path={path}"
-            f"&next_path={next_path}"
-            f"{f'&cookie_domain={cookie_domain}' if cookie_domain else ''}"
-            f"&invite_id={invitation_result['invitation'].invitation_id}"
-            f"&workspace_id={workspace_id}"
-            f"&role_to_assign={invitation_data.role}"
-            f"&action=accept_invite"
-        )
-    else:
-        magic_link = (
-            f"{backend_base}/auth/verify-magic-link?token={invitation_result['magic_token']}"
-            f"&redirect_base_url={frontend_base}"
-            f"&redirect_path={path}"
-            f"&next_path={next_path}"
-            f"{f'&cookie_domain={cookie_domain}' if cookie_domain else ''}"
-            f"&invite_id={invitation_result['invitation'].invitation_id}"
-            f"&workspace_id={workspace_id}"
-            f"&role_to_assign={invitation_data.role}"
-            f"&action=accept_invite"
-        )
+    magic_link = _invite_magic_link(
+        workspace_id,
+        invitation_result['invitation'].invitation_id,
+        invitation_result['magic_token'],
+        invitation_data.role,
+        redirect_base_url, redirect_path, cookie_domain, next_path, proxy_prefix
+    )
 
     return WorkspaceInvitationLinkResponse(
         invitation_id=invitation_result['invitation'].invitation_id,
@@ -207,7 +270,7 @@ def list_workspace_invitations(
     authorization: str = Header(...),
 ):
     """List all pending invitations for a workspace. Only creator/admins can view."""
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     return crud_invitation.list_workspace_invitations(
@@ -225,7 +288,7 @@ def cancel_workspace_invitation(
     authorization: str = Header(...),
 ):
     """Cancel a workspace invitation. Only creator/admins can cancel."""
-    user = user_crud.get_user_by_email(db, current_user["email"])
+    user = get_cached_user(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated, please login")
     return crud_invitation.cancel_workspace_invitation(
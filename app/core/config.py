@@ -26,6 +26,8 @@ class Settings(BaseSettings):
     SMTP_USERNAME: str = ""
     SMTP_PASSWORD: str = ""
     FROM_EMAIL: str = "noreply@synchroneai.com"
+    # When set, the email digest job writes .eml files here instead of sending them
+    EMAIL_DIGEST_DRY_RUN_DIR: str = ""
 
     # Frontend URL (default redirect target for magic links)
     FRONTEND_URL: str = "http://localhost:3000"
@@ -33,6 +35,15 @@ class Settings(BaseSettings):
     # Backend URL (for magic link generation)
     BACKEND_URL: str = "http://13.60.203.173:8000/api"
 
+    # Key for encrypting tenants' Slack bot tokens (generate with app/test_scripts/generate_fernet_key.py)
+    FERNET_KEY: str = ""
+
+    # Archived issues older than this move from issues to the issues_archive tier
+    ISSUE_ARCHIVE_AFTER_DAYS: int = 90
+
+    # Slack Web API base (overridable to point channel sync at a local fake server)
+    SLACK_API_URL: str = "https://slack.com/api/"
+
     class Config:
         env_file = ".env"
 
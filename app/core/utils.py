@@ -1,22 +1,72 @@
-import random
+import os
+import secrets
 import string
+import threading
+import time
 from sqlalchemy import text
 import re
 from datetime import datetime
 from typing import Optional, Union
 
+# Crockford base32: no I, L, O or U, and sorts the same as the numbers it encodes
+_ULID_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_ULID_RANDOM_BITS = 80
+_ulid_lock = threading.Lock()
+_ulid_last_ms = -1
+_ulid_last_random = 0
+_ulid_pid = os.getpid()
+
 def get_team_initials(team_name: str) -> str:
     """Extract the first three characters of the team name."""
     return team_name[:3].upper()
 
-def generate_id(name: str) -> str:
-    """Generate a URL-friendly ID from a name."""
+def generate_ulid() -> str:
+    """26-character ULID: 48-bit millisecond timestamp then 80 random bits from `secrets`.
+
+    IDs sort by creation time, so primary key inserts append to the right edge of the B-tree
+    instead of splitting random pages. Within one millisecond the random part is incremented,
+    keeping IDs from the same process strictly increasing.
+    """
+    global _ulid_last_ms, _ulid_last_random, _ulid_pid
+    now_ms = time.time_ns() // 1_000_000
+    with _ulid_lock:
+        if _ulid_pid != os.getpid():  # forked worker: never continue the parent's sequence
+            _ulid_pid, _ulid_last_ms = os.getpid(), -1
+        if now_ms <= _ulid_last_ms:
+            now_ms = _ulid_last_ms
+            randomness = _ulid_last_random + 1
+            if randomness >> _ULID_RANDOM_BITS:  # 2^80 IDs in one millisecond: borrow the next one
+                now_ms, randomness = now_ms + 1, secrets.randbits(_ULID_RANDOM_BITS)
+        else:
+            randomness = secrets.randbits(_ULID_RANDOM_BITS)
+        _ulid_last_ms, _ulid_last_random = now_ms, randomness
+    value = (now_ms << _ULID_RANDOM_BITS) | randomness
+    return "".join(_ULID_ALPHABET[(value >> shift) & 31] for shift in range(125, -1, -5))
+
+def ulid_timestamp(ulid: str) -> Optional[datetime]:
+    """Creation time encoded in the first 10 characters of a ULID, bare or inside a dash-separated ID.
+
+    None for IDs generated before ULIDs (random suffixes carry no time).
+    """
+    for part in ulid.split("-"):
+        if len(part) == 26 and all(char in _ULID_ALPHABET for char in part):
+            value = 0
+            for char in part[:10]:
+                value = value * 32 + _ULID_ALPHABET.index(char)
+            return datetime.fromtimestamp(value / 1000)
+    return None
+
+def generate_id(prefix: str, name: str = "") -> str:
+    """Generate a URL-friendly, time-ordered ID: `<prefix>-<ULID>`, then the name's initials if any.
+
+    The prefix is constant per table, so IDs sort by creation time whatever the name is and
+    inserts keep appending to the end of the primary key index.
+    """
     cleaned_name = re.sub(r'[^a-zA-Z0-9\s]', '', name)
     words = cleaned_name.split()
     initials = ''.join(word[:3].upper() for word in words)
     initials = initials[:6]
-    alphanumeric = ''.join(random.choices(string.ascii_uppercase + string.digits, k=10))
-    return f"{initials}-{alphanumeric}"
+    return f"{prefix}-{generate_ulid()}-{initials}" if initials else f"{prefix}-{generate_ulid()}"
 
 def utc_timestamp_sql() -> text:
     """Generate SQL expression for UTC Unix timestamp."""
@@ -40,7 +90,7 @@ def datetime_to_unix(dt: Optional[Union[int, datetime]]) -> Optional[int]:
 
 def generate_alphanumeric_id(length=10):
     """Generate a random alphanumeric string."""
-    return ''.join(random.choices(string.ascii_uppercase + string.digits, k=length))
+    return ''.join(secrets.choice(string.ascii_uppercase + string.digits) for _ in range(length))
 
 def generate_display_id(team_name: str, sequence_number: int) -> str:
     """Generate a display ID for an issue."""
@@ -30,4 +30,15 @@ def get_channel_by_id(db: Session, channel_id: str) -> ChannelResponse:
 def get_channels_by_workspace_id(db: Session, workspace_id: str) -> List[ChannelResponse]:
     """Fetch all channels for a specific workspace."""
     channels = db.query(Channel).filter(Channel.workspace_id == workspace_id).all()
-    return [ChannelResponse(**channel.__dict__) for channel in channels]
\ No newline at end of file
+    return [ChannelResponse(**channel.__dict__) for channel in channels]
+
+def set_channel_digest(db: Session, channel_id: str, enabled: bool, window_minutes: int) -> ChannelResponse:
+    """Switch a channel between immediate posts and scheduled digests."""
+    channel = db.query(Channel).filter(Channel.channel_id == channel_id).first()
+    if not channel:
+        return None
+    channel.digest_enabled = enabled
+    channel.digest_window_minutes = window_minutes
+    db.commit()
+    db.refresh(channel)
+    return ChannelResponse(**channel.__dict__)
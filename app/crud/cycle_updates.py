@@ -3,15 +3,12 @@ from sqlalchemy.orm import Session
 from fastapi import HTTPException
 
 from app.models.cycle_update import CycleUpdate
-from app.models.user import User as UserModel
+from app.services.change_stream import emit_change, cycle_workspace_id
+from app.crud.loaders import user_loader
 
 
 def _user_min(db: Session, user_id: Optional[str]) -> Optional[Dict[str, Any]]:
-    if not user_id:
-        return None
-    row = db.query(
-        UserModel.user_id, UserModel.name, UserModel.email, UserModel.picture
-    ).filter(UserModel.user_id == user_id).first()
+    row = user_loader(db).get(user_id)
     if not row:
         return None
     return {
@@ -37,7 +34,7 @@ def _to_dict(db: Session, cu: CycleUpdate) -> Dict[str, Any]:
 def create_cycle_update(db: Session, cycle_id: str, update_data: Dict[str, Any]) -> Dict[str, Any]:
     created_by = update_data.get("created_by")
     # Validate user exists (minimal lookup)
-    if not db.query(UserModel.user_id).filter(UserModel.user_id == created_by).first():
+    if not user_loader(db).get(created_by):
         raise HTTPException(status_code=404, detail="User not found")
 
     cu = CycleUpdate(
@@ -47,6 +44,7 @@ def create_cycle_update(db: Session, cycle_id: str, update_data: Dict[str, Any])
         updated_by=created_by,
     )
     db.add(cu)
+    emit_change(db, cycle_workspace_id(db, cycle_id), "cycle_update", "created", cu.id, cycle_id=cycle_id)
     db.commit()
     db.refresh(cu)
     return _to_dict(db, cu)
@@ -61,6 +59,7 @@ def get_cycle_updates(db: Session, cycle_id: str, skip: int = 0, limit: int = 10
         .limit(limit)
         .all()
     )
+    user_loader(db).prime(user_id for r in rows for user_id in (r.created_by, r.updated_by))
     return [_to_dict(db, r) for r in rows]
 
 
@@ -81,6 +80,7 @@ def update_cycle_update(db: Session, update_id: str, update_data: Dict[str, Any]
     if "updated_by" in update_data and update_data["updated_by"]:
         cu.updated_by = update_data["updated_by"]
 
+    emit_change(db, cycle_workspace_id(db, cu.cycle_id), "cycle_update", "updated", cu.id, cycle_id=cu.cycle_id)
     db.commit()
     db.refresh(cu)
     return _to_dict(db, cu)
@@ -92,6 +92,7 @@ def delete_cycle_update(db: Session, cycle_id: str, update_id: str) -> bool:
     ).first()
     if not cu:
         raise HTTPException(status_code=404, detail="Cycle update not found")
+    emit_change(db, cycle_workspace_id(db, cycle_id), "cycle_update", "deleted", update_id, cycle_id=cycle_id)
     db.delete(cu)
     db.commit()
     return True
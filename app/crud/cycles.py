@@ -7,18 +7,15 @@ from sqlalchemy.orm import Session
 from app.models.cycle import Cycle as CycleModel, TeamCycleSequence
 from app.models.issue import Issue as IssueModel
 from app.models.teams import Team as TeamModel
-from app.models.user import User as UserModel
 from app.schemas.cycles import CycleCreate, CycleUpdate, CycleStatus, StartCycleRequest, CompleteCycleRequest
 from app.dto.dtos import CycleDTO, TeamDTO, UserDTO, IssueDTO
 from app.core.utils import generate_display_id
+from app.services.change_stream import emit_change, team_workspace_id
+from app.crud.loaders import user_loader, team_loader
 
 
 def _to_user_dto_min(db: Session, user_id: Optional[str]) -> Optional[UserDTO]:
-    if not user_id:
-        return None
-    row = db.query(
-        UserModel.user_id, UserModel.name, UserModel.email, UserModel.picture
-    ).filter(UserModel.user_id == user_id).first()
+    row = user_loader(db).get(user_id)
     if not row:
         return None
     return UserDTO(user_id=row.user_id, name=row.name, email=row.email, picture=row.picture)
@@ -27,6 +24,7 @@ def _to_user_dto_min(db: Session, user_id: Optional[str]) -> Optional[UserDTO]:
 def _to_issue_dto_list(db: Session, issues: List[IssueModel]) -> Optional[List[IssueDTO]]:
     if not issues:
         return None
+    user_loader(db).prime(issue.assignee for issue in issues)
     result: List[IssueDTO] = []
     for issue in issues:
         assignee = _to_user_dto_min(db, issue.assignee)
@@ -49,7 +47,7 @@ def _to_issue_dto_list(db: Session, issues: List[IssueModel]) -> Optional[List[I
 def _to_cycle_dto(db: Session, cycle: CycleModel, include_issues: bool = False) -> CycleDTO:
     created_by = _to_user_dto_min(db, cycle.created_by)
     updated_by = _to_user_dto_min(db, cycle.updated_by) if cycle.updated_by else None
-    team = db.query(TeamModel).filter(TeamModel.team_id == cycle.team_id).first() if cycle.team_id else None
+    team = team_loader(db).get(cycle.team_id)
 
     return CycleDTO(
         id=cycle.id,
@@ -101,6 +99,7 @@ def create_cycle(db: Session, cycle_data: dict) -> CycleDTO:
             db_cycle.display_id = generate_display_id(team.name, seq)
 
     db.add(db_cycle)
+    emit_change(db, team.workspace_id if team else None, "cycle", "created", db_cycle.id, team_id=db_cycle.team_id)
     db.commit()
     db.refresh(db_cycle)
     return _to_cycle_dto(db, db_cycle)
@@ -120,6 +119,8 @@ def get_cycles(db: Session, team_id: Optional[str] = None, status: Optional[str]
     if status:
         query = query.filter(CycleModel.status == status)
     rows = query.order_by(CycleModel.created_at.desc()).all()
+    user_loader(db).prime(user_id for c in rows for user_id in (c.created_by, c.updated_by))
+    team_loader(db).prime(c.team_id for c in rows)
     return [_to_cycle_dto(db, c) for c in rows]
 
 
@@ -142,6 +143,7 @@ def update_cycle(db: Session, cycle_id: str, cycle_data: dict) -> CycleDTO:
     if update.updated_by is not None:
         db_cycle.updated_by = update.updated_by
 
+    emit_change(db, team_workspace_id(db, db_cycle.team_id), "cycle", "updated", cycle_id, team_id=db_cycle.team_id)
     db.commit()
     db.refresh(db_cycle)
     return _to_cycle_dto(db, db_cycle)
@@ -151,6 +153,7 @@ def delete_cycle(db: Session, cycle_id: str) -> None:
     db_cycle = db.query(CycleModel).filter(CycleModel.id == cycle_id).first()
     if not db_cycle:
         raise HTTPException(status_code=404, detail="Cycle not found")
+    emit_change(db, team_workspace_id(db, db_cycle.team_id), "cycle", "deleted", cycle_id, team_id=db_cycle.team_id)
     db.delete(db_cycle)
     db.commit()
 
@@ -163,6 +166,7 @@ def start_cycle(db: Session, cycle_id: str, payload: StartCycleRequest) -> Cycle
     db_cycle.updated_by = payload.started_by
     db_cycle.started_by = payload.started_by
     db_cycle.started_at = datetime.utcnow()
+    emit_change(db, team_workspace_id(db, db_cycle.team_id), "cycle", "started", cycle_id, team_id=db_cycle.team_id)
     db.commit()
     db.refresh(db_cycle)
     return _to_cycle_dto(db, db_cycle)
@@ -191,6 +195,7 @@ def complete_cycle(db: Session, cycle_id: str, payload: CompleteCycleRequest) ->
                 issue.cycle_id = payload.new_cycle_id
                 issue.updated_by = payload.completed_by
 
+    emit_change(db, team_workspace_id(db, db_cycle.team_id), "cycle", "completed", cycle_id, team_id=db_cycle.team_id)
     db.commit()
     db.refresh(db_cycle)
     return _to_cycle_dto(db, db_cycle)
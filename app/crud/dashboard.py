@@ -0,0 +1,141 @@
+from sqlalchemy.orm import Session, joinedload, selectinload
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Set
+from app.models.initiative import Initiative
+from app.models.project import Project, Milestone
+from app.models.updates import ProjectUpdate, InitiativeUpdate
+from app.dto.dtos import TeamDTO, ProjectUpdateDTO, InitiativeUpdateDTO
+from app.schemas.dashboard import DashboardInitiative, DashboardProject, WorkspaceDashboardResponse
+from app.crud.health import build_initiative_health_summary, build_project_health_summary
+from app.crud.loaders import user_dto
+
+
+def get_workspace_dashboard(db: Session, workspace_id: str, fields: Set[str]) -> WorkspaceDashboardResponse:
+    """Assemble initiatives, their projects, health and latest updates for a workspace.
+
+    Runs a fixed number of set-based queries regardless of how many initiatives or projects
+    the workspace holds. Only the requested fields are populated, and the milestone and update
+    queries are skipped entirely when `health` / `latest_update` are not part of the mask.
+    """
+    initiatives = db.query(Initiative)\
+        .options(joinedload(Initiative.owner), selectinload(Initiative.teams))\
+        .filter(Initiative.workspace_id == workspace_id)\
+        .order_by(Initiative.end_date.asc(), Initiative.last_updated.desc())\
+        .all()
+
+    projects = db.query(Project)\
+        .options(joinedload(Project.dri), selectinload(Project.teams))\
+        .filter(Project.workspace_id == workspace_id)\
+        .order_by(Project.end_date.asc(), Project.last_updated.desc())\
+        .all()
+
+    milestone_statuses: Dict[str, List[Optional[str]]] = defaultdict(list)
+    if "health" in fields and projects:
+        rows = db.query(Milestone.project_id, Milestone.status)\
+            .join(Project, Project.project_id == Milestone.project_id)\
+            .filter(Project.workspace_id == workspace_id)\
+            .all()
+        for project_id, status in rows:
+            milestone_statuses[project_id].append(status)
+
+    latest_project_updates: Dict[str, ProjectUpdate] = {}
+    latest_initiative_updates: Dict[str, InitiativeUpdate] = {}
+    if "latest_update" in fields:
+        if projects:
+            # DISTINCT ON keeps the first row per project, i.e. the newest update
+            latest_project_updates = {
+                update.project_id: update
+                for update in db.query(ProjectUpdate)
+                .join(Project, Project.project_id == ProjectUpdate.project_id)
+                .filter(Project.workspace_id == workspace_id)
+                .distinct(ProjectUpdate.project_id)
+                .order_by(ProjectUpdate.project_id, ProjectUpdate.created_at.desc())
+                .all()
+            }
+        if initiatives:
+            latest_initiative_updates = {
+                update.initiative_id: update
+                for update in db.query(InitiativeUpdate)
+                .join(Initiative, Initiative.initiative_id == InitiativeUpdate.initiative_id)
+                .filter(Initiative.workspace_id == workspace_id)
+                .distinct(InitiativeUpdate.initiative_id)
+                .order_by(InitiativeUpdate.initiative_id, InitiativeUpdate.created_at.desc())
+                .all()
+            }
+
+    projects_by_initiative: Dict[str, List[Project]] = defaultdict(list)
+    unassigned: List[Project] = []
+    for project in projects:
+        if project.initiative_id:
+            projects_by_initiative[project.initiative_id].append(project)
+        else:
+            unassigned.append(project)
+
+    def project_to_dashboard(project: Project) -> DashboardProject:
+        values = _common_fields(project, fields)
+        if "dri" in fields:
+            values["dri"] = user_dto(project.dri)
+        if "health" in fields:
+            values["health"] = build_project_health_summary(
+                project.project_id, milestone_statuses.get(project.project_id, [])
+            )
+        if "latest_update" in fields:
+            latest = latest_project_updates.get(project.project_id)
+            values["latest_update"] = ProjectUpdateDTO(
+                update_id=latest.update_id,
+                created_at=int(latest.created_at.timestamp()) if latest.created_at else None,
+                content=latest.content,
+                current_status=latest.current_status
+            ) if latest else None
+        return DashboardProject(project_id=project.project_id, initiative_id=project.initiative_id, **values)
+
+    dashboard_initiatives = []
+    for initiative in initiatives:
+        initiative_projects = projects_by_initiative.get(initiative.initiative_id, [])
+        values = _common_fields(initiative, fields)
+        if "owner" in fields:
+            values["owner"] = user_dto(initiative.owner)
+        if "health" in fields:
+            values["health"] = build_initiative_health_summary(
+                initiative.initiative_id, [project.status for project in initiative_projects]
+            )
+        if "latest_update" in fields:
+            latest = latest_initiative_updates.get(initiative.initiative_id)
+            values["latest_update"] = InitiativeUpdateDTO(
+                update_id=latest.update_id,
+                created_at=int(latest.created_at.timestamp()) if latest.created_at else None,
+                content=latest.content,
+                current_status=latest.current_status
+            ) if latest else None
+        dashboard_initiatives.append(DashboardInitiative(
+            initiative_id=initiative.initiative_id,
+            projects=[project_to_dashboard(project) for project in initiative_projects],
+            **values
+        ))
+
+    # Projects pointing at an initiative outside this workspace are still shown, just unattached
+    known_initiative_ids = {initiative.initiative_id for initiative in initiatives}
+    for initiative_id, orphaned in projects_by_initiative.items():
+        if initiative_id not in known_initiative_ids:
+            unassigned.extend(orphaned)
+
+    return WorkspaceDashboardResponse(
+        workspace_id=workspace_id,
+        initiatives=dashboard_initiatives,
+        unassigned_projects=[project_to_dashboard(project) for project in unassigned],
+    )
+
+
+def _common_fields(entity: Any, fields: Set[str]) -> Dict[str, Any]:
+    """Copy the scalar columns shared by initiatives and projects that are part of the mask."""
+    values: Dict[str, Any] = {}
+    for name in ("title", "short_description", "description", "status", "progress", "priority"):
+        if name in fields:
+            values[name] = getattr(entity, name)
+    for name in ("start_date", "end_date", "created_at", "last_updated"):
+        if name in fields:
+            value = getattr(entity, name)
+            values[name] = int(value.timestamp()) if value else None
+    if "teams" in fields:
+        values["teams"] = [TeamDTO(team_id=team.team_id, name=team.name) for team in entity.teams]
+    return values
@@ -1,18 +1,28 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from app.models.dependencies import InitiativeDependency, ProjectDependency, DependencyType
 from app.schemas.dependencies import (
     InitiativeDependencyCreate,
     InitiativeDependencyResponse,
     ProjectDependencyCreate,
-    ProjectDependencyResponse
+    ProjectDependencyResponse,
+    DependencyGraphNode,
+    DependencyClosureResponse,
+    CriticalPathResponse
 )
 from uuid import uuid4
 from app.models.user import User
 from app.dto.dtos import UserDTO, DependencyInitiativeDTO, DependencyProjectDTO
-from typing import List
+from typing import Dict, List, Optional
 from fastapi import HTTPException
 from app.models.initiative import Initiative
 from app.models.project import Project
+from app.services.dependency_graph import (
+    PROJECT_GRAPH,
+    INITIATIVE_GRAPH,
+    get_dependency_graph,
+    invalidate_dependency_graph
+)
+from app.crud.loaders import user_dto, user_loader
 
 def create_initiative_dependency(
     db: Session,
@@ -38,13 +48,17 @@ def create_initiative_dependency(
     
     if existing:
         raise HTTPException(status_code=400, detail="Dependency already exists")
+
+    workspace_id = db.query(Initiative.workspace_id).filter(Initiative.initiative_id == initiative_id).scalar()
+    _reject_cycle(db, INITIATIVE_GRAPH, workspace_id, new_dependency.source_initiative_id, new_dependency.target_initiative_id)
     
     db.add(new_dependency)
     db.commit()
     db.refresh(new_dependency)
+    invalidate_dependency_graph(INITIATIVE_GRAPH, workspace_id)
     
     # Get related data for response
-    created_by_user = db.query(User).filter(User.user_id == new_dependency.created_by).first()
+    created_by_user = user_loader(db).get(new_dependency.created_by)
     initiative = db.query(Initiative).filter(Initiative.initiative_id == dependency.initiative_id).first()
     
     return [InitiativeDependencyResponse(
@@ -90,16 +104,32 @@ def get_initiative_dependencies(
         (InitiativeDependency.source_initiative_id == initiative_id) |
         (InitiativeDependency.target_initiative_id == initiative_id)
     ).all()
+    if not dependencies:
+        return []
+
+    # Resolve every user and related initiative for the whole result set up front
+    users = _load_users(db, [dep.created_by for dep in dependencies] + [dep.updated_by for dep in dependencies])
+    related_ids = {
+        dep.target_initiative_id if dep.source_initiative_id == initiative_id else dep.source_initiative_id
+        for dep in dependencies
+    }
+    related_initiatives = {
+        initiative.initiative_id: initiative
+        for initiative in db.query(Initiative)
+        .options(joinedload(Initiative.owner))
+        .filter(Initiative.initiative_id.in_(related_ids))
+        .all()
+    }
     
     responses = []
     for dep in dependencies:
-        created_by_user = db.query(User).filter(User.user_id == dep.created_by).first()
-        updated_by_user = db.query(User).filter(User.user_id == dep.updated_by).first()
+        created_by_user = users.get(dep.created_by)
+        updated_by_user = users.get(dep.updated_by)
         
         # If current initiative is source, show target initiative and vice versa
         is_current_source = dep.source_initiative_id == initiative_id
         related_initiative_id = dep.target_initiative_id if is_current_source else dep.source_initiative_id
-        related_initiative = db.query(Initiative).filter(Initiative.initiative_id == related_initiative_id).first()
+        related_initiative = related_initiatives[related_initiative_id]
         
         # If we're the target, it means we depend on the source
         displayed_type = DependencyType.DEPENDS_ON if dep.target_initiative_id == initiative_id else DependencyType.DEPENDENCY_OF
@@ -111,31 +141,13 @@ def get_initiative_dependencies(
                 initiative_id=related_initiative.initiative_id,
                 title=related_initiative.title,
                 status=related_initiative.status,
-                owner=UserDTO(
-                    user_id=related_initiative.owner_id,
-                    name=related_initiative.owner.name,
-                    email=related_initiative.owner.email,
-                    role=related_initiative.owner.role,
-                    picture=related_initiative.owner.picture
-                ) if related_initiative.owner else None
+                owner=user_dto(related_initiative.owner)
             ),
             status=dep.status,
             created_at=int(dep.created_at.timestamp()),
             last_updated=int(dep.last_updated.timestamp()),
-            created_by=UserDTO(
-                user_id=created_by_user.user_id,
-                name=created_by_user.name,
-                email=created_by_user.email,
-                role=created_by_user.role,
-                picture=created_by_user.picture
-            ),
-            updated_by=UserDTO(
-                user_id=updated_by_user.user_id,
-                name=updated_by_user.name,
-                email=updated_by_user.email,
-                role=updated_by_user.role,
-                picture=updated_by_user.picture
-            ) if updated_by_user else None,
+            created_by=user_dto(created_by_user),
+            updated_by=user_dto(updated_by_user),
             description=dep.description
         ))
     
@@ -164,12 +176,16 @@ def create_project_dependency(
     
     if existing:
         raise HTTPException(status_code=400, detail="Dependency already exists")
+
+    workspace_id = db.query(Project.workspace_id).filter(Project.project_id == project_id).scalar()
+    _reject_cycle(db, PROJECT_GRAPH, workspace_id, new_dependency.source_project_id, new_dependency.target_project_id)
     
     db.add(new_dependency)
     db.commit()
     db.refresh(new_dependency)
+    invalidate_dependency_graph(PROJECT_GRAPH, workspace_id)
     
-    created_by_user = db.query(User).filter(User.user_id == new_dependency.created_by).first()
+    created_by_user = user_loader(db).get(new_dependency.created_by)
     
     # Use the same logic as get_project_dependencies
     is_current_source = new_dependency.source_project_id == project_id
@@ -218,15 +234,31 @@ def get_project_dependencies(
         (ProjectDependency.source_project_id == project_id) |
         (ProjectDependency.target_project_id == project_id)
     ).all()
+    if not dependencies:
+        return []
+
+    # Resolve every user and related project for the whole result set up front
+    users = _load_users(db, [dep.created_by for dep in dependencies] + [dep.updated_by for dep in dependencies])
+    related_ids = {
+        dep.target_project_id if dep.source_project_id == project_id else dep.source_project_id
+        for dep in dependencies
+    }
+    related_projects = {
+        project.project_id: project
+        for project in db.query(Project)
+        .options(joinedload(Project.dri))
+        .filter(Project.project_id.in_(related_ids))
+        .all()
+    }
     
     responses = []
     for dep in dependencies:
-        created_by_user = db.query(User).filter(User.user_id == dep.created_by).first()
-        updated_by_user = db.query(User).filter(User.user_id == dep.updated_by).first()
+        created_by_user = users.get(dep.created_by)
+        updated_by_user = users.get(dep.updated_by)
         
         # If current project is source, show target project and vice versa
         is_current_source = dep.source_project_id == project_id
-        related_project = dep.target_project if is_current_source else dep.source_project
+        related_project = related_projects[dep.target_project_id if is_current_source else dep.source_project_id]
         # If we're the target, it means we depend on the source
         displayed_type = DependencyType.DEPENDS_ON if dep.target_project_id == project_id else DependencyType.DEPENDENCY_OF
         
@@ -237,32 +269,68 @@ def get_project_dependencies(
                 project_id=related_project.project_id,
                 title=related_project.title,
                 status=related_project.status,
-                dri=UserDTO(
-                    user_id=related_project.dri_id,
-                    name=related_project.dri.name,
-                    email=related_project.dri.email,
-                    role=related_project.dri.role,
-                    picture=related_project.dri.picture
-                ) if related_project.dri else None
+                dri=user_dto(related_project.dri)
             ),
             status=dep.status,
             created_at=int(dep.created_at.timestamp()),
             last_updated=int(dep.last_updated.timestamp()),
-            created_by=UserDTO(
-                user_id=created_by_user.user_id,
-                name=created_by_user.name,
-                email=created_by_user.email,
-                role=created_by_user.role,
-                picture=created_by_user.picture
-            ),
-            updated_by=UserDTO(
-                user_id=updated_by_user.user_id,
-                name=updated_by_user.name,
-                email=updated_by_user.email,
-                role=updated_by_user.role,
-                picture=updated_by_user.picture
-            ) if updated_by_user else None,
+            created_by=user_dto(created_by_user),
+            updated_by=user_dto(updated_by_user),
             description=dep.description
         ))
     
     return responses
+
+
+def _load_users(db: Session, user_ids: List[Optional[str]]) -> Dict[str, User]:
+    """Fetch the given users with a single IN query, keyed by user_id (memoized for the request)."""
+    return user_loader(db).get_many(user_ids)
+
+
+def _reject_cycle(db: Session, kind: str, workspace_id: Optional[str], source_id: str, target_id: str) -> None:
+    """Raise a 400 if adding source -> target would close a dependency cycle."""
+    if workspace_id is None:
+        raise HTTPException(status_code=404, detail=f"{kind.capitalize()} not found")
+    # Always validate against a freshly built graph; the cache may lag writes made by other workers
+    graph = get_dependency_graph(db, kind, workspace_id, fresh=True)
+    cycle = graph.cycle_for_new_edge(source_id, target_id)
+    if cycle:
+        raise HTTPException(status_code=400, detail=f"Dependency would create a cycle: {' -> '.join(cycle)}")
+
+
+def _graph_node_to_dto(graph, node_id: str, depth: Optional[int] = None) -> DependencyGraphNode:
+    node = graph.nodes.get(node_id)
+    return DependencyGraphNode(
+        id=node_id,
+        title=node.title if node else None,
+        status=node.status if node else None,
+        end_date=int(node.end_date.timestamp()) if node and node.end_date else None,
+        depth=depth
+    )
+
+
+def get_dependency_closure(db: Session, kind: str, node_id: str, direction: str) -> DependencyClosureResponse:
+    """All initiatives/projects reachable from node_id in the given direction, nearest first."""
+    model, key = (Project, Project.project_id) if kind == PROJECT_GRAPH else (Initiative, Initiative.initiative_id)
+    workspace_id = db.query(model.workspace_id).filter(key == node_id).scalar()
+    if workspace_id is None:
+        raise HTTPException(status_code=404, detail=f"{kind.capitalize()} not found")
+
+    graph = get_dependency_graph(db, kind, workspace_id)
+    return DependencyClosureResponse(
+        root_id=node_id,
+        direction=direction,
+        nodes=[_graph_node_to_dto(graph, related_id, depth) for related_id, depth in graph.transitive(node_id, direction)]
+    )
+
+
+def get_critical_path(db: Session, kind: str, workspace_id: str, node_id: Optional[str] = None) -> CriticalPathResponse:
+    """Dependency chain that determines the latest finish, optionally ending at node_id."""
+    graph = get_dependency_graph(db, kind, workspace_id)
+    path = graph.critical_path(node_id)
+    end_dates = [graph.nodes[step].end_date for step in path if step in graph.nodes and graph.nodes[step].end_date]
+    return CriticalPathResponse(
+        workspace_id=workspace_id,
+        path=[_graph_node_to_dto(graph, step) for step in path],
+        finish_date=int(max(end_dates).timestamp()) if end_dates else None
+    )
@@ -0,0 +1,157 @@
+from collections import defaultdict
+from typing import Dict, List
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from app.models.email_digest import EmailDigestSubscription
+
+DIGEST_INTERVAL = "1 day"
+
+# Every digest query starts from the same recipients CTE: one row per user with the time their
+# digest starts at (the previous send, or one interval back for a first digest)
+_RECIPIENTS_CTE = (
+    "WITH r AS ("
+    "  SELECT rec.user_id, COALESCE(rec.since, now() - CAST(:interval AS interval)) AS since "
+    "  FROM unnest(CAST(:user_ids AS text[]), CAST(:sinces AS timestamptz[])) AS rec(user_id, since)"
+    ") "
+)
+
+# Users see updates on projects they are DRI of or whose teams they are on, never their own posts
+_PROJECT_UPDATES_SQL = text(_RECIPIENTS_CTE + """
+    , relevant AS (
+        SELECT r.user_id, r.since, p.project_id FROM r JOIN projects p ON p.dri_id = r.user_id
+        UNION
+        SELECT r.user_id, r.since, pt.project_id FROM r
+        JOIN team_members tm ON tm.user_id = r.user_id
+        JOIN project_teams pt ON pt.team_id = tm.team_id
+    )
+    SELECT rel.user_id, p.project_id AS item_id, p.title, pu.current_status AS status,
+           author.name AS author, pu.created_at
+    FROM relevant rel
+    JOIN project_updates pu ON pu.project_id = rel.project_id AND pu.created_at > rel.since
+    JOIN projects p ON p.project_id = rel.project_id
+    JOIN users author ON author.user_id = pu.created_by
+    WHERE pu.created_by <> rel.user_id
+    ORDER BY rel.user_id, pu.created_at
+""")
+
+_INITIATIVE_UPDATES_SQL = text(_RECIPIENTS_CTE + """
+    , relevant AS (
+        SELECT r.user_id, r.since, i.initiative_id FROM r JOIN initiatives i ON i.owner_id = r.user_id
+        UNION
+        SELECT r.user_id, r.since, it.initiative_id FROM r
+        JOIN team_members tm ON tm.user_id = r.user_id
+        JOIN initiative_teams it ON it.team_id = tm.team_id
+    )
+    SELECT rel.user_id, i.initiative_id AS item_id, i.title, iu.current_status AS status,
+           author.name AS author, iu.created_at
+    FROM relevant rel
+    JOIN initiative_updates iu ON iu.initiative_id = rel.initiative_id AND iu.created_at > rel.since
+    JOIN initiatives i ON i.initiative_id = rel.initiative_id
+    JOIN users author ON author.user_id = iu.created_by
+    WHERE iu.created_by <> rel.user_id
+    ORDER BY rel.user_id, iu.created_at
+""")
+
+# Issue changes on issues the user created or is assigned to, one row per activity
+_ISSUE_CHANGES_SQL = text(_RECIPIENTS_CTE + """
+    , relevant AS (
+        SELECT r.user_id, r.since, i.id AS issue_id FROM r JOIN issues i ON i.assignee = r.user_id
+        UNION
+        SELECT r.user_id, r.since, i.id FROM r JOIN issues i ON i.created_by = r.user_id
+    )
+    SELECT rel.user_id, i.display_id AS item_id, i.title, ia.activity_type AS status,
+           actor.name AS author, ia.created_at
+    FROM relevant rel
+    JOIN issue_activities ia ON ia.issue_id = rel.issue_id AND ia.created_at > rel.since
+    JOIN issues i ON i.id = rel.issue_id
+    JOIN users actor ON actor.user_id = ia.user_id
+    WHERE ia.user_id <> rel.user_id
+    ORDER BY rel.user_id, ia.created_at
+""")
+
+DIGEST_SECTIONS = {
+    "project_updates": _PROJECT_UPDATES_SQL,
+    "initiative_updates": _INITIATIVE_UPDATES_SQL,
+    "issue_changes": _ISSUE_CHANGES_SQL,
+}
+
+
+def subscribe(db: Session, user_id: str) -> None:
+    db.execute(insert(EmailDigestSubscription).values(user_id=user_id).on_conflict_do_nothing())
+    db.commit()
+
+
+def unsubscribe(db: Session, user_id: str) -> None:
+    db.query(EmailDigestSubscription).filter(EmailDigestSubscription.user_id == user_id).delete()
+    db.commit()
+
+
+def get_due_recipients(db: Session, claim: bool = True) -> List[dict]:
+    """Subscribers whose last digest is at least an interval old, with name, email and digest start.
+
+    With claim, their last_sent_at moves to now in the same statement (skipping rows another worker
+    holds), so each digest is sent by exactly one worker; each row then also carries that claimed_at
+    for release_recipients. Without it, nothing changes (dry runs).
+    """
+    due = (
+        "SELECT s.user_id, s.last_sent_at AS since FROM email_digest_subscriptions s "
+        "WHERE s.last_sent_at IS NULL OR s.last_sent_at <= now() - CAST(:interval AS interval)"
+    )
+    if claim:
+        sql = (
+            f"WITH due AS ({due} FOR UPDATE SKIP LOCKED), "
+            "claimed AS ("
+            "  UPDATE email_digest_subscriptions s SET last_sent_at = now() FROM due "
+            "  WHERE s.user_id = due.user_id RETURNING s.user_id, due.since, s.last_sent_at AS claimed_at"
+            ") "
+            "SELECT c.user_id, c.since, c.claimed_at, u.name, u.email FROM claimed c JOIN users u ON u.user_id = c.user_id"
+        )
+    else:
+        sql = f"SELECT d.user_id, d.since, u.name, u.email FROM ({due}) d JOIN users u ON u.user_id = d.user_id"
+    rows = db.execute(text(sql), {"interval": DIGEST_INTERVAL}).mappings().all()
+    if claim:
+        db.commit()
+    return [dict(row) for row in rows]
+
+
+def release_recipients(db: Session, recipients: List[dict]) -> None:
+    """Hand claimed recipients whose digest did not go out back to the next run.
+
+    Their last_sent_at returns to the digest start it was claimed with, unless it changed since the claim.
+    """
+    if not recipients:
+        return
+    db.execute(
+        text(
+            "UPDATE email_digest_subscriptions s SET last_sent_at = r.since "
+            "FROM unnest(CAST(:user_ids AS text[]), CAST(:sinces AS timestamptz[]), CAST(:claimed_ats AS timestamptz[])) "
+            "AS r(user_id, since, claimed_at) "
+            "WHERE s.user_id = r.user_id AND s.last_sent_at = r.claimed_at"
+        ),
+        {
+            "user_ids": [recipient["user_id"] for recipient in recipients],
+            "sinces": [recipient["since"] for recipient in recipients],
+            "claimed_ats": [recipient["claimed_at"] for recipient in recipients],
+        },
+    )
+    db.commit()
+
+
+def get_digest_items(db: Session, recipients: List[dict]) -> Dict[str, Dict[str, List[dict]]]:
+    """Everything that changed for every recipient, as {user_id: {section: [rows]}}.
+
+    One query per section covers all recipients at once, however many there are.
+    """
+    items: Dict[str, Dict[str, List[dict]]] = defaultdict(lambda: defaultdict(list))
+    if not recipients:
+        return items
+    params = {
+        "interval": DIGEST_INTERVAL,
+        "user_ids": [recipient["user_id"] for recipient in recipients],
+        "sinces": [recipient["since"] for recipient in recipients],
+    }
+    for section, sql in DIGEST_SECTIONS.items():
+        for row in db.execute(sql, params).mappings():
+            items[row["user_id"]][section].append(dict(row))
+    return items
@@ -0,0 +1,160 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import String, cast, literal, null, select, tuple_, union_all, func
+from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP
+from typing import Optional, Set
+from app.models.project import Project
+from app.models.initiative import Initiative
+from app.models.teams import Team
+from app.models.cycle import Cycle
+from app.models.issue import Issue
+from app.models.updates import ProjectUpdate, InitiativeUpdate
+from app.models.cycle_update import CycleUpdate
+from app.models.project_interactions import ProjectComment
+from app.models.initiative_interactions import InitiativeComment
+from app.models.issue_interactions import IssueComment
+from app.crud.loaders import user_dto, user_loader
+from app.schemas.feed import FeedItem, WorkspaceFeedResponse
+from app.utils.content import content_preview
+from app.utils.pagination import encode_cursor, decode_cursor
+
+DEFAULT_FEED_PAGE_SIZE = 30
+
+
+def get_workspace_feed(
+    db: Session,
+    workspace_id: str,
+    item_types: Set[str],
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_FEED_PAGE_SIZE
+) -> WorkspaceFeedResponse:
+    """Newest-first activity across updates and comments of a workspace.
+
+    All sources are merged by a single UNION ALL query. Every branch is already filtered by
+    workspace and cursor and capped at limit + 1 rows, so the outer sort only sees a few rows
+    per source. Authors are then resolved with one IN query.
+    """
+    position = decode_cursor(cursor)
+    branches = [
+        _feed_branch(select_, id_column, created_at, position, limit)
+        for item_type, (select_, id_column, created_at) in _feed_sources(workspace_id).items()
+        if item_type in item_types
+    ]
+    if not branches:
+        return WorkspaceFeedResponse(workspace_id=workspace_id)
+
+    feed = union_all(*branches).subquery("feed")
+    rows = db.execute(
+        select(feed)
+        .order_by(feed.c.created_at.desc(), feed.c.item_id.desc())
+        .limit(limit + 1)
+    ).all()
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    authors = user_loader(db).get_many(row.created_by for row in rows)
+
+    items = [FeedItem(
+        item_type=row.item_type,
+        item_id=row.item_id,
+        created_at=int(row.created_at.timestamp()) if row.created_at else None,
+        created_by=user_dto(authors.get(row.created_by)),
+        parent_id=row.parent_id,
+        parent_title=row.parent_title,
+        update_id=row.update_id,
+        preview=content_preview(row.content),
+    ) for row in rows]
+
+    last = rows[-1] if rows else None
+    return WorkspaceFeedResponse(
+        workspace_id=workspace_id,
+        items=items,
+        next_cursor=encode_cursor(last.created_at, last.item_id) if has_more and last and last.created_at else None,
+    )
+
+
+def _feed_sources(workspace_id: str):
+    """Per-source select of the common feed columns, keyed by item type, plus its id and created_at columns."""
+    def columns(item_type, id_column, created_at, created_by, parent_id, parent_title, content, update_id=None):
+        return [
+            literal(item_type, String).label("item_type"),
+            id_column.label("item_id"),
+            created_at.label("created_at"),
+            created_by.label("created_by"),
+            parent_id.label("parent_id"),
+            cast(parent_title, String).label("parent_title"),
+            (update_id if update_id is not None else cast(null(), String)).label("update_id"),
+            content.label("content"),
+        ]
+
+    # Update tables store naive timestamps, the issue-tracker tables timezone-aware ones; only the
+    # selected value is cast so the branches union, the keyset below runs on the raw column
+    project_update_at = cast(ProjectUpdate.created_at, TIMESTAMP(timezone=True))
+    initiative_update_at = cast(InitiativeUpdate.created_at, TIMESTAMP(timezone=True))
+
+    return {
+        "project_update": (
+            select(*columns("project_update", ProjectUpdate.update_id, project_update_at, ProjectUpdate.created_by,
+                            Project.project_id, Project.title, ProjectUpdate.content))
+            .join(Project, Project.project_id == ProjectUpdate.project_id)
+            .where(Project.workspace_id == workspace_id),
+            ProjectUpdate.update_id,
+            ProjectUpdate.created_at,
+        ),
+        "initiative_update": (
+            select(*columns("initiative_update", InitiativeUpdate.update_id, initiative_update_at, InitiativeUpdate.created_by,
+                            Initiative.initiative_id, Initiative.title, InitiativeUpdate.content))
+            .join(Initiative, Initiative.initiative_id == InitiativeUpdate.initiative_id)
+            .where(Initiative.workspace_id == workspace_id),
+            InitiativeUpdate.update_id,
+            InitiativeUpdate.created_at,
+        ),
+        "cycle_update": (
+            select(*columns("cycle_update", CycleUpdate.id, CycleUpdate.created_at, CycleUpdate.created_by,
+                            Cycle.id, Cycle.name, CycleUpdate.content))
+            .join(Cycle, Cycle.id == CycleUpdate.cycle_id)
+            .join(Team, Team.team_id == Cycle.team_id)
+            .where(Team.workspace_id == workspace_id),
+            CycleUpdate.id,
+            CycleUpdate.created_at,
+        ),
+        "project_comment": (
+            select(*columns("project_comment", ProjectComment.comment_id, ProjectComment.created_at, ProjectComment.created_by,
+                            Project.project_id, Project.title, func.to_jsonb(ProjectComment.content, type_=JSONB),
+                            update_id=ProjectComment.update_id))
+            .join(ProjectUpdate, ProjectUpdate.update_id == ProjectComment.update_id)
+            .join(Project, Project.project_id == ProjectUpdate.project_id)
+            .where(Project.workspace_id == workspace_id),
+            ProjectComment.comment_id,
+            ProjectComment.created_at,
+        ),
+        "initiative_comment": (
+            select(*columns("initiative_comment", InitiativeComment.comment_id, InitiativeComment.created_at, InitiativeComment.created_by,
+                            Initiative.initiative_id, Initiative.title, func.to_jsonb(InitiativeComment.content, type_=JSONB),
+                            update_id=InitiativeComment.update_id))
+            .join(InitiativeUpdate, InitiativeUpdate.update_id == InitiativeComment.update_id)
+            .join(Initiative, Initiative.initiative_id == InitiativeUpdate.initiative_id)
+            .where(Initiative.workspace_id == workspace_id),
+            InitiativeComment.comment_id,
+            InitiativeComment.created_at,
+        ),
+        "issue_comment": (
+            select(*columns("issue_comment", IssueComment.id, IssueComment.created_at, IssueComment.created_by,
+                            Issue.id, Issue.title, func.to_jsonb(IssueComment.content, type_=JSONB)))
+            .join(Issue, Issue.id == IssueComment.issue_id)
+            .join(Team, Team.team_id == Issue.team_id)
+            .where(Team.workspace_id == workspace_id),
+            IssueComment.id,
+            IssueComment.created_at,
+        ),
+    }
+
+
+def _feed_branch(query, id_column, created_at, position, limit: int):
+    if position:
+        position_at = literal(position[0], TIMESTAMP(timezone=True))
+        if not created_at.type.timezone:
+            # Convert the cursor, not the column, so the (created_at, id) index still serves the range
+            position_at = cast(position_at, TIMESTAMP())
+        query = query.where(tuple_(created_at, id_column) < tuple_(position_at, position[1]))
+    return query.order_by(created_at.desc(), id_column.desc()).limit(limit + 1)
+
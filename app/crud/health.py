@@ -1,7 +1,7 @@
 from sqlalchemy.orm import Session
 from app.models.project import Project, Milestone
 from app.schemas.health import InitiativeHealthSummary, ProjectHealthSummary, StatusDistribution
-from typing import List, Dict
+from typing import List, Dict, Optional
 from app.core.constants import HealthStatus
 
 
@@ -11,58 +11,7 @@ def get_initiative_health_summary(
 ) -> InitiativeHealthSummary:
     # Get all projects under this initiative
     projects = db.query(Project).filter(Project.initiative_id == initiative_id).all()
-
-    if not projects:
-        return InitiativeHealthSummary(
-            initiative_id=initiative_id,
-            total_projects=0,
-            status_distribution=StatusDistribution(
-                on_track=0,
-                at_risk=0,
-                off_track=0,
-                canceled=0,
-                completed=0,
-                backlog=0
-            ),
-            overall_health=HealthStatus.BACKLOG
-        )
-    # Initialize health counts
-    health_counts = {
-        HealthStatus.ON_TRACK: 0,
-        HealthStatus.AT_RISK: 0,
-        HealthStatus.OFF_TRACK: 0,
-        HealthStatus.CANCELED: 0,
-        HealthStatus.COMPLETED: 0,
-        HealthStatus.BACKLOG: 0
-    }
-    
-    # Count projects by status
-    for project in projects:
-        if project.status:
-            try:
-                status = HealthStatus(project.status)
-                health_counts[status] += 1
-            except ValueError:
-                health_counts[HealthStatus.BACKLOG] += 1
-        else:
-            health_counts[HealthStatus.BACKLOG] += 1
-    
-    # Determine overall health based on project health distribution
-    overall_health = determine_overall_health(health_counts)
-    
-    return InitiativeHealthSummary(
-        initiative_id=initiative_id,
-        total_projects=len(projects),
-        status_distribution=StatusDistribution(
-            on_track=health_counts[HealthStatus.ON_TRACK],
-            at_risk=health_counts[HealthStatus.AT_RISK],
-            off_track=health_counts[HealthStatus.OFF_TRACK],
-            canceled=health_counts[HealthStatus.CANCELED],
-            completed=health_counts[HealthStatus.COMPLETED],
-            backlog=health_counts[HealthStatus.BACKLOG]
-        ),
-        overall_health=overall_health
-    )
+    return build_initiative_health_summary(initiative_id, [project.status for project in projects])
 
 def get_project_health_summary(
     db: Session,
@@ -70,57 +19,49 @@ def get_project_health_summary(
 ) -> ProjectHealthSummary:
     # Get project details
     milestones = db.query(Milestone).filter(Milestone.project_id == project_id).all()
+    return build_project_health_summary(project_id, [milestone.status for milestone in milestones])
+
+def build_initiative_health_summary(initiative_id: str, statuses: List[Optional[str]]) -> InitiativeHealthSummary:
+    """Build an initiative health summary from the statuses of its projects."""
+    health_counts = count_health_statuses(statuses)
+    return InitiativeHealthSummary(
+        initiative_id=initiative_id,
+        total_projects=len(statuses),
+        status_distribution=_to_status_distribution(health_counts),
+        overall_health=determine_overall_health(health_counts)
+    )
+
+def build_project_health_summary(project_id: str, statuses: List[Optional[str]]) -> ProjectHealthSummary:
+    """Build a project health summary from the statuses of its milestones."""
+    health_counts = count_health_statuses(statuses)
+    return ProjectHealthSummary(
+        project_id=project_id,
+        total_projects=len(statuses),
+        status_distribution=_to_status_distribution(health_counts),
+        overall_health=determine_overall_health(health_counts)
+    )
 
-    if not milestones:
-        return ProjectHealthSummary(
-            project_id=project_id,
-            total_projects=0,
-            status_distribution=StatusDistribution(
-                on_track=0,
-                at_risk=0,
-                off_track=0,
-                canceled=0,
-                completed=0,
-                backlog=0
-            ),
-            overall_health=HealthStatus.BACKLOG
-        )
-    # Initialize health counts
-    health_counts = {
-        HealthStatus.ON_TRACK: 0,
-        HealthStatus.AT_RISK: 0,
-        HealthStatus.OFF_TRACK: 0,
-        HealthStatus.CANCELED: 0,
-        HealthStatus.COMPLETED: 0,
-        HealthStatus.BACKLOG: 0
-    }
-    
-    # Count projects by status
-    for milestone in milestones:
-        if milestone.status:
+def count_health_statuses(statuses: List[Optional[str]]) -> Dict[HealthStatus, int]:
+    """Count raw status strings by HealthStatus, treating unknown or empty values as backlog."""
+    health_counts = {status: 0 for status in HealthStatus}
+    for raw_status in statuses:
+        if raw_status:
             try:
-                status = HealthStatus(milestone.status)
-                health_counts[status] += 1
+                health_counts[HealthStatus(raw_status)] += 1
             except ValueError:
                 health_counts[HealthStatus.BACKLOG] += 1
         else:
             health_counts[HealthStatus.BACKLOG] += 1
-    
-    # Determine overall health based on project health distribution
-    overall_health = determine_overall_health(health_counts)
-    
-    return ProjectHealthSummary(
-        project_id=project_id,
-        total_projects=len(milestones),
-        status_distribution=StatusDistribution(
-            on_track=health_counts[HealthStatus.ON_TRACK],
-            at_risk=health_counts[HealthStatus.AT_RISK],
-            off_track=health_counts[HealthStatus.OFF_TRACK],
-            canceled=health_counts[HealthStatus.CANCELED],
-            completed=health_counts[HealthStatus.COMPLETED],
-            backlog=health_counts[HealthStatus.BACKLOG]
-        ),
-        overall_health=overall_health
+    return health_counts
+
+def _to_status_distribution(health_counts: Dict[HealthStatus, int]) -> StatusDistribution:
+    return StatusDistribution(
+        on_track=health_counts[HealthStatus.ON_TRACK],
+        at_risk=health_counts[HealthStatus.AT_RISK],
+        off_track=health_counts[HealthStatus.OFF_TRACK],
+        canceled=health_counts[HealthStatus.CANCELED],
+        completed=health_counts[HealthStatus.COMPLETED],
+        backlog=health_counts[HealthStatus.BACKLOG]
     )
 
 def determine_overall_health(health_counts: Dict[HealthStatus, int]) -> HealthStatus:
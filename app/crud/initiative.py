@@ -15,6 +15,46 @@ from app.models.updates import InitiativeUpdate
 from app.dto.dtos import InitiativeUpdateDTO
 from app.crud.health import get_initiative_health_summary
 from app.models.initiative_teams import initiative_teams  # Import the association table
+from app.models.initiative_channels import InitiativeChannel
+from app.models.project import Project
+from app.utils.etag import rows_fingerprint
+from sqlalchemy import func, or_, select
+from app.services.dependency_graph import INITIATIVE_GRAPH, invalidate_dependency_graph
+
+def get_initiative_version(db: Session, initiative_id: str) -> Optional[tuple]:
+    """Change marker for get_initiative computed in one query; None if the initiative does not exist.
+
+    Covers the initiative row plus everything get_initiative embeds: teams, channels, projects
+    (health and contributors), the latest update and the users shown.
+    """
+    teams = select(rows_fingerprint(Team.team_id, Team.name))\
+        .select_from(initiative_teams)\
+        .join(Team, Team.team_id == initiative_teams.c.team_id)\
+        .where(initiative_teams.c.initiative_id == Initiative.initiative_id)\
+        .scalar_subquery()
+    channels = select(rows_fingerprint(Channel.channel_id, Channel.name))\
+        .select_from(InitiativeChannel)\
+        .join(Channel, Channel.channel_id == InitiativeChannel.channel_id)\
+        .where(InitiativeChannel.initiative_id == Initiative.initiative_id)\
+        .scalar_subquery()
+    projects = select(rows_fingerprint(Project.project_id, Project.status, Project.dri_id))\
+        .where(Project.initiative_id == Initiative.initiative_id)\
+        .scalar_subquery()
+    people = select(func.max(User.last_updated))\
+        .where(or_(
+            User.user_id == Initiative.owner_id,
+            User.user_id.in_(select(Project.dri_id).where(Project.initiative_id == Initiative.initiative_id))
+        ))\
+        .scalar_subquery()
+    update_count = select(func.count()).where(InitiativeUpdate.initiative_id == Initiative.initiative_id).scalar_subquery()
+    latest_update_at = select(func.max(InitiativeUpdate.created_at))\
+        .where(InitiativeUpdate.initiative_id == Initiative.initiative_id)\
+        .scalar_subquery()
+
+    row = db.query(Initiative.last_updated, teams, channels, projects, people, update_count, latest_update_at)\
+        .filter(Initiative.initiative_id == initiative_id)\
+        .first()
+    return tuple(row) if row else None
 
 def get_initiative(db: Session, initiative_id: str) -> InitiativeResponse:
     """Fetch a single initiative by ID."""
@@ -265,6 +305,7 @@ def update_initiative(db: Session, initiative_id: str, initiative: InitiativeUpd
     db_initiative = db.query(Initiative).filter(Initiative.initiative_id == initiative_id).first()
     if not db_initiative:
         raise HTTPException(status_code=401, detail="Initiative not found")  # Handle the case where the initiative is not found
+    previous_workspace_id = db_initiative.workspace_id
 
     owner = None
     # Fetch the User instance based on the provided user_id
@@ -310,6 +351,9 @@ def update_initiative(db: Session, initiative_id: str, initiative: InitiativeUpd
 
     db.commit()
     db.refresh(db_initiative)
+    # Graph nodes carry title, status and end date, so any update can change the critical path
+    for workspace_id in {previous_workspace_id, db_initiative.workspace_id}:
+        invalidate_dependency_graph(INITIATIVE_GRAPH, workspace_id)
 
     return InitiativeResponse(
         initiative_id=str(db_initiative.initiative_id),
@@ -3,8 +3,9 @@ from app.models.initiative_interactions import InitiativeComment, InitiativeReac
 from app.schemas.initiative_interactions import InitiativeCommentCreate, InitiativeReactionCreate, InitiativeInteractionResponse, InitiativeCommentResponse, InitiativeReactionResponse
 import uuid
 from fastapi import HTTPException
-from app.models.user import User
-from app.dto.dtos import UserDTO
+from app.dto.dtos import UserDTO, ReactionCountDTO
+from app.crud.reactions import INITIATIVE_REACTIONS, toggle_reaction, remove_reaction, change_reaction_type, get_reaction_counts
+from app.crud.loaders import user_loader
 
 
 def create_initiative_comment(
@@ -19,7 +20,7 @@ def create_initiative_comment(
         created_by=created_by,
         update_id=update_id
     )
-    user = db.query(User).filter(User.user_id == created_by).first()
+    user = user_loader(db).get(created_by)
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
     db.add(db_comment)
@@ -73,7 +74,11 @@ def get_initiative_interactions(db: Session, update_id: str):
         created_at=int(reaction.created_at.timestamp()) if reaction.created_at else None,
         update_id=reaction.update_id
     ) for reaction in reactions] if reactions else []
-    return InitiativeInteractionResponse(comments=comments, reactions=reactions)
+    reaction_counts = [
+        ReactionCountDTO(reaction_type=reaction_type, count=count)
+        for reaction_type, count in get_reaction_counts(db, INITIATIVE_REACTIONS, [update_id]).get(update_id, [])
+    ]
+    return InitiativeInteractionResponse(comments=comments, reactions=reactions, reaction_counts=reaction_counts)
 
 
 def add_initiative_reaction(
@@ -82,29 +87,23 @@ def add_initiative_reaction(
     reacted_by: str,
     reaction: InitiativeReactionCreate
 ):
-    existing_reaction = db.query(InitiativeReaction).filter(
-        InitiativeReaction.update_id == update_id,
-        InitiativeReaction.reacted_by == reacted_by,
-        InitiativeReaction.reaction_type == reaction.reaction_type
-    ).first()
-    
-    if existing_reaction:
-        db.delete(existing_reaction)
-        db.commit()
-        return None  # Remove reaction if it's the same type by the same user
-    
-    new_reaction = InitiativeReaction(
-        reaction_id=str(uuid.uuid4()),
-        update_id=update_id,
-        reacted_by=reacted_by,
-        reaction_type=reaction.reaction_type
-    )
-    user = db.query(User).filter(User.user_id == reacted_by).first()
+    user = user_loader(db).get(reacted_by)
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
-    db.add(new_reaction)
+
+    reaction_id = toggle_reaction(
+        db,
+        INITIATIVE_REACTIONS,
+        target_id=update_id,
+        user_id=reacted_by,
+        reaction_type=reaction.reaction_type,
+        reaction_id=str(uuid.uuid4())
+    )
     db.commit()
-    db.refresh(new_reaction)
+    if reaction_id is None:
+        return None  # Remove reaction if it's the same type by the same user
+
+    new_reaction = db.query(InitiativeReaction).filter(InitiativeReaction.reaction_id == reaction_id).first()
     return InitiativeReactionResponse(
         reaction_id=new_reaction.reaction_id,
         reaction_type=new_reaction.reaction_type,
@@ -167,16 +166,15 @@ def update_initiative_reaction(
     reaction_id: str,
     reaction: InitiativeReactionCreate
 ):
-    db_reaction = db.query(InitiativeReaction).filter(
-        InitiativeReaction.reaction_id == reaction_id
-    ).first()
-    
-    if not db_reaction:
+    current_id = change_reaction_type(db, INITIATIVE_REACTIONS, reaction_id, reaction.reaction_type)
+    if current_id is None:
         raise HTTPException(status_code=401, detail="Reaction not found")
-    
-    db_reaction.reaction_type = reaction.reaction_type
     db.commit()
-    db.refresh(db_reaction)
+
+    # current_id differs from reaction_id when the user already had a reaction of the new type
+    db_reaction = db.query(InitiativeReaction).filter(
+        InitiativeReaction.reaction_id == current_id
+    ).first()
     return InitiativeReactionResponse(
         reaction_id=db_reaction.reaction_id,
         reaction_type=db_reaction.reaction_type,
@@ -193,13 +191,7 @@ def update_initiative_reaction(
 
 
 def delete_initiative_reaction(db: Session, reaction_id: str):
-    db_reaction = db.query(InitiativeReaction).filter(
-        InitiativeReaction.reaction_id == reaction_id
-    ).first()
-    
-    if not db_reaction:
+    if not remove_reaction(db, INITIATIVE_REACTIONS, reaction_id):
         raise HTTPException(status_code=401, detail="Reaction not found")
-    
-    db.delete(db_reaction)
     db.commit()
     return None
\ No newline at end of file
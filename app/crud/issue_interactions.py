@@ -1,71 +1,113 @@
-from sqlalchemy.orm import Session
-from app.models.issue_interactions import IssueComment, CommentReaction
+from sqlalchemy.orm import Session, aliased
+from app.models.issue_interactions import IssueComment, CommentReaction, CommentReactionCount
 from app.schemas.issue_interactions import IssueCommentCreate, IssueInteractionResponse, IssueCommentResponse, CommentReactionSummary
 import uuid
 from fastapi import HTTPException
 from app.models.user import User
 from app.dto.dtos import UserDTO
-from sqlalchemy import func
-
-
-def get_issue_interactions(db: Session, issue_id: str):
-    comments = (
-        db.query(IssueComment)
-          .filter(
-              IssueComment.issue_id == issue_id,
-              IssueComment.parent_comment_id.is_(None)
-          )
-          .order_by(IssueComment.created_at.asc())
-          .all()
+from sqlalchemy import func, select, tuple_
+from typing import Optional
+from app.utils.pagination import encode_cursor, decode_cursor
+from app.crud.reactions import COMMENT_REACTIONS, toggle_reaction, get_reaction_counts, delete_reaction_counts
+from app.crud.loaders import user_loader
+
+DEFAULT_COMMENT_PAGE_SIZE = 50
+
+
+def _comment_thread_query(db: Session, issue_id: str, parent_comment_id: Optional[str]):
+    """Comments of one thread level with author, reaction counts and reply stats in a single statement."""
+    # Stored per-type reaction counts, folded into one JSON array per comment
+    reactions = (
+        select(
+            CommentReactionCount.comment_id,
+            func.json_agg(
+                func.json_build_object(
+                    "reaction_type", CommentReactionCount.reaction_type,
+                    "count", CommentReactionCount.count
+                )
+            ).label("reactions")
+        )
+        .join(IssueComment, IssueComment.id == CommentReactionCount.comment_id)
+        .where(IssueComment.issue_id == issue_id, CommentReactionCount.count > 0)
+        .group_by(CommentReactionCount.comment_id)
+        .subquery()
     )
 
-    enriched = []
-    for c in comments:
-        raw = (
-            db.query(
-                CommentReaction.reaction_type,
-                func.count(CommentReaction.id).label("reactions_count")
-            )
-            .filter_by(comment_id=c.id)
-            .group_by(CommentReaction.reaction_type)
-            .all()
+    reply = aliased(IssueComment)
+    reply_stats = (
+        select(
+            reply.parent_comment_id.label("comment_id"),
+            func.count(reply.id).label("replies_count"),
+            func.max(reply.created_at).label("last_reply_at")
         )
-        reactions = [
-            CommentReactionSummary(reaction_type=r[0], count=r[1])
-            for r in raw
-        ]
-
-        stats = (
-            db.query(
-                func.count(IssueComment.id).label("replies_count"),
-                func.max(IssueComment.created_at).label("last_reply_at")
-            )
-            .filter(IssueComment.parent_comment_id == c.id)
-            .one()
+        .where(reply.issue_id == issue_id, reply.parent_comment_id.isnot(None))
+        .group_by(reply.parent_comment_id)
+        .subquery()
+    )
+
+    query = (
+        db.query(
+            IssueComment,
+            User.name,
+            User.email,
+            User.picture,
+            reactions.c.reactions,
+            reply_stats.c.replies_count,
+            reply_stats.c.last_reply_at
         )
-        replies_count = stats.replies_count or 0
-        last_reply_at = int(stats.last_reply_at.timestamp()) if stats.last_reply_at else None
+        .outerjoin(User, User.user_id == IssueComment.created_by)
+        .outerjoin(reactions, reactions.c.comment_id == IssueComment.id)
+        .outerjoin(reply_stats, reply_stats.c.comment_id == IssueComment.id)
+        .filter(IssueComment.issue_id == issue_id)
+    )
+    if parent_comment_id is None:
+        query = query.filter(IssueComment.parent_comment_id.is_(None))
+    else:
+        query = query.filter(IssueComment.parent_comment_id == parent_comment_id)
+    return query
+
 
-        # Fetch only needed user fields to avoid schema mismatch (no workspace_id)
-        created_user = db.query(User.user_id, User.name, User.email, User.picture).filter(User.user_id == c.created_by).first()
+def _page_comments(query, cursor: Optional[str], limit: int, with_reply_stats: bool) -> IssueInteractionResponse:
+    position = decode_cursor(cursor)
+    if position:
+        query = query.filter(tuple_(IssueComment.created_at, IssueComment.id) > tuple_(*position))
+    rows = query.order_by(IssueComment.created_at.asc(), IssueComment.id.asc()).limit(limit + 1).all()
 
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    enriched = []
+    for c, name, email, picture, reactions, replies_count, last_reply_at in rows:
         enriched.append(IssueCommentResponse(
             id=c.id,
             content=c.content,
             created_by=UserDTO(
-                user_id=created_user.user_id if created_user else c.created_by,
-                name=created_user.name if created_user else None,
-                email=created_user.email if created_user else None,
-                picture=created_user.picture if created_user else None
+                user_id=c.created_by,
+                name=name,
+                email=email,
+                picture=picture
             ),
             created_at=int(c.created_at.timestamp()) if c.created_at else None,
             issue_id=c.issue_id,
-            reactions=reactions,
-            replies_count=replies_count,
-            last_reply_at=last_reply_at
+            reactions=[
+                CommentReactionSummary(reaction_type=r["reaction_type"], count=r["count"])
+                for r in (reactions or [])
+            ],
+            replies_count=(replies_count or 0) if with_reply_stats else None,
+            last_reply_at=int(last_reply_at.timestamp()) if with_reply_stats and last_reply_at else None
         ))
 
-    return IssueInteractionResponse(comments=enriched)
+    last = rows[-1][0] if rows else None
+    return IssueInteractionResponse(
+        comments=enriched,
+        next_cursor=encode_cursor(last.created_at, last.id) if has_more and last else None
+    )
+
+
+def get_issue_interactions(db: Session, issue_id: str, cursor: Optional[str] = None, limit: int = DEFAULT_COMMENT_PAGE_SIZE):
+    """One page of top-level comments, oldest first, with reactions and reply stats."""
+    query = _comment_thread_query(db, issue_id, parent_comment_id=None)
+    return _page_comments(query, cursor, limit, with_reply_stats=True)
 
 
 def toggle_comment_reaction(
@@ -74,36 +116,22 @@ def toggle_comment_reaction(
     reacted_by: str,
     reaction_type: str
 ):
-    existing = db.query(CommentReaction).filter_by(
-        comment_id=comment_id,
-        created_by=reacted_by,
-        reaction_type=reaction_type
-    ).first()
-    if existing:
-        db.delete(existing)
-    else:
-        db.add(CommentReaction(
-            id=str(uuid.uuid4()),
-            comment_id=comment_id,
-            created_by=reacted_by,
-            reaction_type=reaction_type
-        ))
+    toggle_reaction(
+        db,
+        COMMENT_REACTIONS,
+        target_id=comment_id,
+        user_id=reacted_by,
+        reaction_type=reaction_type,
+        reaction_id=str(uuid.uuid4())
+    )
     db.commit()
 
 
 def get_comment_reaction_summary(db: Session, comment_id: str):
-    rows = (
-        db.query(
-            CommentReaction.reaction_type,
-            func.count(CommentReaction.id).label("count")
-        )
-        .filter_by(comment_id=comment_id)
-        .group_by(CommentReaction.reaction_type)
-        .all()
-    )
+    counts = get_reaction_counts(db, COMMENT_REACTIONS, [comment_id])
     return [
-        CommentReactionSummary(reaction_type=r[0], count=r[1])
-        for r in rows
+        CommentReactionSummary(reaction_type=reaction_type, count=count)
+        for reaction_type, count in counts.get(comment_id, [])
     ]
 
 
@@ -114,7 +142,7 @@ def create_issue_comment(
     issue_id: str
 ):
     # user_id column is user_id in syncup-core
-    user = db.query(User.user_id, User.name, User.email, User.picture).filter(User.user_id == created_by).first()
+    user = user_loader(db).get(created_by)
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
 
@@ -147,47 +175,10 @@ def create_issue_comment(
     )
 
 
-def get_replies(db: Session, comment_id: str) -> IssueInteractionResponse:
-    replies = (
-        db.query(IssueComment)
-          .filter(IssueComment.parent_comment_id == comment_id)
-          .order_by(IssueComment.created_at.asc())
-          .all()
-    )
-
-    enriched = []
-    for r in replies:
-        raw = (
-            db.query(
-                CommentReaction.reaction_type,
-                func.count(CommentReaction.id).label("cnt")
-            )
-            .filter_by(comment_id=r.id)
-            .group_by(CommentReaction.reaction_type)
-            .all()
-        )
-        reactions = [
-            CommentReactionSummary(reaction_type=rt, count=cnt)
-            for rt, cnt in raw
-        ]
-
-        reply_user = db.query(User.user_id, User.name, User.email, User.picture).filter(User.user_id == r.created_by).first()
-
-        enriched.append(IssueCommentResponse(
-            id=r.id,
-            content=r.content,
-            created_by=UserDTO(
-                user_id=reply_user.user_id if reply_user else r.created_by,
-                name=reply_user.name if reply_user else None,
-                email=reply_user.email if reply_user else None,
-                picture=reply_user.picture if reply_user else None
-            ),
-            created_at=int(r.created_at.timestamp()) if r.created_at else None,
-            issue_id=r.issue_id,
-            reactions=reactions
-        ))
-
-    return IssueInteractionResponse(comments=enriched)
+def get_replies(db: Session, issue_id: str, comment_id: str, cursor: Optional[str] = None, limit: int = DEFAULT_COMMENT_PAGE_SIZE) -> IssueInteractionResponse:
+    """One page of direct replies to a comment, oldest first."""
+    query = _comment_thread_query(db, issue_id, parent_comment_id=comment_id)
+    return _page_comments(query, cursor, limit, with_reply_stats=False)
 
 
 def update_issue_comment(
@@ -207,7 +198,7 @@ def update_issue_comment(
     db.commit()
     db.refresh(db_comment)
     # Re-fetch minimal fields for the user
-    upd_user = db.query(User.user_id, User.name, User.email, User.picture).filter(User.user_id == db_comment.created_by).first()
+    upd_user = user_loader(db).get(db_comment.created_by)
     return IssueCommentResponse(
         id=db_comment.id,
         content=db_comment.content,
@@ -243,6 +234,7 @@ def delete_issue_comment(db: Session, issue_id: str, comment_id: str):
     db.query(CommentReaction).filter(
         CommentReaction.comment_id == comment_id
     ).delete()
+    delete_reaction_counts(db, COMMENT_REACTIONS, reply_ids + [comment_id])
 
     db.query(IssueComment).filter(
         IssueComment.parent_comment_id == comment_id
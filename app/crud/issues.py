@@ -1,16 +1,27 @@
 from typing import List, Optional
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
-from app.models.issue import Issue as IssueModel, TeamIssueSequence
+from app.models.issue import Issue as IssueModel, IssueArchive, TeamIssueSequence
+from app.models.git_link import GitLink
 from app.models.teams import Team as TeamModel
 from app.models.cycle import Cycle as CycleModel
 from app.models.label import Label, IssueLabel
 from app.models.user import User as UserModel
-from app.dto.dtos import IssueDTO, TeamDTO, LabelDTO, UserDTO
+from app.dto.dtos import IssueDTO
 from app.crud import labels as label_crud
 from app.core.utils import generate_display_id
-from sqlalchemy import func
+from app.services.change_stream import emit_change, team_workspace_id
+from app.utils.etag import rows_fingerprint
+from app.crud.loaders import user_loader, team_loader
+from sqlalchemy import func, literal, select, text, union_all
 from datetime import datetime
+from pydantic import TypeAdapter
+
+# Issues are built as plain dicts and checked against IssueDTO once per response, in a single
+# pydantic-core call, instead of validating a model per nested user, team and label and dumping
+# each again when the response renders (app/test_scripts/benchmark_dto_construction.py)
+_ISSUE = TypeAdapter(IssueDTO)
+_ISSUE_LIST = TypeAdapter(List[IssueDTO])
 
 def get_next_sequence_number(db: Session, team_id: str) -> int:
     """Get the next sequence number for the team."""
@@ -37,7 +48,7 @@ def create_issue(db: Session, issue_data: dict) -> dict:
         issue_data['assignee'] = None
     
     if issue_data.get('team_id'):
-        team = db.query(TeamModel).filter(TeamModel.team_id == issue_data['team_id']).first()
+        team = team_loader(db).get(issue_data['team_id'])
         if not team:
             raise HTTPException(status_code=404, detail="Team not found")
         if not display_id:
@@ -70,59 +81,77 @@ def create_issue(db: Session, issue_data: dict) -> dict:
     if issue_data.get('labels'):
         for label_name in issue_data['labels']:
             label_dto = label_crud.add_label_to_issue(db, db_issue.id, label_name, issue_data['created_by'])
-            labels.append(label_dto)
+            labels.append(label_dto.model_dump())
     
+    emit_change(db, team.workspace_id if team else None, "issue", "created", db_issue.id, team_id=db_issue.team_id)
     db.commit()
     db.refresh(db_issue)
     
-    # Query only the needed columns to avoid schema mismatch
-    assignee_user = None
-    if db_issue.assignee:
-        assignee_user = db.query(
-            UserModel.user_id, UserModel.name, UserModel.email, UserModel.picture
-        ).filter(UserModel.user_id == db_issue.assignee).first()
-    
-    created_by_user = db.query(
-        UserModel.user_id, UserModel.name, UserModel.email, UserModel.picture
-    ).filter(UserModel.user_id == db_issue.created_by).first()
+    users = user_loader(db)
+    assignee_user = users.get(db_issue.assignee)
+    created_by_user = users.get(db_issue.created_by)
     
-    return issue_to_dto(db_issue, assignee_user, created_by_user, team, labels)
+    return _checked(issue_to_dto(db_issue, assignee_user, created_by_user, team, labels))
 
 def get_issue(db: Session, issue_id: str, include_archived: bool = False) -> Optional[dict]:
     """Get a specific issue by ID."""
     query = db.query(IssueModel).filter(IssueModel.id == issue_id)
     if not include_archived:
-        query = query.filter(IssueModel.is_archived != "true")
+        query = query.filter(~IssueModel.is_archived)
     
     db_issue = query.first()
     if not db_issue:
-        return None
-    
-    team = db.query(TeamModel).filter(TeamModel.team_id == db_issue.team_id).first() if db_issue.team_id else None
+        # Issues archived long enough ago live in the archive tier
+        return _get_archived_issue(db, issue_id) if include_archived else None
     
-    # Query only the needed columns to avoid schema mismatch
-    assignee_user = None
-    if db_issue.assignee:
-        assignee_user = db.query(
-            UserModel.user_id, UserModel.name, UserModel.email, UserModel.picture
-        ).filter(UserModel.user_id == db_issue.assignee).first()
+    team = team_loader(db).get(db_issue.team_id)
     
-    created_by_user = db.query(
-        UserModel.user_id, UserModel.name, UserModel.email, UserModel.picture
-    ).filter(UserModel.user_id == db_issue.created_by).first()
-    
-    updated_by_user = None
-    if db_issue.updated_by:
-        updated_by_user = db.query(
-            UserModel.user_id, UserModel.name, UserModel.email, UserModel.picture
-        ).filter(UserModel.user_id == db_issue.updated_by).first()
+    users = user_loader(db)
+    users.prime([db_issue.assignee, db_issue.created_by, db_issue.updated_by])
+    assignee_user = users.get(db_issue.assignee)
+    created_by_user = users.get(db_issue.created_by)
+    updated_by_user = users.get(db_issue.updated_by)
     
     labels = []
     labels_query = db.query(Label, IssueLabel).join(IssueLabel).filter(IssueLabel.issue_id == issue_id)
     for label, issue_label in labels_query.all():
-        labels.append(LabelDTO(id=label.id, name=label.name, color=label.color, description=label.description))
+        labels.append(_label_dict(label))
     
-    return issue_to_dto(db_issue, assignee_user, created_by_user, team, labels, updated_by_user)
+    return _checked(issue_to_dto(db_issue, assignee_user, created_by_user, team, labels, updated_by_user))
+
+def get_issue_version(db: Session, issue_id: str, include_archived: bool = False) -> Optional[tuple]:
+    """Change marker for get_issue computed in one query; None if the issue would not be returned."""
+    labels = select(rows_fingerprint(Label.id, Label.name, Label.color, Label.description))\
+        .select_from(IssueLabel)\
+        .join(Label, Label.id == IssueLabel.label_id)\
+        .where(IssueLabel.issue_id == IssueModel.id)\
+        .scalar_subquery()
+    people = select(func.max(UserModel.last_updated))\
+        .where(UserModel.user_id.in_([IssueModel.assignee, IssueModel.created_by, IssueModel.updated_by]))\
+        .scalar_subquery()
+    team_name = select(TeamModel.name).where(TeamModel.team_id == IssueModel.team_id).scalar_subquery()
+
+    query = db.query(IssueModel.updated_at, IssueModel.is_archived, labels, people, team_name)\
+        .filter(IssueModel.id == issue_id)
+    if not include_archived:
+        query = query.filter(~IssueModel.is_archived)
+    row = query.first()
+    return tuple(row) if row else None
+
+def _issue_filters(model, team_id, statuses, assignee, priority, cycle_id) -> list:
+    """list_issues filters, for either issues or issues_archive."""
+    filters = []
+    if team_id:
+        filters.append(model.team_id == team_id)
+    if statuses:
+        filters.append(model.status.in_(statuses))
+    if assignee:
+        filters.append(model.assignee == assignee)
+    if priority:
+        filters.append(model.priority == priority)
+    if cycle_id:
+        filters.append(model.cycle_id == cycle_id)
+    return filters
 
 def list_issues(
     db: Session,
@@ -135,47 +164,72 @@ def list_issues(
     cycle_id: Optional[str] = None,
     include_archived: bool = False
 ) -> List[dict]:
-    """List all issues with pagination."""
-    query = db.query(IssueModel)
-    
-    if not include_archived:
-        query = query.filter(IssueModel.is_archived != "true")
-    if team_id:
-        query = query.filter(IssueModel.team_id == team_id)
-    if statuses:
-        query = query.filter(IssueModel.status.in_(statuses))
-    if assignee:
-        query = query.filter(IssueModel.assignee == assignee)
-    if priority:
-        query = query.filter(IssueModel.priority == priority)
-    if cycle_id:
-        query = query.filter(IssueModel.cycle_id == cycle_id)
-    
-    issues = query.order_by(IssueModel.created_at.desc()).offset(offset).limit(limit).all()
+    """List all issues with pagination.
+
+    With include_archived, issues the archiver already moved to issues_archive are listed too,
+    paged together with the ones still in issues.
+    """
+    filters = _issue_filters(IssueModel, team_id, statuses, assignee, priority, cycle_id)
+    if include_archived:
+        issues = _page_with_archive(db, offset, limit, filters, _issue_filters(IssueArchive, team_id, statuses, assignee, priority, cycle_id))
+    else:
+        issues = db.query(IssueModel).filter(~IssueModel.is_archived, *filters)\
+            .order_by(IssueModel.created_at.desc()).offset(offset).limit(limit).all()
+    # One IN query each for every user and team on the page
+    user_loader(db).prime(user_id for issue in issues for user_id in (issue.assignee, issue.created_by))
+    team_loader(db).prime(issue.team_id for issue in issues)
+    archived_labels = _archived_labels(db, [issue for issue in issues if isinstance(issue, IssueArchive)])
     
     results = []
     for issue in issues:
-        # Query team separately
-        team = db.query(TeamModel).filter(TeamModel.team_id == issue.team_id).first() if issue.team_id else None
-        
-        assignee_user = None
-        if issue.assignee:
-            assignee_user = db.query(
-                UserModel.user_id, UserModel.name, UserModel.email, UserModel.picture
-            ).filter(UserModel.user_id == issue.assignee).first()
+        team = team_loader(db).get(issue.team_id)
         
-        created_by_user = db.query(
-            UserModel.user_id, UserModel.name, UserModel.email, UserModel.picture
-        ).filter(UserModel.user_id == issue.created_by).first()
+        users = user_loader(db)
+        assignee_user = users.get(issue.assignee)
+        created_by_user = users.get(issue.created_by)
         
-        labels = []
-        labels_query = db.query(Label, IssueLabel).join(IssueLabel).filter(IssueLabel.issue_id == issue.id)
-        for label, _ in labels_query.all():
-            labels.append(LabelDTO(id=label.id, name=label.name, color=label.color, description=label.description))
+        if isinstance(issue, IssueArchive):
+            labels = [
+                archived_labels[issue_label["label_id"]] for issue_label in issue.issue_labels or []
+                if issue_label["label_id"] in archived_labels
+            ]
+        else:
+            labels = []
+            labels_query = db.query(Label, IssueLabel).join(IssueLabel).filter(IssueLabel.issue_id == issue.id)
+            for label, _ in labels_query.all():
+                labels.append(_label_dict(label))
         
         results.append(issue_to_dto(issue, assignee_user, created_by_user, team, labels))
     
-    return results
+    return _checked_list(results)
+
+def _page_with_archive(db: Session, offset: int, limit: int, hot_filters: list, archive_filters: list) -> list:
+    """One page of issues and issues_archive rows, newest first; a mix of Issue and IssueArchive objects."""
+    hot = select(IssueModel.id, IssueModel.created_at, literal(False).label("in_archive")).where(*hot_filters)
+    cold = select(IssueArchive.id, IssueArchive.created_at, literal(True).label("in_archive")).where(*archive_filters)
+    both = union_all(hot, cold).subquery()
+    page = db.execute(
+        select(both.c.id, both.c.in_archive).order_by(both.c.created_at.desc(), both.c.id.desc()).offset(offset).limit(limit)
+    ).all()
+
+    hot_ids = [row.id for row in page if not row.in_archive]
+    archive_ids = [row.id for row in page if row.in_archive]
+    loaded = {}
+    if hot_ids:
+        loaded.update({(issue.id, False): issue for issue in db.query(IssueModel).filter(IssueModel.id.in_(hot_ids)).all()})
+    if archive_ids:
+        loaded.update({(issue.id, True): issue for issue in db.query(IssueArchive).filter(IssueArchive.id.in_(archive_ids)).all()})
+    return [loaded[(row.id, row.in_archive)] for row in page if (row.id, row.in_archive) in loaded]
+
+def _archived_labels(db: Session, archived: list) -> dict:
+    """Label dicts for the labels kept on archived issues that still exist, by label id, in one query."""
+    label_ids = {issue_label["label_id"] for issue in archived for issue_label in issue.issue_labels or []}
+    if not label_ids:
+        return {}
+    return {
+        label.id: _label_dict(label)
+        for label in db.query(Label).filter(Label.id.in_(label_ids)).all()
+    }
 
 def update_issue(db: Session, issue_id: str, issue_data: dict) -> dict:
     """Update an existing issue."""
@@ -199,27 +253,22 @@ def update_issue(db: Session, issue_id: str, issue_data: dict) -> dict:
         for label_name in issue_data['labels']:
             label_crud.add_label_to_issue(db, issue_id, label_name, issue_data.get('updated_by', db_issue.updated_by))
     
+    emit_change(db, team_workspace_id(db, db_issue.team_id), "issue", "updated", issue_id, team_id=db_issue.team_id)
     db.commit()
     db.refresh(db_issue)
     
-    team = db.query(TeamModel).filter(TeamModel.team_id == db_issue.team_id).first() if db_issue.team_id else None
+    team = team_loader(db).get(db_issue.team_id)
     
-    assignee_user = None
-    if db_issue.assignee:
-        assignee_user = db.query(
-            UserModel.user_id, UserModel.name, UserModel.email, UserModel.picture
-        ).filter(UserModel.user_id == db_issue.assignee).first()
-    
-    created_by_user = db.query(
-        UserModel.user_id, UserModel.name, UserModel.email, UserModel.picture
-    ).filter(UserModel.user_id == db_issue.created_by).first()
+    users = user_loader(db)
+    assignee_user = users.get(db_issue.assignee)
+    created_by_user = users.get(db_issue.created_by)
     
     labels = []
     labels_query = db.query(Label, IssueLabel).join(IssueLabel).filter(IssueLabel.issue_id == issue_id)
     for label, _ in labels_query.all():
-        labels.append(LabelDTO(id=label.id, name=label.name, color=label.color, description=label.description))
+        labels.append(_label_dict(label))
     
-    return issue_to_dto(db_issue, assignee_user, created_by_user, team, labels)
+    return _checked(issue_to_dto(db_issue, assignee_user, created_by_user, team, labels))
 
 def archive_issue(db: Session, issue_id: str, archived_by: str, reason: Optional[str] = None) -> dict:
     """Archive an issue."""
@@ -227,27 +276,31 @@ def archive_issue(db: Session, issue_id: str, archived_by: str, reason: Optional
     if not db_issue:
         raise HTTPException(status_code=404, detail="Issue not found")
     
-    db_issue.is_archived = "true"
+    db_issue.is_archived = True
     db_issue.archived_at = datetime.now()
     db_issue.archived_by = archived_by
     db_issue.archive_reason = reason
     
+    emit_change(db, team_workspace_id(db, db_issue.team_id), "issue", "archived", issue_id, team_id=db_issue.team_id)
     db.commit()
     db.refresh(db_issue)
     
     return get_issue(db, issue_id, include_archived=True)
 
 def unarchive_issue(db: Session, issue_id: str, unarchived_by: str) -> dict:
-    """Unarchive an issue."""
+    """Unarchive an issue, bringing it back from the archive tier first if it was moved there."""
     db_issue = db.query(IssueModel).filter(IssueModel.id == issue_id).first()
+    if not db_issue and restore_archived_issue(db, issue_id):
+        db_issue = db.query(IssueModel).filter(IssueModel.id == issue_id).first()
     if not db_issue:
         raise HTTPException(status_code=404, detail="Issue not found")
     
-    db_issue.is_archived = "false"
+    db_issue.is_archived = False
     db_issue.archived_at = None
     db_issue.archived_by = None
     db_issue.archive_reason = None
     
+    emit_change(db, team_workspace_id(db, db_issue.team_id), "issue", "unarchived", issue_id, team_id=db_issue.team_id)
     db.commit()
     db.refresh(db_issue)
     
@@ -257,11 +310,21 @@ def delete_issue(db: Session, issue_id: str) -> None:
     """Delete an issue."""
     db_issue = db.query(IssueModel).filter(IssueModel.id == issue_id).first()
     if not db_issue:
-        raise HTTPException(status_code=404, detail="Issue not found")
+        # Already in the archive tier: its labels travel with the row
+        archived = db.query(IssueArchive).filter(IssueArchive.id == issue_id).first()
+        if not archived:
+            raise HTTPException(status_code=404, detail="Issue not found")
+        db.query(GitLink).filter(GitLink.local_issue_id == issue_id).delete()
+        emit_change(db, team_workspace_id(db, archived.team_id), "issue", "deleted", issue_id, team_id=archived.team_id)
+        db.delete(archived)
+        db.commit()
+        return
     
     # Delete related data
     db.query(IssueLabel).filter(IssueLabel.issue_id == issue_id).delete()
+    db.query(GitLink).filter(GitLink.local_issue_id == issue_id).delete()
     
+    emit_change(db, team_workspace_id(db, db_issue.team_id), "issue", "deleted", issue_id, team_id=db_issue.team_id)
     db.delete(db_issue)
     db.commit()
 
@@ -272,27 +335,158 @@ def get_sub_issues(db: Session, issue_id: str) -> List[dict]:
         raise HTTPException(status_code=404, detail="Issue not found")
     
     sub_issues = db.query(IssueModel).filter(IssueModel.parent_issue_id == issue_id).all()
+    user_loader(db).prime(user_id for sub_issue in sub_issues for user_id in (sub_issue.assignee, sub_issue.created_by))
+    team_loader(db).prime(sub_issue.team_id for sub_issue in sub_issues)
     
     results = []
     for sub_issue in sub_issues:
-        team = db.query(TeamModel).filter(TeamModel.team_id == sub_issue.team_id).first() if sub_issue.team_id else None
+        team = team_loader(db).get(sub_issue.team_id)
         
-        assignee_user = None
-        if sub_issue.assignee:
-            assignee_user = db.query(
-                UserModel.user_id, UserModel.name, UserModel.email, UserModel.picture
-            ).filter(UserModel.user_id == sub_issue.assignee).first()
-        
-        created_by_user = db.query(
-            UserModel.user_id, UserModel.name, UserModel.email, UserModel.picture
-        ).filter(UserModel.user_id == sub_issue.created_by).first()
+        users = user_loader(db)
+        assignee_user = users.get(sub_issue.assignee)
+        created_by_user = users.get(sub_issue.created_by)
         
         results.append(issue_to_dto(sub_issue, assignee_user, created_by_user, team, []))
     
-    return results
+    return _checked_list(results)
+
+def _get_archived_issue(db: Session, issue_id: str) -> Optional[dict]:
+    archived = db.query(IssueArchive).filter(IssueArchive.id == issue_id).first()
+    if not archived:
+        return None
+
+    team = team_loader(db).get(archived.team_id)
+    users = user_loader(db)
+    users.prime([archived.assignee, archived.created_by, archived.updated_by])
+
+    labels = list(_archived_labels(db, [archived]).values())
+    return _checked(issue_to_dto(
+        archived, users.get(archived.assignee), users.get(archived.created_by), team, labels, users.get(archived.updated_by)
+    ))
+
+# Columns shared by issues and issues_archive, in table order
+ISSUE_COLUMNS = [column.name for column in IssueModel.__table__.columns]
+
+# Nullable references of an issue whose target can be deleted while the issue sits in the archive:
+# column -> (table, key). restore_archived_issue brings them back as NULL when the target is gone.
+# Archived parents are restored before their children, so they are found like any other issue.
+RESTORED_REFERENCES = {
+    "parent_issue_id": ("issues", "id"),
+    "team_id": ("teams", "team_id"),
+    "cycle_id": ("cycles", "id"),
+    "assignee": ("users", "user_id"),
+    "updated_by": ("users", "user_id"),
+    "archived_by": ("users", "user_id"),
+}
+
+def move_archived_issues(db: Session, older_than_days: int, batch_size: int) -> int:
+    """Move one batch of issues archived more than older_than_days ago into issues_archive; returns the count.
+
+    Rows, their labels and the archive insert go in one statement, and rows locked by a running
+    request are skipped (FOR UPDATE SKIP LOCKED) rather than waited on. Issues that still have
+    sub-issues in the hot tier wait until those have moved, so parent references stay valid.
+    """
+    columns = ", ".join(ISSUE_COLUMNS)
+    moved_columns = ", ".join(f"m.{column}" for column in ISSUE_COLUMNS)
+    result = db.execute(text(f"""
+        WITH batch AS (
+            SELECT i.id FROM issues i
+            WHERE i.is_archived AND i.archived_at < now() - make_interval(days => :days)
+              AND NOT EXISTS (SELECT 1 FROM issues s WHERE s.parent_issue_id = i.id)
+            ORDER BY i.archived_at
+            LIMIT :batch_size
+            FOR UPDATE SKIP LOCKED
+        ), labels AS (
+            DELETE FROM issue_labels l USING batch WHERE l.issue_id = batch.id
+            RETURNING l.issue_id, l.label_id, l.created_by, l.created_at
+        ), moved AS (
+            DELETE FROM issues i USING batch WHERE i.id = batch.id
+            RETURNING i.*
+        )
+        INSERT INTO issues_archive ({columns}, issue_labels, moved_at)
+        SELECT {moved_columns}, COALESCE((
+            SELECT jsonb_agg(jsonb_build_object('label_id', l.label_id, 'created_by', l.created_by, 'created_at', l.created_at))
+            FROM labels l WHERE l.issue_id = m.id
+        ), '[]'::jsonb), now()
+        FROM moved m
+    """), {"days": older_than_days, "batch_size": batch_size})
+    db.commit()
+    return result.rowcount
+
+def restore_archived_issue(db: Session, issue_id: str) -> bool:
+    """Move an issue back from issues_archive into issues (still archived); False if it is not there.
+
+    An archived parent is restored along with it so parent_issue_id stays valid. Parent, team, cycle
+    and people that were deleted in the meantime come back as NULL (see RESTORED_REFERENCES); deleted
+    labels are dropped, and labels attached by a deleted user are credited to the issue's creator. An
+    issue whose creator is gone cannot be restored (409). Commits.
+    """
+    chain = []
+    current = issue_id
+    while current:
+        row = db.query(IssueArchive.id, IssueArchive.parent_issue_id).filter(IssueArchive.id == current).first()
+        if not row:
+            break
+        chain.append(row.id)
+        current = row.parent_issue_id
+    if not chain:
+        return False
+
+    orphaned = db.query(IssueArchive.id)\
+        .filter(IssueArchive.id.in_(chain), ~select(UserModel.user_id).where(UserModel.user_id == IssueArchive.created_by).exists())\
+        .first()
+    if orphaned:
+        raise HTTPException(status_code=409, detail=f"Issue {orphaned.id} cannot be restored: its creator no longer exists")
+
+    columns = ", ".join(ISSUE_COLUMNS)
+    archive_columns = ", ".join(
+        f"(SELECT r.{RESTORED_REFERENCES[column][1]} FROM {RESTORED_REFERENCES[column][0]} r "
+        f"WHERE r.{RESTORED_REFERENCES[column][1]} = a.{column})"
+        if column in RESTORED_REFERENCES else f"a.{column}"
+        for column in ISSUE_COLUMNS
+    )
+    for archived_id in reversed(chain):  # parents first
+        db.execute(text(f"""
+            INSERT INTO issues ({columns})
+            SELECT {archive_columns} FROM issues_archive a WHERE a.id = :issue_id
+        """), {"issue_id": archived_id})
+        db.execute(text("""
+            INSERT INTO issue_labels (issue_id, label_id, created_by, created_at)
+            SELECT a.id, x.label_id,
+                   COALESCE((SELECT u.user_id FROM users u WHERE u.user_id = x.created_by), a.created_by), x.created_at
+            FROM issues_archive a
+            CROSS JOIN jsonb_to_recordset(a.issue_labels) AS x(label_id text, created_by text, created_at timestamptz)
+            WHERE a.id = :issue_id AND EXISTS (SELECT 1 FROM labels WHERE labels.id = x.label_id)
+        """), {"issue_id": archived_id})
+        db.query(IssueArchive).filter(IssueArchive.id == archived_id).delete()
+    db.commit()
+    return True
+
+def _checked(issue: dict) -> dict:
+    """Validate one issue dict against IssueDTO; returns it unchanged."""
+    _ISSUE.validate_python(issue)
+    return issue
+
+def _checked_list(issues: List[dict]) -> List[dict]:
+    """Validate a whole page of issue dicts against IssueDTO in one call; returns it unchanged."""
+    _ISSUE_LIST.validate_python(issues)
+    return issues
+
+def _user_dict(user) -> Optional[dict]:
+    """UserDTO-shaped dict of a user row, every field in UserDTO order."""
+    if not user:
+        return None
+    return {"user_id": user.user_id, "name": user.name, "email": user.email, "role": None, "picture": user.picture, "tenant_id": None}
+
+def _label_dict(label) -> dict:
+    return {"id": label.id, "name": label.name, "color": label.color, "description": label.description}
 
 def issue_to_dto(issue, assignee_user, created_by_user, team, labels, updated_by_user=None):
-    """Helper to convert Issue model to DTO."""
+    """Helper to convert Issue model to an IssueDTO-shaped dict.
+
+    Nested users, team and labels are plain dicts too; callers validate the response once with
+    _checked or _checked_list.
+    """
     return {
         "id": issue.id,
         "display_id": issue.display_id,
@@ -302,12 +496,7 @@ def issue_to_dto(issue, assignee_user, created_by_user, team, labels, updated_by
         "status": issue.status,
         "priority": issue.priority,
         "issue_type": issue.issue_type,
-        "assignee": UserDTO(
-            user_id=assignee_user.user_id if assignee_user else None,
-            name=assignee_user.name if assignee_user else None,
-            email=assignee_user.email if assignee_user else None,
-            picture=assignee_user.picture if assignee_user else None
-        ) if assignee_user else None,
+        "assignee": _user_dict(assignee_user),
         "created_at": int(issue.created_at.timestamp()) if issue.created_at else None,
         "updated_at": int(issue.updated_at.timestamp()) if issue.updated_at else None,
         "start_date": int(issue.start_date.timestamp()) if issue.start_date else None,
@@ -315,17 +504,8 @@ def issue_to_dto(issue, assignee_user, created_by_user, team, labels, updated_by
         "story_points": issue.story_points,
         "cycle_id": issue.cycle_id,
         "epic_id": None,  # Commented out since Epic model doesn't exist
-        "created_by": UserDTO(
-            user_id=created_by_user.user_id if created_by_user else None,
-            name=created_by_user.name if created_by_user else None,
-            email=created_by_user.email if created_by_user else None,
-            picture=created_by_user.picture if created_by_user else None
-        ) if created_by_user else None,
-        "team": TeamDTO(
-            team_id=team.team_id,
-            name=team.name
-        ) if team else None,
+        "created_by": _user_dict(created_by_user),
+        "team": {"team_id": team.team_id, "name": team.name} if team else None,
         "labels": labels,
-        "is_archived": issue.is_archived == "true" if isinstance(issue.is_archived, str) else issue.is_archived,
+        "is_archived": issue.is_archived,
     }
-
@@ -0,0 +1,88 @@
+from typing import Dict, Iterable, Optional, Set
+from sqlalchemy.orm import Session
+from app.dto.dtos import UserDTO
+from app.models.user import User
+from app.models.teams import Team
+
+# Columns kept per entity: what the DTO builders read, never whole ORM objects, so cached rows
+# stay valid after commits and never trigger lazy loads.
+USER_COLUMNS = (User.user_id, User.name, User.email, User.role, User.picture, User.tenant_id)
+TEAM_COLUMNS = (Team.team_id, Team.name, Team.workspace_id, Team.description, Team.created_at)
+
+
+class BatchLoader:
+    """Request-scoped memo of rows by id, filled with one IN query per batch of unseen ids.
+
+    Lives in Session.info, so it shares the lifetime of the request's session from get_db.
+    Call prime() with every id a list is about to need, then get() each one without extra queries.
+    """
+
+    def __init__(self, db: Session, columns, key_column):
+        self._db = db
+        self._columns = columns
+        self._key_column = key_column
+        self._rows: Dict[str, Optional[object]] = {}
+        self._pending: Set[str] = set()
+
+    def prime(self, ids: Iterable[Optional[str]]) -> None:
+        self._pending.update(key for key in ids if key and key not in self._rows)
+
+    def get(self, key: Optional[str]):
+        if not key:
+            return None
+        if key not in self._rows:
+            self._pending.add(key)
+            self._flush()
+        return self._rows.get(key)
+
+    def get_many(self, ids: Iterable[Optional[str]]) -> Dict[str, object]:
+        wanted = [key for key in ids if key]
+        self.prime(wanted)
+        self._flush()
+        return {key: self._rows[key] for key in wanted if self._rows.get(key) is not None}
+
+    def invalidate(self, ids: Optional[Iterable[str]] = None) -> None:
+        """Forget cached rows after they were modified in this request (all rows if ids is None)."""
+        if ids is None:
+            self._rows.clear()
+        else:
+            for key in ids:
+                self._rows.pop(key, None)
+
+    def _flush(self) -> None:
+        pending = self._pending - self._rows.keys()
+        self._pending.clear()
+        if not pending:
+            return
+        rows = self._db.query(*self._columns).filter(self._key_column.in_(pending)).all()
+        for row in rows:
+            self._rows[getattr(row, self._key_column.key)] = row
+        for key in pending:
+            self._rows.setdefault(key, None)
+
+
+def user_loader(db: Session) -> BatchLoader:
+    loader = db.info.get("user_loader")
+    if loader is None:
+        loader = db.info["user_loader"] = BatchLoader(db, USER_COLUMNS, User.user_id)
+    return loader
+
+
+def team_loader(db: Session) -> BatchLoader:
+    loader = db.info.get("team_loader")
+    if loader is None:
+        loader = db.info["team_loader"] = BatchLoader(db, TEAM_COLUMNS, Team.team_id)
+    return loader
+
+
+def user_dto(user) -> Optional[UserDTO]:
+    """UserDTO of a User or a user_loader row; None for a missing user."""
+    if not user:
+        return None
+    return UserDTO(
+        user_id=user.user_id,
+        name=user.name,
+        email=user.email,
+        role=user.role,
+        picture=user.picture,
+    )
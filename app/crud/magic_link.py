@@ -6,6 +6,7 @@ from app.models.user import User
 from app.schemas.magic_link import MagicLinkCreate, MagicLinkResponse, MagicLinkVerify
 from app.core.security import create_access_token, verify_token
 from app.utils.utils import generate_custom_id
+from app.services.token_sweeper import SWEEP_TARGETS, delete_in_batches
 from datetime import datetime, timedelta, timezone
 import secrets
 import hashlib
@@ -260,21 +261,15 @@ def cleanup_expired_magic_links(db: Session) -> int:
     """
     Clean up expired magic links from the database.
     
+    Deletes in bounded batches (the same pass the background sweeper runs), counting rows as they go.
+    
     Args:
         db: Database session
         
     Returns:
         int: Number of expired links removed
     """
-    expired_count = db.query(MagicLink).filter(
-        MagicLink.expires_at < datetime.now(timezone.utc)
-    ).count()
-    
-    db.query(MagicLink).filter(
-        MagicLink.expires_at < datetime.now(timezone.utc)
-    ).delete()
-    
-    db.commit()
+    expired_count = delete_in_batches(db, "magic_links", SWEEP_TARGETS["magic_links"])
     
     logger.info(f"Cleaned up {expired_count} expired magic links")
     return expired_count
@@ -1,88 +1,66 @@
+from sqlalchemy import func, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from app.schemas.onboarding import OnboardingRequest, OnboardingResponse, UsageType
-from app.schemas.tenant import TenantCreate
-from app.schemas.workspace import WorkspaceCreate
-from app.schemas.user import UserCreate
-from app.crud.tenant import create_tenant
-from app.crud.workspace import create_workspace
-from app.crud.user import create_user
-from app.models.workspace import WorkspaceMember
+from app.models.tenant import Tenant
+from app.models.workspace import Workspace, WorkspaceMember
 from typing import List
-from datetime import datetime
 from app.models.user import User
+from app.utils.utils import generate_custom_id
+from app.services.principal_cache import invalidate_principal
 
 def process_onboarding(db: Session, user_id: str, onboarding_data: OnboardingRequest) -> OnboardingResponse:
-    """Process complete onboarding - create tenant, workspace, and invite team members."""
-    
-    # 1. Create new tenant
-    tenant_data = TenantCreate(name=onboarding_data.workspace_name)
-    tenant = create_tenant(db, tenant_data)
-    
-    # 2. Create workspace within the tenant
-    workspace_data = WorkspaceCreate(
-        name=onboarding_data.workspace_name,
-        description=f"{onboarding_data.usage_type.value.title()} workspace"
-    )
-    workspace = create_workspace(db, workspace_data, tenant.tenant_id, user_id)
-    
-    # 3. Update the current user to belong to the new tenant and workspace
-    # Fetch ORM User and update tenant and workspace
-    current_user = db.query(User).filter(User.user_id == user_id).first()
-    if current_user:
-        current_user.tenant_id = tenant.tenant_id
-        # Ensure the creator's selected workspace is the one just created
-        current_user.workspace_id = workspace.workspace_id
+    """Process complete onboarding - create tenant, workspace, and invite team members.
+
+    Runs as one transaction: rows are flushed as they are created and committed once at the end,
+    so a failure part way leaves no half-created tenant or workspace behind.
+    """
+    try:
+        # 1. Create new tenant
+        tenant = Tenant(name=onboarding_data.workspace_name)
+        db.add(tenant)
+        db.flush()
+
+        # 2. Create workspace within the tenant (the tenant is new, so it cannot have one yet)
+        workspace = Workspace(
+            name=onboarding_data.workspace_name,
+            tenant_id=tenant.tenant_id,
+            created_by=user_id,
+            description=f"{onboarding_data.usage_type.value.title()} workspace"
+        )
+        db.add(workspace)
+        db.flush()
+
+        # 3. Move the current user to the new tenant and make the new workspace their selected one
+        db.execute(
+            update(User)
+            .where(User.user_id == user_id)
+            .values(tenant_id=tenant.tenant_id, workspace_id=workspace.workspace_id)
+        )
+
+        # 4. Create or move every team member with one upsert keyed on email; RETURNING gives the
+        # ids of new and existing users alike
+        invited_user_ids = _upsert_team_members(db, onboarding_data, tenant.tenant_id, workspace.workspace_id)
+        invited_user_ids = [invited_id for invited_id in invited_user_ids if invited_id != user_id]
+
+        # Creator is Admin (as create_workspace does), everyone else a Member; existing memberships are kept
+        memberships = [{"workspace_id": workspace.workspace_id, "user_id": user_id, "role": "Admin"}]
+        memberships += [
+            {"workspace_id": workspace.workspace_id, "user_id": invited_id, "role": "Member"}
+            for invited_id in invited_user_ids
+        ]
+        db.execute(
+            insert(WorkspaceMember)
+            .values(memberships)
+            .on_conflict_do_nothing(index_elements=[WorkspaceMember.workspace_id, WorkspaceMember.user_id])
+        )
+
         db.commit()
-    
-    # 4. Add workspace memberships and create team member accounts
-    invited_users = []
-    for member in onboarding_data.team_members:
-        # Check if user already exists
-        existing_user = db.query(User).filter(User.email == member.email).first()
-        if not existing_user:
-            # Create new user
-            user_data = UserCreate(
-                email=member.email,
-                name=member.name or member.email.split('@')[0],
-                tenant_id=tenant.tenant_id,
-                role="Member",
-                # Set workspace_id for the invited user to the newly created workspace
-                workspace_id=workspace.workspace_id
-            )
-            new_user = create_user(db, user_data)
-            invited_users.append(new_user)
-            # Add to workspace as Member (avoid duplicates)
-            existing_membership = db.query(WorkspaceMember).filter(
-                WorkspaceMember.workspace_id == workspace.workspace_id,
-                WorkspaceMember.user_id == new_user.user_id
-            ).first()
-            if not existing_membership:
-                db.add(WorkspaceMember(workspace_id=workspace.workspace_id, user_id=new_user.user_id, role="Member"))
-        else:
-            # Update existing user's tenant
-            existing_user.tenant_id = tenant.tenant_id
-            # Move/assign user's active workspace to the new workspace
-            existing_user.workspace_id = workspace.workspace_id
-            db.commit()
-            invited_users.append(existing_user)
-            # Add to workspace as Member (avoid duplicates)
-            existing_membership = db.query(WorkspaceMember).filter(
-                WorkspaceMember.workspace_id == workspace.workspace_id,
-                WorkspaceMember.user_id == existing_user.user_id
-            ).first()
-            if not existing_membership:
-                db.add(WorkspaceMember(workspace_id=workspace.workspace_id, user_id=existing_user.user_id, role="Member"))
+    except Exception:
+        db.rollback()
+        raise
+    invalidate_principal([user_id] + invited_user_ids)
 
-    # Add creator as Owner of workspace (avoid duplicate)
-    owner_membership = db.query(WorkspaceMember).filter(
-        WorkspaceMember.workspace_id == workspace.workspace_id,
-        WorkspaceMember.user_id == user_id
-    ).first()
-    if not owner_membership:
-        db.add(WorkspaceMember(workspace_id=workspace.workspace_id, user_id=user_id, role="Owner"))
-    
-    db.commit()
-    
     # 5. Return success response
     return OnboardingResponse(
         success=True,
@@ -90,6 +68,37 @@ def process_onboarding(db: Session, user_id: str, onboarding_data: OnboardingReq
         workspace_id=workspace.workspace_id,
         workspace_name=onboarding_data.workspace_name,
         usage_type=onboarding_data.usage_type,
-        team_members_invited=len(invited_users),
+        team_members_invited=len(invited_user_ids),
         message="Your workspace has been created successfully!"
-    )
\ No newline at end of file
+    )
+
+
+def _upsert_team_members(db: Session, onboarding_data: OnboardingRequest, tenant_id: str, workspace_id: str) -> List[str]:
+    """Insert missing team members and move existing ones to the tenant/workspace; returns their user ids."""
+    members = {}
+    for member in onboarding_data.team_members or []:
+        members.setdefault(member.email, member)  # ON CONFLICT DO UPDATE cannot touch a row twice
+    if not members:
+        return []
+
+    rows = []
+    for email, member in members.items():
+        name = member.name or email.split('@')[0]
+        rows.append({
+            "user_id": f"USR-{generate_custom_id(name)}",
+            "name": name,
+            "email": email,
+            "role": "Member",
+            "tenant_id": tenant_id,
+            "workspace_id": workspace_id,
+        })
+    stmt = insert(User).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[User.email],
+        set_={
+            "tenant_id": stmt.excluded.tenant_id,
+            "workspace_id": stmt.excluded.workspace_id,
+            "last_updated": func.now(),
+        }
+    ).returning(User.user_id)
+    return list(db.execute(stmt).scalars().all())
@@ -13,6 +13,47 @@ from app.dto.dtos import UserDTO, TeamDTO, ChannelDTO, ProjectUpdateDTO
 from app.models.channel import Channel
 from app.models.updates import ProjectUpdate  # Add this import at the top of the file
 from app.crud.health import get_project_health_summary
+from app.models.project import Milestone
+from app.models.project_teams import project_teams
+from app.models.project_channels import ProjectChannel
+from app.utils.etag import rows_fingerprint
+from sqlalchemy import func, or_, select
+from app.services.dependency_graph import PROJECT_GRAPH, invalidate_dependency_graph
+
+def get_project_version(db: Session, project_id: str) -> Optional[tuple]:
+    """Change marker for get_project computed in one query; None if the project does not exist.
+
+    Covers the project row plus everything get_project embeds: teams, channels, milestones
+    (health and contributors), the latest update and the users shown.
+    """
+    teams = select(rows_fingerprint(Team.team_id, Team.name))\
+        .select_from(project_teams)\
+        .join(Team, Team.team_id == project_teams.c.team_id)\
+        .where(project_teams.c.project_id == Project.project_id)\
+        .scalar_subquery()
+    channels = select(rows_fingerprint(Channel.channel_id, Channel.name))\
+        .select_from(ProjectChannel)\
+        .join(Channel, Channel.channel_id == ProjectChannel.channel_id)\
+        .where(ProjectChannel.project_id == Project.project_id)\
+        .scalar_subquery()
+    milestones = select(rows_fingerprint(Milestone.milestone_id, Milestone.status, Milestone.dri))\
+        .where(Milestone.project_id == Project.project_id)\
+        .scalar_subquery()
+    people = select(func.max(User.last_updated))\
+        .where(or_(
+            User.user_id == Project.dri_id,
+            User.user_id.in_(select(Milestone.dri).where(Milestone.project_id == Project.project_id))
+        ))\
+        .scalar_subquery()
+    update_count = select(func.count()).where(ProjectUpdate.project_id == Project.project_id).scalar_subquery()
+    latest_update_at = select(func.max(ProjectUpdate.created_at))\
+        .where(ProjectUpdate.project_id == Project.project_id)\
+        .scalar_subquery()
+
+    row = db.query(Project.last_updated, teams, channels, milestones, people, update_count, latest_update_at)\
+        .filter(Project.project_id == project_id)\
+        .first()
+    return tuple(row) if row else None
 
 def get_project(db: Session, project_id: str) -> ProjectResponse:
     """Fetch a single project by ID."""
@@ -236,6 +277,7 @@ def update_project(db: Session, project_id: str, project: ProjectUpdate) -> Proj
     
     if not db_project:
         raise HTTPException(status_code=401, detail="Project not found")  # Handle the case where the project is not found
+    previous_workspace_id = db_project.workspace_id
 
     # Fetch the User instance based on the provided user_id (DRI)
     dri = None
@@ -283,6 +325,9 @@ def update_project(db: Session, project_id: str, project: ProjectUpdate) -> Proj
     
     db.commit()
     db.refresh(db_project)
+    # Graph nodes carry title, status and end date, so any update can change the critical path
+    for workspace_id in {previous_workspace_id, db_project.workspace_id}:
+        invalidate_dependency_graph(PROJECT_GRAPH, workspace_id)
 
     return ProjectResponse(
         project_id=str(db_project.project_id),
@@ -339,6 +384,7 @@ def delete_project(db: Session, project_id: str) -> ProjectResponse:
 
     db.delete(project)
     db.commit()
+    invalidate_dependency_graph(PROJECT_GRAPH, project.workspace_id)
 
     return ProjectResponse(
         project_id=str(project.project_id),
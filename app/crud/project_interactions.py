@@ -3,8 +3,9 @@ from app.models.project_interactions import ProjectComment, ProjectReaction
 from app.schemas.project_interactions import ProjectCommentCreate, ProjectReactionCreate, ProjectInteractionResponse, ProjectCommentResponse, ProjectReactionResponse
 import uuid
 from fastapi import HTTPException
-from app.models.user import User
-from app.dto.dtos import UserDTO
+from app.dto.dtos import UserDTO, ReactionCountDTO
+from app.crud.reactions import PROJECT_REACTIONS, toggle_reaction, remove_reaction, change_reaction_type, get_reaction_counts
+from app.crud.loaders import user_loader
 
 
 def create_project_comment(
@@ -13,7 +14,7 @@ def create_project_comment(
     created_by: str,
     update_id: str
 ):
-    user = db.query(User).filter(User.user_id == created_by).first()
+    user = user_loader(db).get(created_by)
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
     db_comment = ProjectComment(
@@ -73,7 +74,11 @@ def get_project_interactions(db: Session, update_id: str):
         created_at=int(reaction.created_at.timestamp()) if reaction.created_at else None,
         update_id=reaction.update_id
     ) for reaction in reactions] if reactions else []
-    return ProjectInteractionResponse(comments=comments, reactions=reactions)
+    reaction_counts = [
+        ReactionCountDTO(reaction_type=reaction_type, count=count)
+        for reaction_type, count in get_reaction_counts(db, PROJECT_REACTIONS, [update_id]).get(update_id, [])
+    ]
+    return ProjectInteractionResponse(comments=comments, reactions=reactions, reaction_counts=reaction_counts)
 
 def add_project_reaction(
     db: Session,
@@ -81,30 +86,23 @@ def add_project_reaction(
     reacted_by: str,
     reaction: ProjectReactionCreate
 ):
-    existing_reaction = db.query(ProjectReaction).filter(
-        ProjectReaction.update_id == update_id,
-        ProjectReaction.reacted_by == reacted_by,
-        ProjectReaction.reaction_type == reaction.reaction_type
-    ).first()
-    
-    if existing_reaction:
-        db.delete(existing_reaction)
-        db.commit()
-        return None  # Remove reaction if it's the same type by the same user
-    
-    user = db.query(User).filter(User.user_id == reacted_by).first()
+    user = user_loader(db).get(reacted_by)
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
-    
-    new_reaction = ProjectReaction(
-        reaction_id=str(uuid.uuid4()),
-        update_id=update_id,
-        reacted_by=reacted_by,
-        reaction_type=reaction.reaction_type
+
+    reaction_id = toggle_reaction(
+        db,
+        PROJECT_REACTIONS,
+        target_id=update_id,
+        user_id=reacted_by,
+        reaction_type=reaction.reaction_type,
+        reaction_id=str(uuid.uuid4())
     )
-    db.add(new_reaction)
     db.commit()
-    db.refresh(new_reaction)
+    if reaction_id is None:
+        return None  # Remove reaction if it's the same type by the same user
+
+    new_reaction = db.query(ProjectReaction).filter(ProjectReaction.reaction_id == reaction_id).first()
     return ProjectReactionResponse(
         reaction_id=new_reaction.reaction_id,
         reaction_type=new_reaction.reaction_type,
@@ -167,16 +165,15 @@ def update_project_reaction(
     reaction_id: str,
     reaction: ProjectReactionCreate
 ):
-    db_reaction = db.query(ProjectReaction).filter(
-        ProjectReaction.reaction_id == reaction_id
-    ).first()
-    
-    if not db_reaction:
+    current_id = change_reaction_type(db, PROJECT_REACTIONS, reaction_id, reaction.reaction_type)
+    if current_id is None:
         raise HTTPException(status_code=401, detail="Reaction not found")
-    
-    db_reaction.reaction_type = reaction.reaction_type
     db.commit()
-    db.refresh(db_reaction)
+
+    # current_id differs from reaction_id when the user already had a reaction of the new type
+    db_reaction = db.query(ProjectReaction).filter(
+        ProjectReaction.reaction_id == current_id
+    ).first()
     return ProjectReactionResponse(
         reaction_id=db_reaction.reaction_id,
         reaction_type=db_reaction.reaction_type,
@@ -192,13 +189,7 @@ def update_project_reaction(
     )
 
 def delete_project_reaction(db: Session, reaction_id: str):
-    db_reaction = db.query(ProjectReaction).filter(
-        ProjectReaction.reaction_id == reaction_id
-    ).first()
-    
-    if not db_reaction:
+    if not remove_reaction(db, PROJECT_REACTIONS, reaction_id):
         raise HTTPException(status_code=401, detail="Reaction not found")
-    
-    db.delete(db_reaction)
     db.commit()
     return None
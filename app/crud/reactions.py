@@ -0,0 +1,166 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import delete, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from app.models.issue_interactions import CommentReaction, CommentReactionCount
+from app.models.project_interactions import ProjectReaction, ProjectReactionCount
+from app.models.initiative_interactions import InitiativeReaction, InitiativeReactionCount
+
+
+@dataclass(frozen=True)
+class ReactionTable:
+    """Column layout of a reaction table and the counter table that mirrors it."""
+    model: Any
+    count_model: Any
+    id_column: str
+    target_column: str
+    user_column: str
+
+
+COMMENT_REACTIONS = ReactionTable(CommentReaction, CommentReactionCount, "id", "comment_id", "created_by")
+PROJECT_REACTIONS = ReactionTable(ProjectReaction, ProjectReactionCount, "reaction_id", "update_id", "reacted_by")
+INITIATIVE_REACTIONS = ReactionTable(InitiativeReaction, InitiativeReactionCount, "reaction_id", "update_id", "reacted_by")
+
+
+def toggle_reaction(
+    db: Session,
+    table: ReactionTable,
+    target_id: str,
+    user_id: str,
+    reaction_type: str,
+    reaction_id: str
+) -> Optional[str]:
+    """Remove the user's reaction if present, otherwise add it; returns the new reaction id if added.
+
+    Uses DELETE ... RETURNING and INSERT ... ON CONFLICT DO NOTHING so concurrent toggles never
+    raise and the counter only moves when a row really changed. The caller commits.
+    """
+    model = table.model
+    target = getattr(model, table.target_column)
+    user = getattr(model, table.user_column)
+    removed = db.execute(
+        delete(model)
+        .where(target == target_id, user == user_id, model.reaction_type == reaction_type)
+        .returning(getattr(model, table.id_column))
+    ).first()
+    if removed:
+        _adjust_count(db, table, target_id, reaction_type, -1)
+        return None
+
+    inserted = db.execute(
+        insert(model)
+        .values({
+            table.id_column: reaction_id,
+            table.target_column: target_id,
+            table.user_column: user_id,
+            "reaction_type": reaction_type,
+        })
+        .on_conflict_do_nothing(index_elements=[table.target_column, table.user_column, "reaction_type"])
+        .returning(getattr(model, table.id_column))
+    ).first()
+    if inserted:
+        _adjust_count(db, table, target_id, reaction_type, 1)
+        return inserted[0]
+    # A concurrent request added the same reaction first; it is already counted
+    return None
+
+
+def remove_reaction(db: Session, table: ReactionTable, reaction_id: str) -> bool:
+    """Delete a reaction by id and decrement its counter. The caller commits."""
+    model = table.model
+    removed = db.execute(
+        delete(model)
+        .where(getattr(model, table.id_column) == reaction_id)
+        .returning(getattr(model, table.target_column), model.reaction_type)
+    ).first()
+    if not removed:
+        return False
+    _adjust_count(db, table, removed[0], removed[1], -1)
+    return True
+
+
+def change_reaction_type(db: Session, table: ReactionTable, reaction_id: str, reaction_type: str) -> Optional[str]:
+    """Switch an existing reaction to another type, moving one unit between counters.
+
+    Returns the id of the reaction that now carries the new type, or None if reaction_id does not
+    exist. The caller commits.
+    """
+    model = table.model
+    previous = db.query(getattr(model, table.target_column), getattr(model, table.user_column), model.reaction_type)\
+        .filter(getattr(model, table.id_column) == reaction_id)\
+        .with_for_update()\
+        .first()
+    if not previous:
+        return None
+    target_id, user_id, old_type = previous
+    if old_type == reaction_type:
+        return reaction_id
+    duplicate = db.query(getattr(model, table.id_column)).filter(
+        getattr(model, table.target_column) == target_id,
+        getattr(model, table.user_column) == user_id,
+        model.reaction_type == reaction_type
+    ).first()
+    if duplicate:
+        # The user already reacted with the new type; collapse into that reaction
+        remove_reaction(db, table, reaction_id)
+        return duplicate[0]
+    db.execute(
+        update(model)
+        .where(getattr(model, table.id_column) == reaction_id)
+        .values(reaction_type=reaction_type)
+    )
+    _adjust_count(db, table, target_id, old_type, -1)
+    _adjust_count(db, table, target_id, reaction_type, 1)
+    return reaction_id
+
+
+def get_reaction_counts(db: Session, table: ReactionTable, target_ids: Iterable[str]) -> Dict[str, List[Tuple[str, int]]]:
+    """Stored (reaction_type, count) pairs per target, read straight from the counter table."""
+    wanted = set(target_ids)
+    if not wanted:
+        return {}
+    count_model = table.count_model
+    target = getattr(count_model, table.target_column)
+    rows = db.query(target, count_model.reaction_type, count_model.count)\
+        .filter(target.in_(wanted), count_model.count > 0)\
+        .order_by(target, count_model.reaction_type)\
+        .all()
+    counts: Dict[str, List[Tuple[str, int]]] = {}
+    for target_id, reaction_type, count in rows:
+        counts.setdefault(target_id, []).append((reaction_type, count))
+    return counts
+
+
+def delete_reaction_counts(db: Session, table: ReactionTable, target_ids: Iterable[str]) -> None:
+    """Drop counters of targets whose reactions were bulk-deleted. The caller commits."""
+    wanted = set(target_ids)
+    if wanted:
+        count_model = table.count_model
+        db.execute(delete(count_model).where(getattr(count_model, table.target_column).in_(wanted)))
+
+
+def _adjust_count(db: Session, table: ReactionTable, target_id: str, reaction_type: Optional[str], delta: int) -> None:
+    if reaction_type is None:
+        return
+    count_model = table.count_model
+    target = getattr(count_model, table.target_column)
+    if delta > 0:
+        db.execute(
+            insert(count_model)
+            .values({table.target_column: target_id, "reaction_type": reaction_type, "count": delta})
+            .on_conflict_do_update(
+                index_elements=[table.target_column, "reaction_type"],
+                set_={"count": count_model.count + delta}
+            )
+        )
+        return
+    db.execute(
+        update(count_model)
+        .where(target == target_id, count_model.reaction_type == reaction_type)
+        .values(count=count_model.count + delta)
+    )
+    db.execute(
+        delete(count_model)
+        .where(target == target_id, count_model.reaction_type == reaction_type, count_model.count <= 0)
+    )
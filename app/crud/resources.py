@@ -1,7 +1,7 @@
 from sqlalchemy.orm import Session
 from app.models.resource import ProjectResource, InitiativeResource
 from app.schemas.resource import ResourceCreate, ResourceUpdate, ProjectResourceResponse, InitiativeResourceResponse
-from app.dto.dtos import UserDTO
+from app.crud.loaders import user_dto, user_loader
 from fastapi import HTTPException
 from typing import List
 
@@ -17,6 +17,7 @@ def create_resource(db: Session, project_id: str, resource: ResourceCreate) -> P
     db.add(db_resource)
     db.commit()
     db.refresh(db_resource)
+    users = user_loader(db)
     return ProjectResourceResponse(
         resource_id=db_resource.resource_id,
         project_id=db_resource.project_id,
@@ -24,12 +25,7 @@ def create_resource(db: Session, project_id: str, resource: ResourceCreate) -> P
         url=db_resource.url,
         type=db_resource.type,
         pinned=db_resource.pinned,
-        created_by=UserDTO(
-            user_id=db_resource.created_by,
-            name=db_resource.created_by_user.name,
-            role=db_resource.created_by_user.role,
-            picture=db_resource.created_by_user.picture
-        ),
+        created_by=user_dto(users.get(db_resource.created_by)),
         created_at=int(db_resource.created_at.timestamp()) if db_resource.created_at else None,
         last_updated=int(db_resource.last_updated.timestamp()) if db_resource.last_updated else None
     )
@@ -39,6 +35,9 @@ def get_project_resources(db: Session, project_id: str) -> List[ProjectResourceR
         .filter(ProjectResource.project_id == project_id)\
         .order_by(ProjectResource.created_at.desc())\
         .all()
+    # One IN query for every creator on the list instead of a lazy load per resource
+    users = user_loader(db)
+    users.prime(resource.created_by for resource in db_resources)
     return [ProjectResourceResponse(
         resource_id=resource.resource_id,
         project_id=resource.project_id,
@@ -46,12 +45,7 @@ def get_project_resources(db: Session, project_id: str) -> List[ProjectResourceR
         url=resource.url,
         type=resource.type,
         pinned=resource.pinned,
-        created_by=UserDTO( 
-            user_id=resource.created_by,
-            name=resource.created_by_user.name,
-            role=resource.created_by_user.role,
-            picture=resource.created_by_user.picture
-        ),
+        created_by=user_dto(users.get(resource.created_by)),
         created_at=int(resource.created_at.timestamp()) if resource.created_at else None,
         last_updated=int(resource.last_updated.timestamp()) if resource.last_updated else None
     ) for resource in db_resources]
@@ -63,6 +57,7 @@ def patch_project_resource(db: Session, project_id: str, resource_id: str, resou
     db_resource.update(**resource.dict(exclude_unset=True))
     db.commit()
     db.refresh(db_resource)
+    users = user_loader(db)
     return ProjectResourceResponse(
         resource_id=db_resource.resource_id,
         project_id=db_resource.project_id,
@@ -70,12 +65,7 @@ def patch_project_resource(db: Session, project_id: str, resource_id: str, resou
         url=db_resource.url,
         type=db_resource.type,
         pinned=db_resource.pinned,
-        created_by=UserDTO(
-            user_id=db_resource.created_by,
-            name=db_resource.created_by_user.name,
-            role=db_resource.created_by_user.role,
-            picture=db_resource.created_by_user.picture
-        ),
+        created_by=user_dto(users.get(db_resource.created_by)),
         created_at=int(db_resource.created_at.timestamp()) if db_resource.created_at else None,
         last_updated=int(db_resource.last_updated.timestamp()) if db_resource.last_updated else None
     )
@@ -99,6 +89,7 @@ def create_initiative_resource(db: Session, initiative_id: str, resource: Resour
     db.add(db_resource)
     db.commit()
     db.refresh(db_resource)
+    users = user_loader(db)
     return InitiativeResourceResponse(
         resource_id=db_resource.resource_id,
         initiative_id=db_resource.initiative_id,
@@ -106,19 +97,15 @@ def create_initiative_resource(db: Session, initiative_id: str, resource: Resour
         url=db_resource.url,
         type=db_resource.type,
         pinned=db_resource.pinned,
-        created_by=UserDTO(
-            user_id=db_resource.created_by,
-            name=db_resource.created_by_user.name,
-            role=db_resource.created_by_user.role,
-            picture=db_resource.created_by_user.picture,
-            email=db_resource.created_by_user.email
-        ),
+        created_by=user_dto(users.get(db_resource.created_by)),
         created_at=int(db_resource.created_at.timestamp()) if db_resource.created_at else None,
         last_updated=int(db_resource.last_updated.timestamp()) if db_resource.last_updated else None
     )
 
 def get_initiative_resources(db: Session, initiative_id: str) -> List[InitiativeResourceResponse]:
     db_resources = db.query(InitiativeResource).filter(InitiativeResource.initiative_id == initiative_id).order_by(InitiativeResource.created_at.desc()).all()
+    users = user_loader(db)
+    users.prime(resource.created_by for resource in db_resources)
     return [InitiativeResourceResponse(
         resource_id=resource.resource_id,   
         initiative_id=resource.initiative_id,
@@ -126,13 +113,7 @@ def get_initiative_resources(db: Session, initiative_id: str) -> List[Initiative
         url=resource.url,
         type=resource.type,
         pinned=resource.pinned,
-        created_by=UserDTO(
-            user_id=resource.created_by,
-            name=resource.created_by_user.name,
-            role=resource.created_by_user.role,
-            picture=resource.created_by_user.picture,
-            email=resource.created_by_user.email
-        ),
+        created_by=user_dto(users.get(resource.created_by)),
         created_at=int(resource.created_at.timestamp()) if resource.created_at else None,
         last_updated=int(resource.last_updated.timestamp()) if resource.last_updated else None
     ) for resource in db_resources]
@@ -144,6 +125,7 @@ def patch_initiative_resource(db: Session, initiative_id: str, resource_id: str,
     db_resource.update(**resource.dict(exclude_unset=True))
     db.commit()
     db.refresh(db_resource)
+    users = user_loader(db)
     return InitiativeResourceResponse(
         resource_id=db_resource.resource_id,
         initiative_id=db_resource.initiative_id,
@@ -151,13 +133,7 @@ def patch_initiative_resource(db: Session, initiative_id: str, resource_id: str,
         url=db_resource.url,
         type=db_resource.type,
         pinned=db_resource.pinned,
-        created_by=UserDTO(
-            user_id=db_resource.created_by,
-            name=db_resource.created_by_user.name,
-            role=db_resource.created_by_user.role,
-            picture=db_resource.created_by_user.picture,
-            email=db_resource.created_by_user.email
-        ),
+        created_by=user_dto(users.get(db_resource.created_by)),
         created_at=int(db_resource.created_at.timestamp()) if db_resource.created_at else None,
         last_updated=int(db_resource.last_updated.timestamp()) if db_resource.last_updated else None
     )   
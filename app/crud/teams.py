@@ -25,6 +25,9 @@ from app.models.initiative_teams import initiative_teams
 from app.models.project_teams import project_teams
 from app.crud import cycles as cycles_crud
 import json
+from typing import Optional
+from sqlalchemy import func, select
+from app.utils.etag import rows_fingerprint
 
 def create_team(db: Session, team: TeamCreate):
     """Create a new team and add members if provided."""
@@ -210,6 +213,24 @@ def get_team_members(db: Session, team_id: str) -> TeamMembersResponse:
         ]
     )
 
+def get_team_version(db: Session, team_id: str) -> Optional[tuple]:
+    """Change marker for get_team_details and get_team_settings; None if the team does not exist.
+
+    Teams have no modification timestamp, so the editable columns are hashed together with the
+    member list and the members' own last_updated.
+    """
+    members = select(rows_fingerprint(TeamMember.user_id))\
+        .where(TeamMember.team_id == Team.team_id)\
+        .scalar_subquery()
+    people = select(func.max(User.last_updated))\
+        .join(TeamMember, TeamMember.user_id == User.user_id)\
+        .where(TeamMember.team_id == Team.team_id)\
+        .scalar_subquery()
+    row = db.query(func.md5(func.concat_ws("|", Team.name, Team.description, Team.settings)), members, people)\
+        .filter(Team.team_id == team_id)\
+        .first()
+    return tuple(row) if row else None
+
 def get_team_details(db: Session, team_id: str) -> TeamResponse:
     """Get all details of a team."""
     db_team = db.query(Team).filter(Team.team_id == team_id).first()
@@ -289,7 +310,8 @@ def get_team_settings(db: Session, team_id: str) -> TeamSettingsResponse:
     defaults = {
         "general_settings": {
             "name": db_team.name or "",
-            "identifier": (db_team.team_id.split("-")[1] if db_team.team_id and "-" in db_team.team_id else "TM"),
+            # The name initials: after the ULID in TEAM-<ULID>-<initials>, before the random part in older ids
+            "identifier": next((part for part in (db_team.team_id or "").split("-")[1:] if len(part) != 26), None) or "TM",
             "status": "Active",
             "description": db_team.description or "",
         },
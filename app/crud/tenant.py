@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
 from app.models.tenant import Tenant
 from app.schemas.tenant import TenantCreate, TenantUpdate, TenantResponse
+from app.services.slack_credentials import invalidate_slack_token
 
 def create_tenant(db: Session, tenant: TenantCreate) -> TenantResponse:
     """Create a new tenant in the database."""
@@ -74,6 +75,7 @@ def delete_tenant(db: Session, tenant_id: str) -> bool:
 
     db.delete(db_tenant)
     db.commit()
+    invalidate_slack_token(tenant_id)
     return True 
 
 def get_all_tenants(db: Session):
@@ -103,4 +105,5 @@ def add_slack_token(db: Session, tenant_id: str, encrypted_token: str) -> bool:
 
     db_tenant.slack_bot_token = encrypted_token
     db.commit()  # Commit the changes to save the token
+    invalidate_slack_token(tenant_id)
     return True  # Indicate success 
\ No newline at end of file
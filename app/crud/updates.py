@@ -1,10 +1,18 @@
 from sqlalchemy.orm import Session
 from app.models.updates import ProjectUpdate, InitiativeUpdate
 from app.schemas.updates import UpdateCreate, ProjectUpdateResponse, InitiativeUpdateResponse
-from typing import List
-from app.models.user import User
+from typing import List, Optional, Tuple
+from app.models.project import Project
+from app.models.initiative import Initiative
+from app.services.change_stream import emit_change
 from app.dto.dtos import UserDTO
-from sqlalchemy.orm import joinedload
+from sqlalchemy import tuple_
+from sqlalchemy.orm import defer, joinedload
+from app.utils.content import content_preview, content_text_sql
+from app.utils.pagination import encode_cursor, decode_cursor
+from app.crud.loaders import user_dto, user_loader
+
+DEFAULT_UPDATE_PAGE_SIZE = 20
 
 def create_project_update(db: Session, project_id: str, update: UpdateCreate) -> ProjectUpdateResponse:
     db_update = ProjectUpdate(
@@ -14,9 +22,11 @@ def create_project_update(db: Session, project_id: str, update: UpdateCreate) ->
         current_status = update.current_status
     )
     db.add(db_update)
+    workspace = db.query(Project.workspace_id).filter(Project.project_id == project_id).first()
+    emit_change(db, workspace.workspace_id if workspace else None, "project_update", "created", db_update.update_id, project_id=project_id)
     db.commit()
     db.refresh(db_update)
-    posted_by = db.query(User).filter(User.user_id == update.created_by).first()
+    posted_by = user_loader(db).get(update.created_by)
     return ProjectUpdateResponse(
         update_id=db_update.update_id,
         project_id=db_update.project_id,
@@ -32,27 +42,27 @@ def create_project_update(db: Session, project_id: str, update: UpdateCreate) ->
         created_at=int(db_update.created_at.timestamp()) if db_update.created_at else None
     ) if db_update else None
 
-def get_project_updates(db: Session, project_id: str) -> List[ProjectUpdateResponse]:
-       updates = db.query(ProjectUpdate)\
-           .options(joinedload(ProjectUpdate.posted_by))\
-           .filter(ProjectUpdate.project_id == project_id)\
-           .order_by(ProjectUpdate.created_at.desc())\
-           .all()
+def get_project_updates(
+    db: Session,
+    project_id: str,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_UPDATE_PAGE_SIZE,
+    summary: bool = False
+) -> Tuple[List[ProjectUpdateResponse], Optional[str]]:
+    """One page of project updates, newest first, and the cursor of the next page, if any."""
+    query = db.query(ProjectUpdate)\
+        .options(joinedload(ProjectUpdate.posted_by))\
+        .filter(ProjectUpdate.project_id == project_id)
+    updates, next_cursor = _page_updates(query, ProjectUpdate, cursor, limit, summary)
 
-       return [ProjectUpdateResponse(
-           update_id=update.update_id,
-           project_id=update.project_id,
-           content=update.content,
-           created_by=UserDTO(
-               user_id=update.posted_by.user_id,
-               email=update.posted_by.email,
-               name=update.posted_by.name,
-               role=update.posted_by.role,
-               picture=update.posted_by.picture
-           ),
-           current_status=update.current_status,
-           created_at=int(update.created_at.timestamp()) if update.created_at else None,
-       ) for update in updates] if updates else []
+    return [ProjectUpdateResponse(
+        update_id=update.update_id,
+        project_id=update.project_id,
+        created_by=user_dto(update.posted_by),
+        current_status=update.current_status,
+        created_at=int(update.created_at.timestamp()) if update.created_at else None,
+        **content_fields
+    ) for update, content_fields in updates], next_cursor
 
 def create_initiative_update(db: Session, initiative_id: str, update: UpdateCreate) -> InitiativeUpdateResponse:
     db_update = InitiativeUpdate(
@@ -62,9 +72,11 @@ def create_initiative_update(db: Session, initiative_id: str, update: UpdateCrea
         current_status=update.current_status
     )
     db.add(db_update)
+    workspace = db.query(Initiative.workspace_id).filter(Initiative.initiative_id == initiative_id).first()
+    emit_change(db, workspace.workspace_id if workspace else None, "initiative_update", "created", db_update.update_id, initiative_id=initiative_id)
     db.commit()
     db.refresh(db_update)
-    posted_by = db.query(User).filter(User.user_id == update.created_by).first()
+    posted_by = user_loader(db).get(update.created_by)
     return InitiativeUpdateResponse(
         update_id=db_update.update_id,
         initiative_id=db_update.initiative_id,
@@ -80,22 +92,50 @@ def create_initiative_update(db: Session, initiative_id: str, update: UpdateCrea
         created_at=int(db_update.created_at.timestamp()) if db_update.created_at else None,
     ) if db_update else None
 
-def get_initiative_updates(db: Session, initiative_id: str) -> List[InitiativeUpdateResponse]:
-    updates = db.query(InitiativeUpdate)\
-        .filter(InitiativeUpdate.initiative_id == initiative_id)\
-        .order_by(InitiativeUpdate.created_at.desc())\
-        .all()
+def get_initiative_updates(
+    db: Session,
+    initiative_id: str,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_UPDATE_PAGE_SIZE,
+    summary: bool = False
+) -> Tuple[List[InitiativeUpdateResponse], Optional[str]]:
+    """One page of initiative updates, newest first, and the cursor of the next page, if any."""
+    query = db.query(InitiativeUpdate)\
+        .options(joinedload(InitiativeUpdate.posted_by))\
+        .filter(InitiativeUpdate.initiative_id == initiative_id)
+    updates, next_cursor = _page_updates(query, InitiativeUpdate, cursor, limit, summary)
+
     return [InitiativeUpdateResponse(
         update_id=update.update_id,
         initiative_id=update.initiative_id,
-        content=update.content,
-        created_by=UserDTO(
-            user_id=update.posted_by.user_id,
-            email=update.posted_by.email,
-            name = update.posted_by.name,   
-            role=update.posted_by.role,
-            picture=update.posted_by.picture
-        ),
+        created_by=user_dto(update.posted_by),
         current_status=update.current_status,
         created_at=int(update.created_at.timestamp()) if update.created_at else None,
-    ) for update in updates] if updates else []
+        **content_fields
+    ) for update, content_fields in updates], next_cursor
+
+
+def _page_updates(query, model, cursor: Optional[str], limit: int, summary: bool):
+    """Apply (created_at, update_id) keyset pagination, newest first.
+
+    Returns ([(row, content fields)], next_cursor). In summary mode the JSONB content column is
+    deferred and only the plain text needed for the preview is selected.
+    """
+    position = decode_cursor(cursor)
+    if position:
+        query = query.filter(tuple_(model.created_at, model.update_id) < tuple_(*position))
+    if summary:
+        query = query.options(defer(model.content)).add_columns(content_text_sql(model.content))
+    query = query.order_by(model.created_at.desc(), model.update_id.desc())
+    rows = query.limit(limit + 1).all()
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if summary:
+        entries = [(update, {"preview": content_preview(plain_text)}) for update, plain_text in rows]
+    else:
+        entries = [(update, {"content": update.content}) for update in rows]
+    last = entries[-1][0] if entries else None
+    next_cursor = encode_cursor(last.created_at, last.update_id) if has_more and last and last.created_at else None
+    return entries, next_cursor
+
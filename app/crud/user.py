@@ -7,6 +7,8 @@ from datetime import datetime
 from fastapi import HTTPException
 from typing import Optional, List
 from app.models.workspace import WorkspaceMember
+from app.crud.loaders import user_loader
+from app.services.principal_cache import invalidate_principal
 
 
 def create_user(db: Session, user: UserCreate) -> UserResponse:
@@ -115,6 +117,8 @@ def create_or_update_user(db: Session, user_data: UserAuth):
     
     db.commit()
     db.refresh(db_user)
+    user_loader(db).invalidate([db_user.user_id])
+    invalidate_principal([db_user.user_id])
     return db_user
 
 def get_user_by_id(db: Session, user_id: str) -> UserResponse:
@@ -141,4 +145,6 @@ def set_user_workspace_id(db: Session, user_id: str, workspace_id: str) -> None:
     if not db_user:
         return
     db_user.workspace_id = workspace_id
-    db.commit()
\ No newline at end of file
+    db.commit()
+    user_loader(db).invalidate([user_id])
+    invalidate_principal([user_id])
\ No newline at end of file
@@ -2,6 +2,7 @@ from sqlalchemy.orm import Session
 from app.models.workspace import Workspace
 from app.schemas.workspace import WorkspaceCreate, WorkspaceResponse, WorkspaceUpdate, WorkspaceMemberRoleUpdate, WorkspaceMemberRoleResponse, WorkspaceMemberDetailsResponse
 from typing import List, Optional
+from app.services.principal_cache import invalidate_principal
 
 def create_workspace(db: Session, workspace: WorkspaceCreate, tenant_id: str, created_by: str) -> WorkspaceResponse:
     """Create a new workspace."""
@@ -41,6 +42,7 @@ def create_workspace(db: Session, workspace: WorkspaceCreate, tenant_id: str, cr
                 # Also set the creator's active workspace to the newly created one
                 creator.workspace_id = db_workspace.workspace_id
                 db.commit()
+                invalidate_principal([created_by])
     except Exception:
         # Non-fatal: if membership insert fails in testing (e.g. missing user), continue
         db.rollback()
@@ -115,6 +117,7 @@ def update_workspace_member_role(db: Session, workspace_id: str, payload: Worksp
 
     membership.role = payload.role
     db.commit()
+    invalidate_principal([payload.user_id])
     db.refresh(membership)
     return WorkspaceMemberRoleResponse(user_id=membership.user_id, role=membership.role)
 
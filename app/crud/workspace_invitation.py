@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, func, insert, literal
 from fastapi import HTTPException
 from app.models.workspace_invitation import WorkspaceInvitation
 from app.models.workspace import Workspace, WorkspaceMember
@@ -12,6 +12,7 @@ from datetime import datetime, timedelta, timezone
 import secrets
 import hashlib
 from typing import List, Optional
+from app.services.principal_cache import invalidate_principal
 
 
 def generate_magic_token() -> str:
@@ -86,6 +87,90 @@ def create_workspace_invitation_with_token(
     }
 
 
+def create_workspace_invitations_bulk(
+    db: Session,
+    workspace_id: str,
+    invitations: List[WorkspaceInvitationCreate],
+    invited_by: str
+) -> List[dict]:
+    """Create invitations for many addresses at once.
+
+    Existing members and pending (unaccepted, unexpired) invitations are found with one query,
+    and all new invitations are inserted with one multi-row INSERT. Returns one dict per requested
+    address, in request order, with its status and, for new invitations, the invitation row and
+    magic token.
+    """
+    workspace = db.query(Workspace).filter(Workspace.workspace_id == workspace_id).first()
+    if not workspace:
+        raise HTTPException(status_code=404, detail="Workspace not found")
+
+    emails = {invitation.email.lower() for invitation in invitations}
+    members = db.query(func.lower(User.email), literal("already_member"))\
+        .join(WorkspaceMember, WorkspaceMember.user_id == User.user_id)\
+        .filter(WorkspaceMember.workspace_id == workspace_id, func.lower(User.email).in_(emails))
+    pending = db.query(func.lower(WorkspaceInvitation.email), literal("already_invited"))\
+        .filter(
+            WorkspaceInvitation.workspace_id == workspace_id,
+            WorkspaceInvitation.is_accepted == False,
+            WorkspaceInvitation.expires_at > datetime.now(timezone.utc),
+            func.lower(WorkspaceInvitation.email).in_(emails),
+        )
+    existing = {}
+    for email, status in members.union_all(pending).all():
+        if status == "already_member" or email not in existing:  # membership wins over a stale invitation
+            existing[email] = status
+
+    expires_at = datetime.now(timezone.utc) + timedelta(days=7)  # 7 days expiry
+    timestamp = int(datetime.now(timezone.utc).timestamp())
+    results = []
+    rows = []
+    seen = set()
+    for invitation in invitations:
+        key = invitation.email.lower()
+        if key in existing:
+            results.append({"email": invitation.email, "status": existing[key]})
+            continue
+        if key in seen:
+            results.append({"email": invitation.email, "status": "duplicate"})
+            continue
+        seen.add(key)
+        row = {
+            "invitation_id": f"INV-{generate_custom_id(invitation.email)}-{timestamp}",
+            "workspace_id": workspace_id,
+            "email": invitation.email,
+            "invited_by": invited_by if invited_by != "system" else None,
+            "role": invitation.role,
+            "magic_token": generate_magic_token(),
+            "is_accepted": False,
+            "expires_at": expires_at,
+        }
+        rows.append(row)
+        results.append({"email": invitation.email, "status": "created", "row": row})
+
+    if rows:
+        created_at = dict(db.execute(
+            insert(WorkspaceInvitation).values(rows)
+            .returning(WorkspaceInvitation.invitation_id, WorkspaceInvitation.created_at)
+        ).all())
+        db.commit()
+        for result in results:
+            row = result.pop("row", None)
+            if row is None:
+                continue
+            result["magic_token"] = row["magic_token"]
+            result["invitation"] = WorkspaceInvitationResponse(
+                invitation_id=row["invitation_id"],
+                workspace_id=workspace_id,
+                email=row["email"],
+                invited_by=row["invited_by"],
+                role=row["role"],
+                is_accepted=False,
+                expires_at=int(expires_at.timestamp()),
+                created_at=int(created_at[row["invitation_id"]].timestamp()),
+            )
+    return results
+
+
 def create_workspace_invitation(
     db: Session, 
     workspace_id: str, 
@@ -253,6 +338,7 @@ def accept_workspace_invitation(
     invitation.accepted_at = datetime.now(timezone.utc)
     
     db.commit()
+    invalidate_principal([user.user_id])
     
     return {
         "message": "Successfully joined workspace",
@@ -126,6 +126,10 @@ class InitiativeUpdateDTO(BaseModel):
     content: Dict[str, Any]
     current_status: Optional[str] = None
 
+class ReactionCountDTO(BaseModel):
+    reaction_type: str
+    count: int
+
 class DependencyInitiativeDTO(BaseModel):
     initiative_id: str
     title: str
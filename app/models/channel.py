@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, Integer, Text, ForeignKey
+from sqlalchemy import Column, String, Boolean, Integer, Text, ForeignKey, false
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
@@ -18,6 +18,8 @@ class Channel(Base):
     num_members = Column(Integer)  # Number of members
     team_id = Column(String, ForeignKey('teams.team_id'), nullable=True)  # Team ID (context_team_id)
     workspace_id = Column(String, ForeignKey('workspaces.workspace_id'), nullable=False)  # Foreign key reference to workspaces
+    digest_enabled = Column(Boolean, nullable=False, default=False, server_default=false())  # Batch updates into scheduled digest posts
+    digest_window_minutes = Column(Integer, nullable=False, default=60, server_default="60")  # How long updates accumulate before a digest goes out
 
     # You can add relationships if needed 
     team = relationship("Team", back_populates="channels")  # Update relationship 
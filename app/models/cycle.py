@@ -37,7 +37,7 @@ class Cycle(Base):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         if not self.id:
-            self.id = generate_id(kwargs.get('name', ''))
+            self.id = generate_id("CYC", kwargs.get('name', ''))
 
 
 class TeamCycleSequence(Base):
@@ -1,8 +1,8 @@
-from sqlalchemy import Column, String, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, String, TIMESTAMP, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from app.core.utils import generate_id
+from app.core.utils import generate_ulid
 from app.db.base import Base
 
 class CycleUpdate(Base):
@@ -18,10 +18,14 @@ class CycleUpdate(Base):
     posted_by = relationship("User", foreign_keys=[created_by])
     updated_by_user = relationship("User", foreign_keys=[updated_by])
 
+    __table_args__ = (
+        Index("ix_cycle_updates_feed", "cycle_id", "created_at", "id"),
+    )
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         if not self.id:
-            self.id = generate_id("CU")
+            self.id = f"CU-{generate_ulid()}"
 
     def update(self, **kwargs):
         """Update cycle update attributes with provided values."""
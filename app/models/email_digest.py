@@ -0,0 +1,12 @@
+from sqlalchemy import Column, String, TIMESTAMP, ForeignKey
+from sqlalchemy.sql import func
+from app.db.base import Base
+
+
+class EmailDigestSubscription(Base):
+    """A user who gets the daily "what changed in my projects" email."""
+    __tablename__ = "email_digest_subscriptions"
+
+    user_id = Column(String, ForeignKey('users.user_id', ondelete='CASCADE'), primary_key=True)
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+    last_sent_at = Column(TIMESTAMP(timezone=True), nullable=True)  # The next digest covers changes after this
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON, Index
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Index
 from sqlalchemy.sql import func
 from app.db.base import Base
 
@@ -13,9 +13,9 @@ class GitLink(Base):
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
 
     # Your local app identifiers
+    # No FK: the issue may have moved to issues_archive; delete_issue removes links explicitly
     local_issue_id = Column(
         String,
-        ForeignKey("issues.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
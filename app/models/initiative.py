@@ -40,7 +40,7 @@ class Initiative(Base):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         if not self.initiative_id:
-            self.initiative_id = generate_custom_id(kwargs.get('title', ''))
+            self.initiative_id = f"INI-{generate_custom_id(kwargs.get('title', ''))}"
 
     def update(self, **kwargs):
         """Update initiative attributes with provided values."""
@@ -1,9 +1,8 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index, Integer
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db.base import Base
-import random
-import string
+from app.core.utils import generate_ulid
 from sqlalchemy.dialects.postgresql import TIMESTAMP
 
 def generate_comment_id(content: str) -> str:
@@ -11,11 +10,8 @@ def generate_comment_id(content: str) -> str:
     words = content.split()
     initials = ''.join(word[0].upper() for word in words if word)[:3]
     
-    # Generate 10 character alphanumeric string
-    alphanumeric = ''.join(random.choices(string.ascii_uppercase + string.digits, k=10))
-    
-    # Combine with a hyphen
-    return f"{initials}-{alphanumeric}"
+    # Constant prefix, then the time-ordered ULID: inserts stay at the end of the index
+    return f"comm-{generate_ulid()}-{initials}" if initials else f"comm-{generate_ulid()}"
 
 class InitiativeComment(Base):
     __tablename__ = "initiative_comments"
@@ -27,6 +23,11 @@ class InitiativeComment(Base):
     update_id = Column(String, ForeignKey("initiative_updates.update_id"))
 
     created_by_user = relationship("User", foreign_keys=[created_by])
+
+    __table_args__ = (
+        Index("ix_initiative_comments_feed", "update_id", "created_at"),
+    )
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         if not self.comment_id:
@@ -43,11 +44,8 @@ def generate_reaction_id(reaction: str = 'Reaction') -> str:
     words = reaction.split()
     initials = ''.join(word[0].upper() for word in words if word)[:3]
     
-    # Generate 10 character alphanumeric string
-    alphanumeric = ''.join(random.choices(string.ascii_uppercase + string.digits, k=10))
-    
-    # Combine with a hyphen
-    return f"{initials}-{alphanumeric}"
+    # Constant prefix, then the time-ordered ULID: inserts stay at the end of the index
+    return f"rxn-{generate_ulid()}-{initials}" if initials else f"rxn-{generate_ulid()}"
 
 class InitiativeReaction(Base):
     __tablename__ = "initiative_reactions"
@@ -59,6 +57,10 @@ class InitiativeReaction(Base):
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
     reacted_by_user = relationship("User", foreign_keys=[reacted_by])
+
+    __table_args__ = (
+        Index("uq_initiative_reactions_user_type", "update_id", "reacted_by", "reaction_type", unique=True),
+    )
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -71,3 +73,11 @@ class InitiativeReaction(Base):
             if hasattr(self, key):
                 setattr(self, key, value)
         return self
+
+class InitiativeReactionCount(Base):
+    """Denormalized per-type reaction totals, kept in step with initiative_reactions on every toggle."""
+    __tablename__ = "initiative_reaction_counts"
+
+    update_id = Column(String, ForeignKey("initiative_updates.update_id", ondelete="CASCADE"), primary_key=True)
+    reaction_type = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
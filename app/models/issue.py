@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, String, Text, Integer, ForeignKey
+from sqlalchemy import Column, String, Text, Integer, ForeignKey, Index, Boolean, false, true, text
 from sqlalchemy.orm import relationship
 from ..db.base import Base
 from app.core.utils import generate_id, generate_alphanumeric_id
@@ -43,7 +43,7 @@ class Issue(Base):
     team_id = Column(String, ForeignKey("teams.team_id"), nullable=True)
     
     # Archiving fields
-    is_archived = Column(String, default="false")  # "true" or "false" as string for consistency
+    is_archived = Column(Boolean, nullable=False, default=False, server_default=false())
     archived_at = Column(TIMESTAMP(timezone=True), nullable=True)
     archived_by = Column(String, ForeignKey("users.user_id"), nullable=True)
     archive_reason = Column(Text, nullable=True)  # Optional reason for archiving
@@ -61,10 +61,22 @@ class Issue(Base):
     issue_labels = relationship("IssueLabel", back_populates="issue", lazy="joined", overlaps="labels")
     # epic = relationship("Epic", backref="issues")  # Commented out since Epic model doesn't exist
 
+    __table_args__ = (
+        # Active-issue listings filter on NOT is_archived, so these partial indexes never hold archived rows
+        Index("ix_issues_active_team_status_created", "team_id", "status", "created_at", postgresql_where=text("NOT is_archived")),
+        Index("ix_issues_active_team_created", "team_id", "created_at", postgresql_where=text("NOT is_archived")),
+        Index("ix_issues_active_cycle", "cycle_id", postgresql_where=text("NOT is_archived")),
+        Index("ix_issues_team_created", "team_id", "created_at"),  # include_archived listings
+        Index("ix_issues_assignee_created", "assignee", "created_at"),
+        # The archiver picks archived issues by archived_at and skips those that still have sub-issues
+        Index("ix_issues_archived_at", "archived_at", postgresql_where=text("is_archived")),
+        Index("ix_issues_parent", "parent_issue_id"),
+    )
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         if not self.id:
-            self.id = generate_id(kwargs.get('title', ''))
+            self.id = generate_id("ISS", kwargs.get('title', ''))
 
     def update(self, **kwargs):
         """Update project attributes with provided values."""
@@ -74,6 +86,45 @@ class Issue(Base):
         return self
 
 
+class IssueArchive(Base):
+    """Cold tier for issues archived longer than ISSUE_ARCHIVE_AFTER_DAYS.
+
+    Same columns as Issue (rows are moved over by app.services.issue_archiver in batches) plus the
+    issue's labels, so it can be restored exactly. No foreign keys: referenced rows may go away
+    while the issue sits here, and restore_archived_issue checks what it brings back.
+    """
+    __tablename__ = "issues_archive"
+    id = Column(String, primary_key=True)
+    display_id = Column(String, nullable=False)
+    title = Column(String(200), nullable=False)
+    description = Column(JSONB, nullable=True)
+    acceptance_criteria = Column(JSONB, nullable=True)
+    status = Column(String(20))
+    priority = Column(String(20))
+    issue_type = Column(String(20))
+    created_at = Column(TIMESTAMP(timezone=True))
+    updated_at = Column(TIMESTAMP(timezone=True))
+    start_date = Column(TIMESTAMP(timezone=True), nullable=True)
+    due_date = Column(TIMESTAMP(timezone=True), nullable=True)
+    parent_issue_id = Column(String, nullable=True)
+    story_points = Column(Integer, nullable=True)
+    cycle_id = Column(String, nullable=True)
+    created_by = Column(String, nullable=False)
+    updated_by = Column(String, nullable=True)
+    assignee = Column(String, nullable=True)
+    team_id = Column(String, nullable=True)
+    is_archived = Column(Boolean, nullable=False, default=True, server_default=true())
+    archived_at = Column(TIMESTAMP(timezone=True), nullable=True)
+    archived_by = Column(String, nullable=True)
+    archive_reason = Column(Text, nullable=True)
+    issue_labels = Column(JSONB, nullable=False, server_default=text("'[]'::jsonb"))  # [{label_id, created_by, created_at}]
+    moved_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_issues_archive_team_created", "team_id", "created_at"),  # list_issues(include_archived=True)
+    )
+
+
 class TeamIssueSequence(Base):
     __tablename__ = 'team_issue_sequences'
 
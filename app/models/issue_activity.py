@@ -2,7 +2,7 @@ from sqlalchemy import Column, String, ForeignKey, TIMESTAMP, JSON
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db.base import Base
-from app.core.utils import generate_id, generate_alphanumeric_id
+from app.core.utils import generate_ulid
 
 class IssueActivity(Base):
     """
@@ -16,7 +16,7 @@ class IssueActivity(Base):
     __tablename__ = "issue_activities"
     
     id = Column(String, primary_key=True)
-    issue_id = Column(String, ForeignKey("issues.id"), nullable=False, index=True)
+    issue_id = Column(String, nullable=False, index=True)  # No FK: the issue may have moved to issues_archive
     user_id = Column(String, ForeignKey("users.user_id"), nullable=False)
     activity_type = Column(String, nullable=False)  # STATUS_CHANGE, ASSIGNEE_CHANGE, LABEL_ADDED, etc.
     old_value = Column(JSON, nullable=True)  # Store previous value if applicable
@@ -24,11 +24,11 @@ class IssueActivity(Base):
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), index=True)
     
     # Relationships
-    issue = relationship("Issue", backref="activities")
+    issue = relationship("Issue", primaryjoin="foreign(IssueActivity.issue_id) == Issue.id", backref="activities")
     user = relationship("User", foreign_keys=[user_id])
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         if not self.id:
-            self.id = f"act-{generate_alphanumeric_id()}"
+            self.id = f"act-{generate_ulid()}"
 
@@ -1,28 +1,33 @@
-from sqlalchemy import Column, String, ForeignKey
+from sqlalchemy import Column, String, ForeignKey, Index, Integer
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 from sqlalchemy.dialects.postgresql import TIMESTAMP
-from app.core.utils import generate_alphanumeric_id
+from app.core.utils import generate_ulid
 
 class IssueComment(Base):
     __tablename__ = "issue_comments"
     
-    id = Column(String, primary_key=True, default=lambda: f"comm-{generate_alphanumeric_id()}")
+    id = Column(String, primary_key=True, default=lambda: f"comm-{generate_ulid()}")
     parent_comment_id = Column(String, ForeignKey("issue_comments.id"), nullable=True)
     content = Column(String, nullable=False)
     created_by = Column(String, ForeignKey("users.user_id"), nullable=False)
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
     updated_at = Column(TIMESTAMP(timezone=True), nullable=True)
-    issue_id = Column(String, ForeignKey("issues.id"))
+    issue_id = Column(String)  # No FK: the issue may have moved to issues_archive
 
     created_by_user = relationship("User", foreign_keys=[created_by])
     replies = relationship("IssueComment", backref="parent_comment", remote_side=[id])
 
+    __table_args__ = (
+        # Keyset pagination over one thread level: top-level comments or replies of a parent
+        Index("ix_issue_comments_thread", "issue_id", "parent_comment_id", "created_at", "id"),
+    )
+
 class CommentReaction(Base):
     __tablename__ = "comment_reactions"
     
-    id = Column(String, primary_key=True, default=lambda: f"rxn-{generate_alphanumeric_id()}")
+    id = Column(String, primary_key=True, default=lambda: f"rxn-{generate_ulid()}")
     comment_id = Column(String, ForeignKey("issue_comments.id"), nullable=False)
     created_by = Column(String, ForeignKey("users.user_id"), nullable=False)
     reaction_type = Column(String)
@@ -31,3 +36,15 @@ class CommentReaction(Base):
 
     created_by_user = relationship("User", foreign_keys=[created_by])
 
+    __table_args__ = (
+        # One reaction of a given type per user per comment; also serves lookups by comment_id
+        Index("uq_comment_reactions_user_type", "comment_id", "created_by", "reaction_type", unique=True),
+    )
+
+class CommentReactionCount(Base):
+    """Denormalized per-type reaction totals, kept in step with comment_reactions on every toggle."""
+    __tablename__ = "comment_reaction_counts"
+
+    comment_id = Column(String, ForeignKey("issue_comments.id", ondelete="CASCADE"), primary_key=True)
+    reaction_type = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
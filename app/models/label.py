@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, TIMESTAMP, func, ForeignKey
+from sqlalchemy import Column, String, Text, TIMESTAMP, func, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.core.utils import generate_id
 from app.db.base import Base 
@@ -24,7 +24,7 @@ class Label(Base):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         if not self.id:
-            self.id = generate_id(kwargs.get('name', ''))
+            self.id = generate_id("LBL", kwargs.get('name', ''))
 
 
 class IssueLabel(Base):
@@ -42,3 +42,7 @@ class IssueLabel(Base):
     issue = relationship("Issue", back_populates="issue_labels", foreign_keys=[issue_id], overlaps="issues,labels")
     label = relationship("Label", back_populates="issue_labels", foreign_keys=[label_id], overlaps="issues,labels")
 
+    __table_args__ = (
+        Index("ix_issue_labels_label", "label_id"),  # The primary key leads with issue_id; eager label loads join on label_id
+    )
+
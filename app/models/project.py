@@ -1,6 +1,4 @@
 import enum
-import random
-import string
 from sqlalchemy import Column, String, Text, Enum, Integer, Date, TIMESTAMP, func, CheckConstraint, ForeignKey, JSON
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from app.db.base import Base
@@ -25,10 +23,7 @@ class StageEnum(str, enum.Enum):
     Delivered = "Delivered"
 
 def generate_project_id(title: str) -> str:
-    words = title.split()
-    initials = ''.join(word[0].upper() for word in words if word.isalnum())[:3]
-    alphanumeric = ''.join(random.choices(string.ascii_uppercase + string.digits, k=10))
-    return f"{initials}-{alphanumeric}"
+    return f"PRJ-{generate_custom_id(title)}"
 
 
 class Project(Base):
@@ -60,7 +55,7 @@ class Project(Base):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         if not self.project_id:
-            self.project_id = generate_custom_id(kwargs.get('title', ''))
+            self.project_id = generate_project_id(kwargs.get('title', ''))
 
     def update(self, **kwargs):
         """Update project attributes with provided values."""
@@ -88,7 +83,7 @@ class Milestone(Base):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         if not self.milestone_id:
-            self.milestone_id = generate_custom_id(kwargs.get('title', ''))
+            self.milestone_id = f"MIL-{generate_custom_id(kwargs.get('title', ''))}"
 
     def update(self, **kwargs):
         """Update milestone attributes with provided values."""
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index, Integer
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db.base import Base
@@ -15,6 +15,10 @@ class ProjectComment(Base):
 
     created_by_user = relationship("User", foreign_keys=[created_by])
 
+    __table_args__ = (
+        Index("ix_project_comments_feed", "update_id", "created_at"),
+    )
+
 class ProjectReaction(Base):
     __tablename__ = "project_reactions"
     
@@ -25,3 +29,15 @@ class ProjectReaction(Base):
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
     reacted_by_user = relationship("User", foreign_keys=[reacted_by])
+
+    __table_args__ = (
+        Index("uq_project_reactions_user_type", "update_id", "reacted_by", "reaction_type", unique=True),
+    )
+
+class ProjectReactionCount(Base):
+    """Denormalized per-type reaction totals, kept in step with project_reactions on every toggle."""
+    __tablename__ = "project_reaction_counts"
+
+    update_id = Column(String, ForeignKey("project_updates.update_id", ondelete="CASCADE"), primary_key=True)
+    reaction_type = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
@@ -1,9 +1,10 @@
-from sqlalchemy import Table, Column, String, ForeignKey
+from sqlalchemy import Table, Column, String, ForeignKey, Index
 from app.db.base import Base
 
 project_teams = Table(
     "project_teams",
     Base.metadata,
     Column("project_id", String, ForeignKey("projects.project_id"), primary_key=True),
-    Column("team_id", String, ForeignKey("teams.team_id"), primary_key=True)
+    Column("team_id", String, ForeignKey("teams.team_id"), primary_key=True),
+    Index("ix_project_teams_team", "team_id"),
 ) 
\ No newline at end of file
@@ -1,12 +1,10 @@
-import random
-import string
 from sqlalchemy import Column, String, Text, TIMESTAMP, ForeignKey, func, Boolean
 from sqlalchemy.orm import relationship
 from app.db.base import Base
+from app.core.utils import generate_ulid
 
 def generate_resource_id() -> str:
-    alphanumeric = ''.join(random.choices(string.ascii_uppercase + string.digits, k=10))
-    return f"RES-{alphanumeric}"
+    return f"RES-{generate_ulid()}"
 
 class ProjectResource(Base):
     __tablename__ = "project_resources"
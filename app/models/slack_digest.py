@@ -0,0 +1,27 @@
+from sqlalchemy import Column, String, Integer, TIMESTAMP, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+from app.core.utils import generate_ulid
+from app.db.base import Base
+
+
+class SlackDigestItem(Base):
+    """An update waiting to go out in the next digest post of a channel that has digest mode on."""
+    __tablename__ = "slack_digest_items"
+
+    id = Column(String, primary_key=True)
+    channel_id = Column(String, ForeignKey('channels.channel_id', ondelete='CASCADE'), nullable=False)
+    tenant_id = Column(String, ForeignKey('tenants.tenant_id', ondelete='CASCADE'), nullable=False)
+    message_data = Column(JSONB, nullable=False)  # Same shape UIUpdateToSlackMessage.transform takes
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")  # Failed posts so far
+    next_attempt_at = Column(TIMESTAMP(timezone=True), nullable=True)  # Backoff after a failed post; due when NULL
+
+    __table_args__ = (
+        Index("ix_slack_digest_items_channel", "channel_id", "created_at"),
+    )
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if not self.id:
+            self.id = f"SDI-{generate_ulid()}"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, TIMESTAMP, Integer, Text
+from sqlalchemy import Column, String, ForeignKey, TIMESTAMP, Integer, Text, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base import Base
@@ -38,3 +38,7 @@ class TeamMember(Base):
 
     team = relationship("Team", back_populates="members")
     user = relationship("User")
+
+    __table_args__ = (
+        Index("ix_team_members_user", "user_id"),  # The primary key leads with team_id
+    )
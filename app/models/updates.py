@@ -1,12 +1,10 @@
-import random
-import string
-from sqlalchemy import Column, String, TIMESTAMP, ForeignKey, func
+from sqlalchemy import Column, String, TIMESTAMP, ForeignKey, Index, func
 from sqlalchemy.dialects.postgresql import JSONB
 from app.db.base import Base
 from sqlalchemy.orm import relationship
+from app.core.utils import generate_ulid
 def generate_update_id(prefix: str) -> str:
-    alphanumeric = ''.join(random.choices(string.ascii_uppercase + string.digits, k=10))
-    return f"{prefix}-{alphanumeric}"
+    return f"{prefix}-{generate_ulid()}"
 
 class ProjectUpdate(Base):
     __tablename__ = "project_updates"
@@ -19,6 +17,10 @@ class ProjectUpdate(Base):
 
     posted_by = relationship("User", foreign_keys=[created_by])
 
+    __table_args__ = (
+        Index("ix_project_updates_feed", "project_id", "created_at", "update_id"),
+    )
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         if not self.update_id:
@@ -42,6 +44,10 @@ class InitiativeUpdate(Base):
     
     posted_by = relationship("User")
 
+    __table_args__ = (
+        Index("ix_initiative_updates_feed", "initiative_id", "created_at", "update_id"),
+    )
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         if not self.update_id:
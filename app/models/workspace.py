@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, TIMESTAMP, ForeignKey, Text
+from sqlalchemy import Column, String, TIMESTAMP, ForeignKey, Text, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db.base import Base
@@ -45,3 +45,7 @@ class WorkspaceMember(Base):
     joined_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
     workspace = relationship("Workspace", back_populates="members")
+
+    __table_args__ = (
+        Index("ix_workspace_members_user", "user_id"),  # The primary key leads with workspace_id
+    )
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List
 
 
@@ -16,6 +16,13 @@ class ChannelSchema(BaseModel):
     num_members: Optional[int] = None
     team_id: Optional[str] = None
     workspace_id: str
+    digest_enabled: Optional[bool] = None
+    digest_window_minutes: Optional[int] = None
 
 class ChannelResponse(ChannelSchema):
-    pass
\ No newline at end of file
+    pass
+
+class ChannelDigestSettings(BaseModel):
+    """Digest mode of a channel: updates are batched and posted once per window instead of one by one"""
+    enabled: bool
+    window_minutes: int = Field(60, ge=5, le=1440)
\ No newline at end of file
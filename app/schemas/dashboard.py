@@ -0,0 +1,68 @@
+from pydantic import BaseModel
+from typing import Optional, Dict, Any, List
+from app.dto.dtos import UserDTO, TeamDTO, ProjectUpdateDTO, InitiativeUpdateDTO
+from app.schemas.health import InitiativeHealthSummary, ProjectHealthSummary
+
+# Fields a client can request through the dashboard field mask. The id fields are always returned.
+DASHBOARD_FIELDS = {
+    "title",
+    "short_description",
+    "description",
+    "status",
+    "progress",
+    "priority",
+    "start_date",
+    "end_date",
+    "created_at",
+    "last_updated",
+    "owner",
+    "dri",
+    "teams",
+    "health",
+    "latest_update",
+}
+
+# Returned when no mask is given; rich-text descriptions are opt-in because they dominate the payload.
+DEFAULT_DASHBOARD_FIELDS = DASHBOARD_FIELDS - {"description"}
+
+class DashboardProject(BaseModel):
+    project_id: str
+    initiative_id: Optional[str] = None
+    title: Optional[str] = None
+    short_description: Optional[str] = None
+    description: Optional[Dict[str, Any]] = None
+    status: Optional[str] = None
+    progress: Optional[int] = None
+    priority: Optional[str] = None
+    start_date: Optional[int] = None
+    end_date: Optional[int] = None
+    created_at: Optional[int] = None
+    last_updated: Optional[int] = None
+    dri: Optional[UserDTO] = None
+    teams: Optional[List[TeamDTO]] = None
+    health: Optional[ProjectHealthSummary] = None
+    latest_update: Optional[ProjectUpdateDTO] = None
+
+class DashboardInitiative(BaseModel):
+    initiative_id: str
+    title: Optional[str] = None
+    short_description: Optional[str] = None
+    description: Optional[Dict[str, Any]] = None
+    status: Optional[str] = None
+    progress: Optional[int] = None
+    priority: Optional[str] = None
+    start_date: Optional[int] = None
+    end_date: Optional[int] = None
+    created_at: Optional[int] = None
+    last_updated: Optional[int] = None
+    owner: Optional[UserDTO] = None
+    teams: Optional[List[TeamDTO]] = None
+    health: Optional[InitiativeHealthSummary] = None
+    latest_update: Optional[InitiativeUpdateDTO] = None
+    projects: List[DashboardProject] = []
+
+class WorkspaceDashboardResponse(BaseModel):
+    """Everything the workspace landing page needs in a single payload."""
+    workspace_id: str
+    initiatives: List[DashboardInitiative] = []
+    unassigned_projects: List[DashboardProject] = []
@@ -47,3 +47,20 @@ class ProjectDependencyResponse(BaseModel):
     created_by: UserDTO
     updated_by: Optional[UserDTO] = None
     description: Optional[str] = None
+
+class DependencyGraphNode(BaseModel):
+    id: str
+    title: Optional[str] = None
+    status: Optional[str] = None
+    end_date: Optional[int] = None
+    depth: Optional[int] = None  # Hops from the queried node; unset on critical paths
+
+class DependencyClosureResponse(BaseModel):
+    root_id: str
+    direction: str  # "upstream" | "downstream"
+    nodes: List[DependencyGraphNode]
+
+class CriticalPathResponse(BaseModel):
+    workspace_id: str
+    path: List[DependencyGraphNode]
+    finish_date: Optional[int] = None  # Latest end_date along the path
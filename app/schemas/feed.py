@@ -0,0 +1,28 @@
+from pydantic import BaseModel
+from typing import Optional, List
+from app.dto.dtos import UserDTO
+
+# Activity sources merged into the workspace feed
+FEED_ITEM_TYPES = {
+    "project_update",
+    "initiative_update",
+    "cycle_update",
+    "project_comment",
+    "initiative_comment",
+    "issue_comment",
+}
+
+class FeedItem(BaseModel):
+    item_type: str
+    item_id: str
+    created_at: Optional[int] = None
+    created_by: Optional[UserDTO] = None
+    parent_id: Optional[str] = None  # Project, initiative, cycle or issue the activity belongs to
+    parent_title: Optional[str] = None
+    update_id: Optional[str] = None  # Set for comments on project and initiative updates
+    preview: Optional[str] = None
+
+class WorkspaceFeedResponse(BaseModel):
+    workspace_id: str
+    items: List[FeedItem] = []
+    next_cursor: Optional[str] = None
@@ -1,7 +1,7 @@
 from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 from typing import Optional, List
-from app.dto.dtos import UserDTO
+from app.dto.dtos import UserDTO, ReactionCountDTO
 class InitiativeReactionBase(BaseModel):
     reaction_type: str
     reacted_by: str
@@ -44,3 +44,4 @@ class InitiativeReactionResponse(BaseModel):
 class InitiativeInteractionResponse(BaseModel):
     comments: List[InitiativeCommentResponse]
     reactions: List[InitiativeReactionResponse]
+    reaction_counts: List[ReactionCountDTO] = []  # Stored per-type totals, no recount on read
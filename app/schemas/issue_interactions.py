@@ -32,5 +32,6 @@ class IssueCommentResponse(BaseModel):
 
 class IssueInteractionResponse(BaseModel):
     comments: List[IssueCommentResponse]
+    next_cursor: Optional[str] = None  # Pass back as `cursor` to fetch the next page
 
 
@@ -1,7 +1,7 @@
 from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 from typing import List
-from app.dto.dtos import UserDTO
+from app.dto.dtos import UserDTO, ReactionCountDTO
 
 class ProjectReactionBase(BaseModel):
     reaction_type: str
@@ -45,5 +45,6 @@ class ProjectReactionResponse(BaseModel):
 class ProjectInteractionResponse(BaseModel):
     comments: List[ProjectCommentResponse]
     reactions: List[ProjectReactionResponse]
+    reaction_counts: List[ReactionCountDTO] = []  # Stored per-type totals, no recount on read
 
 ProjectCommentResponse.model_rebuild()
\ No newline at end of file
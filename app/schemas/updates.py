@@ -28,7 +28,21 @@ class InitiativeUpdate(Update):
 class ProjectUpdateResponse(ProjectUpdate):
     project_id: str
     created_by: UserDTO
+    content: Optional[Dict[str, Any]] = None  # Omitted in summary listings, see preview
+    preview: Optional[str] = None  # Plain-text excerpt of content, only set in summary listings
+    slack_results: Optional[Dict[str, Dict[str, Any]]] = None  # Per-channel Slack outcome, only set on create
 
 class InitiativeUpdateResponse(InitiativeUpdate):
     initiative_id: str
     created_by: UserDTO
+    content: Optional[Dict[str, Any]] = None  # Omitted in summary listings, see preview
+    preview: Optional[str] = None  # Plain-text excerpt of content, only set in summary listings
+    slack_results: Optional[Dict[str, Dict[str, Any]]] = None  # Per-channel Slack outcome, only set on create
+
+class ProjectUpdatePage(BaseModel):
+    updates: List[ProjectUpdateResponse]
+    next_cursor: Optional[str] = None  # Pass back as `cursor` to fetch the next page
+
+class InitiativeUpdatePage(BaseModel):
+    updates: List[InitiativeUpdateResponse]
+    next_cursor: Optional[str] = None  # Pass back as `cursor` to fetch the next page
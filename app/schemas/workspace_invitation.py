@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 from typing import Optional, List
 from datetime import datetime
 
@@ -9,6 +9,11 @@ class WorkspaceInvitationCreate(BaseModel):
     role: str = "Member"  # "Admin" | "Member"
 
 
+class WorkspaceInvitationBulkCreate(BaseModel):
+    """Schema for inviting many people to a workspace at once"""
+    invitations: List[WorkspaceInvitationCreate] = Field(..., min_length=1, max_length=500)
+
+
 class WorkspaceInvitationResponse(BaseModel):
     """Response model for workspace invitation details"""
     invitation_id: str
@@ -59,3 +64,19 @@ class WorkspaceInvitationLinkResponse(BaseModel):
     magic_link: str
     expires_at: int
     created_at: int
+
+
+class WorkspaceInvitationBulkResult(BaseModel):
+    """Outcome for one address of a bulk invitation"""
+    email: str
+    status: str  # "sent" | "email_failed" | "already_member" | "already_invited" | "duplicate"
+    invitation_id: Optional[str] = None
+    expires_at: Optional[int] = None
+
+
+class WorkspaceInvitationBulkResponse(BaseModel):
+    """Response model for bulk workspace invitations"""
+    workspace_id: str
+    results: List[WorkspaceInvitationBulkResult]
+    invited_count: int
+    skipped_count: int
@@ -0,0 +1,183 @@
+import asyncio
+import json
+import time
+from collections import defaultdict
+from typing import Any, Dict, Optional, Set
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from app.db.session import engine
+from app.models.teams import Team
+from app.models.cycle import Cycle
+
+CHANGE_CHANNEL = "workspace_changes"
+
+# Events buffered per client before it is considered too slow and told to resync
+CLIENT_QUEUE_SIZE = 100
+RECONNECT_DELAY_SECONDS = 5
+
+
+def emit_change(
+    db: Session,
+    workspace_id: Optional[str],
+    entity: str,
+    action: str,
+    entity_id: str,
+    **extra: Any
+) -> None:
+    """Queue a change event for the workspace stream inside the caller's transaction.
+
+    Postgres only delivers NOTIFY when the transaction commits, so call this before db.commit();
+    rolled back writes never reach subscribers.
+    """
+    if not workspace_id:
+        return
+    payload = {
+        "workspace_id": workspace_id,
+        "entity": entity,
+        "action": action,
+        "id": entity_id,
+        "at": int(time.time()),
+    }
+    payload.update({key: value for key, value in extra.items() if value is not None})
+    db.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": CHANGE_CHANNEL, "payload": json.dumps(payload, separators=(",", ":"))}
+    )
+
+
+def team_workspace_id(db: Session, team_id: Optional[str]) -> Optional[str]:
+    if not team_id:
+        return None
+    row = db.query(Team.workspace_id).filter(Team.team_id == team_id).first()
+    return row.workspace_id if row else None
+
+
+def cycle_workspace_id(db: Session, cycle_id: Optional[str]) -> Optional[str]:
+    if not cycle_id:
+        return None
+    row = db.query(Team.workspace_id)\
+        .join(Cycle, Cycle.team_id == Team.team_id)\
+        .filter(Cycle.id == cycle_id)\
+        .first()
+    return row.workspace_id if row else None
+
+
+class Subscriber:
+    def __init__(self, workspace_id: str):
+        self.workspace_id = workspace_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+
+    def offer(self, event: Dict[str, Any]) -> None:
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # The client fell behind: drop its backlog and ask it to refetch instead of
+            # growing memory without bound.
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait({"type": "resync", "workspace_id": self.workspace_id})
+
+
+class ChangeHub:
+    """Fans NOTIFY events out to the SSE subscribers of this worker.
+
+    Each worker holds a single LISTEN connection, registered with the event loop as a reader,
+    no matter how many clients are connected. The connection is opened in a worker thread so a
+    slow or unreachable database never blocks the loop.
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[str, Set[Subscriber]] = defaultdict(set)
+        self._connection = None
+        self._connecting: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def subscribe(self, workspace_id: str) -> Subscriber:
+        subscriber = Subscriber(workspace_id)
+        self._subscribers[workspace_id].add(subscriber)
+        try:
+            await self._ensure_listening()
+        except BaseException:
+            self.unsubscribe(subscriber)
+            raise
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        subscribers = self._subscribers.get(subscriber.workspace_id)
+        if subscribers is not None:
+            subscribers.discard(subscriber)
+            if not subscribers:
+                self._subscribers.pop(subscriber.workspace_id, None)
+
+    def close(self) -> None:
+        if self._connection is None:
+            return
+        try:
+            self._loop.remove_reader(self._connection.fileno())
+        except Exception:
+            pass
+        try:
+            self._connection.close()
+        except Exception:
+            pass
+        self._connection = None
+
+    async def _ensure_listening(self) -> None:
+        if self._connection is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        if self._connecting is None:
+            self._connecting = self._loop.create_task(self._listen())
+        # Shared by every subscriber waiting on it; one client going away must not cancel it
+        await asyncio.shield(self._connecting)
+
+    async def _listen(self) -> None:
+        try:
+            connection = await asyncio.to_thread(self._open_listener)
+            self._loop.add_reader(connection.fileno(), self._on_readable)
+            self._connection = connection
+        except Exception as e:
+            print(f"⚠️ Could not start change stream listener: {e}")
+            self._loop.call_later(RECONNECT_DELAY_SECONDS, self._reconnect)
+        finally:
+            self._connecting = None
+
+    @staticmethod
+    def _open_listener():
+        pooled = engine.raw_connection()
+        pooled.detach()  # Keep the pool from recycling a connection that must stay in LISTEN
+        connection = pooled.driver_connection
+        connection.autocommit = True
+        with connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {CHANGE_CHANNEL}")
+        return connection
+
+    def _reconnect(self) -> None:
+        if self._subscribers and self._connection is None and self._connecting is None:
+            self._connecting = self._loop.create_task(self._listen())
+
+    def _on_readable(self) -> None:
+        try:
+            self._connection.poll()
+        except Exception as e:
+            print(f"⚠️ Change stream listener lost its connection: {e}")
+            self.close()
+            self._loop.call_later(RECONNECT_DELAY_SECONDS, self._reconnect)
+            # Events may have been missed while disconnected
+            for subscribers in self._subscribers.values():
+                for subscriber in subscribers:
+                    subscriber.offer({"type": "resync", "workspace_id": subscriber.workspace_id})
+            return
+
+        while self._connection.notifies:
+            notification = self._connection.notifies.pop(0)
+            try:
+                event = json.loads(notification.payload)
+            except ValueError:
+                continue
+            event["type"] = "change"
+            for subscriber in list(self._subscribers.get(event.get("workspace_id"), ())):
+                subscriber.offer(event)
+
+
+change_hub = ChangeHub()
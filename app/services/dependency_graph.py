@@ -0,0 +1,196 @@
+import threading
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+from sqlalchemy.orm import Session, aliased
+from app.models.dependencies import InitiativeDependency, ProjectDependency
+from app.models.initiative import Initiative
+from app.models.project import Project
+
+PROJECT_GRAPH = "project"
+INITIATIVE_GRAPH = "initiative"
+
+# Other workers cannot see our invalidations, so cached graphs are also rebuilt after this many seconds.
+GRAPH_TTL_SECONDS = 300
+
+
+@dataclass
+class GraphNode:
+    node_id: str
+    title: Optional[str]
+    status: Optional[str]
+    end_date: Optional[datetime]
+
+
+class DependencyGraph:
+    """In-memory adjacency index over dependency edges of one workspace.
+
+    An edge source -> target means the target depends on the source, so "upstream" walks
+    towards sources and "downstream" walks towards targets.
+    """
+
+    def __init__(self, nodes: Dict[str, GraphNode], edges: List[Tuple[str, str]]):
+        self.nodes = nodes
+        self.downstream: Dict[str, Set[str]] = defaultdict(set)
+        self.upstream: Dict[str, Set[str]] = defaultdict(set)
+        for source_id, target_id in edges:
+            self.downstream[source_id].add(target_id)
+            self.upstream[target_id].add(source_id)
+
+    def transitive(self, node_id: str, direction: str) -> List[Tuple[str, int]]:
+        """Breadth-first closure from node_id, returned as (node_id, depth) pairs."""
+        adjacency = self.upstream if direction == "upstream" else self.downstream
+        seen = {node_id}
+        result = []
+        queue = deque([(node_id, 0)])
+        while queue:
+            current, depth = queue.popleft()
+            for neighbour in sorted(adjacency.get(current, ())):
+                if neighbour not in seen:
+                    seen.add(neighbour)
+                    result.append((neighbour, depth + 1))
+                    queue.append((neighbour, depth + 1))
+        return result
+
+    def find_path(self, start_id: str, goal_id: str) -> Optional[List[str]]:
+        """Shortest downstream path from start_id to goal_id, or None if unreachable."""
+        parents: Dict[str, Optional[str]] = {start_id: None}
+        queue = deque([start_id])
+        while queue:
+            current = queue.popleft()
+            if current == goal_id:
+                path = []
+                while current is not None:
+                    path.append(current)
+                    current = parents[current]
+                return list(reversed(path))
+            for neighbour in self.downstream.get(current, ()):
+                if neighbour not in parents:
+                    parents[neighbour] = current
+                    queue.append(neighbour)
+        return None
+
+    def cycle_for_new_edge(self, source_id: str, target_id: str) -> Optional[List[str]]:
+        """Return the cycle adding source -> target would close, or None if the edge is safe."""
+        if source_id == target_id:
+            return [source_id, target_id]
+        path = self.find_path(target_id, source_id)
+        if path is None:
+            return None
+        return [source_id] + path
+
+    def critical_path(self, node_id: Optional[str] = None) -> List[str]:
+        """Chain of dependencies that drives the latest finish date.
+
+        Each node finishes no earlier than its own end_date and no earlier than anything it depends
+        on. The critical path to a node follows, at every step, the upstream node with the latest
+        finish. Without node_id the path ends at the node with the latest finish in the workspace.
+        Ties are broken by the longer chain so that long sequences without dates still surface.
+        """
+        order = self._topological_order()
+        finish: Dict[str, Tuple[float, int]] = {}
+        driver: Dict[str, Optional[str]] = {}
+        for current in order:
+            own_end = self.nodes[current].end_date if current in self.nodes else None
+            own_finish = own_end.timestamp() if own_end else float("-inf")
+            best_driver = None
+            for predecessor in self.upstream.get(current, ()):
+                if predecessor in finish and (best_driver is None or finish[predecessor] > finish[best_driver]):
+                    best_driver = predecessor
+            if best_driver is None:
+                finish[current] = (own_finish, 1)
+            else:
+                driver_finish, driver_length = finish[best_driver]
+                finish[current] = (max(own_finish, driver_finish), driver_length + 1)
+            driver[current] = best_driver
+
+        if not finish:
+            return []
+        end = node_id if node_id is not None else max(finish, key=lambda key: (finish[key], key))
+        if end not in finish:
+            return [end]
+        path = []
+        current: Optional[str] = end
+        while current is not None:
+            path.append(current)
+            current = driver[current]
+        return list(reversed(path))
+
+    def _topological_order(self) -> List[str]:
+        all_ids = set(self.nodes) | set(self.downstream) | set(self.upstream)
+        in_degree = {node: len(self.upstream.get(node, ())) for node in all_ids}
+        queue = deque(sorted(node for node, degree in in_degree.items() if degree == 0))
+        order = []
+        while queue:
+            current = queue.popleft()
+            order.append(current)
+            for neighbour in sorted(self.downstream.get(current, ())):
+                in_degree[neighbour] -= 1
+                if in_degree[neighbour] == 0:
+                    queue.append(neighbour)
+        # Nodes caught in a pre-existing cycle never reach in-degree 0 and are left out.
+        return order
+
+
+_graph_cache: Dict[Tuple[str, str], Tuple[float, DependencyGraph]] = {}
+_graph_cache_lock = threading.Lock()
+
+
+def get_dependency_graph(db: Session, kind: str, workspace_id: str, fresh: bool = False) -> DependencyGraph:
+    """Return the cached graph for a workspace, building it with a single query when needed.
+
+    Pass fresh=True on write paths so validation never relies on another worker's stale view.
+    """
+    key = (kind, workspace_id)
+    if not fresh:
+        with _graph_cache_lock:
+            cached = _graph_cache.get(key)
+        if cached and time.monotonic() - cached[0] < GRAPH_TTL_SECONDS:
+            return cached[1]
+
+    graph = _build_graph(db, kind, workspace_id)
+    with _graph_cache_lock:
+        _graph_cache[key] = (time.monotonic(), graph)
+    return graph
+
+
+def invalidate_dependency_graph(kind: str, workspace_id: Optional[str]) -> None:
+    """Drop the cached graph of a workspace after one of its dependency edges changed."""
+    with _graph_cache_lock:
+        if workspace_id is None:
+            for key in [key for key in _graph_cache if key[0] == kind]:
+                _graph_cache.pop(key, None)
+        else:
+            _graph_cache.pop((kind, workspace_id), None)
+
+
+def _build_graph(db: Session, kind: str, workspace_id: str) -> DependencyGraph:
+    if kind == PROJECT_GRAPH:
+        model, edge = Project, ProjectDependency
+        node_key = "project_id"
+        source_column, target_column = ProjectDependency.source_project_id, ProjectDependency.target_project_id
+    else:
+        model, edge = Initiative, InitiativeDependency
+        node_key = "initiative_id"
+        source_column, target_column = InitiativeDependency.source_initiative_id, InitiativeDependency.target_initiative_id
+
+    source = aliased(model)
+    target = aliased(model)
+    rows = db.query(
+        getattr(source, node_key), source.title, source.status, source.end_date,
+        getattr(target, node_key), target.title, target.status, target.end_date,
+    ).select_from(edge)\
+        .join(source, getattr(source, node_key) == source_column)\
+        .join(target, getattr(target, node_key) == target_column)\
+        .filter(source.workspace_id == workspace_id)\
+        .all()
+
+    nodes: Dict[str, GraphNode] = {}
+    edges: List[Tuple[str, str]] = []
+    for source_id, source_title, source_status, source_end, target_id, target_title, target_status, target_end in rows:
+        nodes[source_id] = GraphNode(source_id, source_title, source_status, source_end)
+        nodes[target_id] = GraphNode(target_id, target_title, target_status, target_end)
+        edges.append((source_id, target_id))
+    return DependencyGraph(nodes, edges)
@@ -0,0 +1,145 @@
+import asyncio
+import html
+import logging
+from functools import lru_cache
+from string import Template
+from typing import Dict, List, Optional, Tuple
+from app.core.config import settings
+from app.crud import email_digest as digest_crud
+from app.db.session import SessionLocal
+from app.services.email_service import EmailService
+
+logger = logging.getLogger(__name__)
+
+DIGEST_CHECK_INTERVAL_SECONDS = 3600
+
+SECTION_TITLES = {
+    "project_updates": "Project updates",
+    "initiative_updates": "Initiative updates",
+    "issue_changes": "Issue changes",
+}
+
+_PAGE = """
+        <html>
+            <body style="font-family: Arial, sans-serif; margin: 0; padding: 20px; background-color: #f4f4f4;">
+                <div style="max-width: 600px; margin: 0 auto; background-color: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
+                    <h1 style="color: #333; margin-bottom: 10px;">What changed in your work</h1>
+                    <p style="color: #666; font-size: 16px;">Hi $name, here is what others changed since your last digest.</p>
+                    __SECTIONS__
+                    <div style="text-align: center; margin-top: 30px;">
+                        <a href="$app_url" style="display: inline-block; background-color: #667eea; color: white; padding: 15px 30px; text-decoration: none; border-radius: 25px; font-weight: bold; font-size: 16px;">
+                            Open Synchrone AI
+                        </a>
+                    </div>
+                </div>
+            </body>
+        </html>
+        """
+
+_SECTION = """
+                    <h2 style="color: #333; font-size: 18px; margin-top: 30px;">{title}</h2>
+                    <ul style="color: #444; font-size: 14px; padding-left: 20px;">${{{section}}}</ul>"""
+
+# Row templates are parsed once at import, not per recipient
+_ROW = Template('<li style="margin-bottom: 8px;"><strong>$title</strong> $detail <span style="color: #999;">by $author</span></li>')
+
+
+@lru_cache(maxsize=None)
+def _layout(sections: Tuple[str, ...]) -> Template:
+    """Page template for one combination of non-empty sections, built and parsed once per layout."""
+    section_html = "".join(_SECTION.format(title=SECTION_TITLES[section], section=section) for section in sections)
+    return Template(_PAGE.replace("__SECTIONS__", section_html))
+
+
+def _render_rows(section: str, rows: List[dict]) -> str:
+    rendered = []
+    for row in rows:
+        status = (row.get("status") or "").replace("_", " ").lower()
+        if section == "issue_changes":
+            detail = f"({html.escape(row['item_id'])}): {html.escape(status)}"
+        else:
+            detail = f"· {html.escape(status)}" if status else ""
+        rendered.append(_ROW.substitute(title=html.escape(row["title"]), detail=detail, author=html.escape(row["author"])))
+    return "".join(rendered)
+
+
+def render_digest(name: str, items: Dict[str, List[dict]]) -> Optional[str]:
+    """HTML body of one user's digest, or None when nothing relevant changed."""
+    sections = tuple(section for section in SECTION_TITLES if items.get(section))
+    if not sections:
+        return None
+    values = {section: _render_rows(section, items[section]) for section in sections}
+    return _layout(sections).substitute(values, name=html.escape(name or "there"), app_url=settings.FRONTEND_URL)
+
+
+class EmailDigestJob:
+    """Sends the daily email digest to every subscriber that is due, checking once an hour.
+
+    Recipients and their changes come from a handful of set-based queries for all subscribers at once;
+    the emails then go out over a few pooled SMTP connections. With a dry-run directory, each digest is
+    written there as an .eml file and no subscriber is marked as sent.
+    """
+
+    def __init__(self, interval: float = DIGEST_CHECK_INTERVAL_SECONDS, dry_run_dir: Optional[str] = None):
+        self.interval = interval
+        self.dry_run_dir = dry_run_dir
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def run_once(self, dry_run_dir: Optional[str] = None) -> Dict[str, bool]:
+        """Build and send (or write) every due digest; returns whether each one went out, keyed by email.
+
+        Recipients are claimed before sending; those whose email fails are released again, so the
+        next run retries them with the same digest start instead of skipping a day of changes.
+        """
+        dry_run_dir = dry_run_dir or self.dry_run_dir
+        db = SessionLocal()
+        try:
+            recipients = digest_crud.get_due_recipients(db, claim=not dry_run_dir)
+            try:
+                items = digest_crud.get_digest_items(db, recipients)
+                db.commit()  # don't sit idle in a transaction through the SMTP sends
+
+                email_service = EmailService()
+                messages = []
+                for recipient in recipients:
+                    body = render_digest(recipient["name"], items.get(recipient["user_id"], {}))
+                    if body is not None:
+                        messages.append(email_service.build_message(recipient["email"], "Your daily Synchrone AI digest", body))
+                if dry_run_dir:
+                    paths = email_service.write_eml_files(messages, dry_run_dir)
+                    logger.info(f"Wrote {len(paths)} digest emails to {dry_run_dir}")
+                    return {message["To"]: True for message in messages}
+                results = email_service.send_messages(messages)
+            except Exception:
+                if not dry_run_dir:
+                    db.rollback()
+                    digest_crud.release_recipients(db, recipients)
+                raise
+            failed = [recipient for recipient in recipients if results.get(recipient["email"]) is False]
+            if failed:
+                logger.error(f"{len(failed)} of {len(messages)} digest emails failed; they will be retried next run")
+                digest_crud.release_recipients(db, failed)
+            return results
+        finally:
+            db.close()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                # Queries and SMTP are blocking; keep them off the event loop
+                await asyncio.to_thread(self.run_once)
+            except Exception as e:
+                logger.error(f"Email digest pass failed: {e}")
+            await asyncio.sleep(self.interval)
+
+
+email_digest_job = EmailDigestJob(dry_run_dir=settings.EMAIL_DIGEST_DRY_RUN_DIR or None)
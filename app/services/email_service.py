@@ -1,12 +1,19 @@
+import os
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from app.core.config import settings
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# SMTP sends are I/O bound; this many run at once for bulk invitations
+INVITATION_SEND_CONCURRENCY = 8
+# Connections kept open for bulk sends such as the email digest; each one sends many messages
+BULK_SEND_CONNECTIONS = 4
+
 class EmailService:
     def __init__(self):
         self.smtp_server = settings.SMTP_SERVER
@@ -59,6 +66,89 @@ class EmailService:
             logger.error(f"Error type: {type(e).__name__}")
             return False
 
+    def send_workspace_invitation_emails(self, invitations: List[dict], max_workers: int = INVITATION_SEND_CONCURRENCY) -> Dict[str, bool]:
+        """Send many invitation emails concurrently; each dict holds send_workspace_invitation_email's arguments.
+
+        Returns whether the email went out, keyed by to_email.
+        """
+        if not invitations:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(invitations))) as pool:
+            sent = list(pool.map(lambda invitation: self.send_workspace_invitation_email(**invitation), invitations))
+        return {invitation["to_email"]: ok for invitation, ok in zip(invitations, sent)}
+
+    def build_message(self, to_email: str, subject: str, html_body: str) -> MIMEMultipart:
+        message = MIMEMultipart()
+        message["From"] = self.from_email
+        message["To"] = to_email
+        message["Subject"] = subject
+        message.attach(MIMEText(html_body, "html"))
+        return message
+
+    def send_messages(self, messages: List[MIMEMultipart], max_workers: int = BULK_SEND_CONNECTIONS) -> Dict[str, bool]:
+        """Send many prepared messages over a few long-lived SMTP connections.
+
+        Each worker logs in once and sends its share of the messages on the same connection,
+        reconnecting if the server drops it. Returns whether each email went out, keyed by recipient.
+        """
+        if not messages:
+            return {}
+        if not self.username or not self.password:
+            logger.error("Email configuration not set up. Please configure SMTP_USERNAME and SMTP_PASSWORD in .env file")
+            return {message["To"]: False for message in messages}
+
+        def connect() -> smtplib.SMTP:
+            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+            server.starttls()
+            server.login(self.username, self.password)
+            return server
+
+        def send_share(share: List[MIMEMultipart]) -> Dict[str, bool]:
+            sent = {}
+            server = None
+            try:
+                for message in share:
+                    for attempt in range(2):
+                        try:
+                            if server is None:
+                                server = connect()
+                            server.sendmail(self.from_email, message["To"], message.as_string())
+                            sent[message["To"]] = True
+                            break
+                        except smtplib.SMTPServerDisconnected:
+                            server = None  # reconnect once, then give up on this message
+                        except Exception as e:
+                            logger.error(f"❌ Failed to send email to {message['To']}: {str(e)}")
+                            break
+                    sent.setdefault(message["To"], False)
+            finally:
+                if server is not None:
+                    try:
+                        server.quit()
+                    except smtplib.SMTPException:
+                        pass
+            return sent
+
+        workers = min(max_workers, len(messages))
+        shares = [messages[i::workers] for i in range(workers)]
+        results: Dict[str, bool] = {}
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for sent in pool.map(send_share, shares):
+                results.update(sent)
+        logger.info(f"✅ Sent {sum(results.values())}/{len(messages)} emails over {workers} SMTP connections")
+        return results
+
+    def write_eml_files(self, messages: List[MIMEMultipart], directory: str) -> List[str]:
+        """Dry run of send_messages: write each message to <directory>/<recipient>.eml instead of sending it."""
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        for message in messages:
+            path = os.path.join(directory, f"{message['To'].replace('/', '_')}.eml")
+            with open(path, "wb") as eml:
+                eml.write(message.as_bytes())
+            paths.append(path)
+        return paths
+
     def send_magic_link_login_email(self, to_email: str, magic_link: str) -> bool:
         """Send magic link login email"""
         try:
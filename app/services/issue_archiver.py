@@ -0,0 +1,68 @@
+import asyncio
+import logging
+import time
+from typing import Optional
+from app.core.config import settings
+from app.crud import issues as issues_crud
+from app.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_INTERVAL_SECONDS = 3600
+ARCHIVE_BATCH_SIZE = 500
+
+
+class IssueArchiver:
+    """Periodically moves long-archived issues out of the hot issues table into issues_archive.
+
+    Each batch is its own short transaction that skips rows other requests hold, so moving a
+    backlog of archived issues never blocks work on active ones.
+    """
+
+    def __init__(self, interval: float = ARCHIVE_INTERVAL_SECONDS, batch_size: int = ARCHIVE_BATCH_SIZE):
+        self.interval = interval
+        self.batch_size = batch_size
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def run_once(self, older_than_days: Optional[int] = None) -> int:
+        """Move every eligible issue, batch by batch; returns how many moved."""
+        days = settings.ISSUE_ARCHIVE_AFTER_DAYS if older_than_days is None else older_than_days
+        started = time.monotonic()
+        moved = 0
+        db = SessionLocal()
+        try:
+            while True:
+                count = issues_crud.move_archived_issues(db, days, self.batch_size)
+                moved += count
+                # A short batch means the backlog is done, or only locked rows are left for next time
+                if count < self.batch_size:
+                    break
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        if moved:
+            logger.info(f"Moved {moved} archived issues to issues_archive in {time.monotonic() - started:.1f}s")
+        return moved
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                # The moves are blocking database calls; keep them off the event loop
+                await asyncio.to_thread(self.run_once)
+            except Exception as e:
+                logger.error(f"Issue archiver pass failed: {e}")
+            await asyncio.sleep(self.interval)
+
+
+issue_archiver = IssueArchiver()
@@ -0,0 +1,90 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy.orm import Session
+from app.models.workspace import WorkspaceMember
+from app.schemas.user import UserResponse
+
+# Short on purpose: other workers cannot see our invalidations, so a stale principal lives at most this long.
+PRINCIPAL_TTL_SECONDS = 30
+
+
+@dataclass(frozen=True)
+class Principal:
+    """The authenticated caller: user row, workspace memberships and roles, plus the token claims."""
+
+    user: UserResponse
+    memberships: Tuple[Tuple[str, str], ...]  # (workspace_id, role), oldest membership first
+    current_user: dict = field(default_factory=dict, compare=False)
+
+    @property
+    def user_id(self) -> str:
+        return self.user.user_id
+
+    @property
+    def tenant_id(self) -> Optional[str]:
+        return self.user.tenant_id
+
+    @property
+    def workspace_id(self) -> Optional[str]:
+        return self.memberships[0][0] if self.memberships else None
+
+    def role_in(self, workspace_id: str) -> Optional[str]:
+        for member_workspace_id, role in self.memberships:
+            if member_workspace_id == workspace_id:
+                return role
+        return None
+
+
+_principal_cache: Dict[str, Tuple[float, Principal]] = {}
+_email_by_user_id: Dict[str, str] = {}
+_principal_cache_lock = threading.Lock()
+
+
+def get_principal(db: Session, email: Optional[str]) -> Optional[Principal]:
+    """Return the cached principal for an email, loading user and memberships on a miss.
+
+    Unknown emails are not cached, so a user created moments later is found on the next request.
+    """
+    if not email:
+        return None
+    with _principal_cache_lock:
+        cached = _principal_cache.get(email)
+    if cached and time.monotonic() - cached[0] < PRINCIPAL_TTL_SECONDS:
+        return cached[1]
+
+    from app.crud import user as user_crud  # local import: crud.user itself invalidates this cache
+    user = user_crud.get_user_by_email(db, email)
+    if not user:
+        return None
+    memberships = db.query(WorkspaceMember.workspace_id, WorkspaceMember.role)\
+        .filter(WorkspaceMember.user_id == user.user_id)\
+        .order_by(WorkspaceMember.joined_at, WorkspaceMember.workspace_id)\
+        .all()
+    principal = Principal(user=user, memberships=tuple((row.workspace_id, row.role) for row in memberships))
+    with _principal_cache_lock:
+        _principal_cache[email] = (time.monotonic(), principal)
+        _email_by_user_id[user.user_id] = email
+    return principal
+
+
+def get_cached_user(db: Session, email: Optional[str]) -> Optional[UserResponse]:
+    """Drop-in for user_crud.get_user_by_email on the caller's own email."""
+    principal = get_principal(db, email)
+    return principal.user if principal else None
+
+
+def invalidate_principal(user_ids: Optional[List[str]] = None, email: Optional[str] = None) -> None:
+    """Forget cached principals after a user, membership or role change (everything if no key is given)."""
+    with _principal_cache_lock:
+        if user_ids is None and email is None:
+            _principal_cache.clear()
+            _email_by_user_id.clear()
+            return
+        if email is not None:
+            _principal_cache.pop(email, None)
+        for user_id in user_ids or ():
+            cached_email = _email_by_user_id.pop(user_id, None)
+            if cached_email is not None:
+                _principal_cache.pop(cached_email, None)
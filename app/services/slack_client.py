@@ -0,0 +1,91 @@
+import asyncio
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+import httpx
+from app.core.config import settings
+
+# Slack rate-limits per workspace and method tier; a 429 on one tier must not hold back calls on another
+METHOD_TIERS = {
+    "chat.postMessage": "special",
+    "conversations.list": "tier2",
+    "conversations.info": "tier3",
+}
+DEFAULT_TIER = "tier3"
+
+MAX_CONCURRENT_POSTS = 8
+MAX_RATE_LIMIT_RETRIES = 3
+DEFAULT_RETRY_AFTER_SECONDS = 1.0
+
+
+class SlackClient:
+    """Process-wide async Slack Web API client over one pooled httpx.AsyncClient.
+
+    Keeps connections to Slack alive across messages and requests, and remembers 429 Retry-After
+    per token and method tier (Slack limits each workspace separately) so concurrent callers wait
+    out the limit instead of hammering it, without one tenant's limit stalling another's posts.
+    """
+
+    def __init__(self, max_concurrency: int = MAX_CONCURRENT_POSTS):
+        self.max_concurrency = max_concurrency
+        self._client: Optional[httpx.AsyncClient] = None
+        self._retry_at: Dict[Tuple[str, str], float] = {}
+
+    def _http(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=settings.SLACK_API_URL,
+                timeout=httpx.Timeout(10.0),
+                limits=httpx.Limits(max_connections=self.max_concurrency * 2, max_keepalive_connections=self.max_concurrency),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def call(self, method: str, token: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """POST a Web API method, sleeping through 429s of its tier; returns Slack's JSON body.
+
+        A response that is not JSON (a proxy or 5xx error page) comes back as ok False with the
+        HTTP status as the error.
+        """
+        limit_key = (token, METHOD_TIERS.get(method, DEFAULT_TIER))
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            wait = self._retry_at.get(limit_key, 0) - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            response = await self._http().post(method, headers={"Authorization": f"Bearer {token}"}, json=payload)
+            if response.status_code != 429:
+                try:
+                    return response.json()
+                except ValueError:
+                    return {"ok": False, "error": f"http_{response.status_code}"}
+            retry_after = float(response.headers.get("Retry-After", DEFAULT_RETRY_AFTER_SECONDS))
+            self._retry_at[limit_key] = max(self._retry_at.get(limit_key, 0), time.monotonic() + retry_after)
+        return {"ok": False, "error": "ratelimited"}
+
+    async def post_to_channels(self, token: str, channel_ids: Iterable[str], payload: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Post the same message to every channel concurrently; returns a result per channel.
+
+        Each result has ok plus ts on success or error on failure. One failing channel never
+        affects the others.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def post(channel_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    data = await self.call("chat.postMessage", token, dict(payload, channel=channel_id))
+                except (httpx.HTTPError, ValueError) as e:
+                    return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            if data.get("ok"):
+                return {"ok": True, "ts": data.get("ts")}
+            return {"ok": False, "error": data.get("error", "Unknown error")}
+
+        channel_ids = list(dict.fromkeys(channel_ids))
+        results = await asyncio.gather(*(post(channel_id) for channel_id in channel_ids))
+        return dict(zip(channel_ids, results))
+
+
+slack_client = SlackClient()
@@ -0,0 +1,45 @@
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+from cryptography.fernet import Fernet
+from sqlalchemy.orm import Session
+from app.core.config import settings
+
+# Tokens change only through add_slack_token, which invalidates; the TTL covers other workers.
+SLACK_TOKEN_TTL_SECONDS = 600
+
+_token_cache: Dict[str, Tuple[float, str]] = {}
+_token_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def get_cipher() -> Fernet:
+    """The Fernet instance for Slack tokens, built once per process."""
+    return Fernet(settings.FERNET_KEY)
+
+
+def get_slack_token(db: Session, tenant_id: str) -> Optional[str]:
+    """Decrypted Slack bot token of a tenant, read and decrypted at most once per TTL."""
+    with _token_cache_lock:
+        cached = _token_cache.get(tenant_id)
+    if cached and time.monotonic() - cached[0] < SLACK_TOKEN_TTL_SECONDS:
+        return cached[1]
+
+    from app.crud import tenant as tenant_crud  # local import: crud.tenant itself invalidates this cache
+    encrypted_token = tenant_crud.get_encrypted_slack_token_for_tenant(db, tenant_id)
+    if not encrypted_token:
+        return None
+    token = get_cipher().decrypt(encrypted_token.encode('utf-8')).decode('utf-8')
+    with _token_cache_lock:
+        _token_cache[tenant_id] = (time.monotonic(), token)
+    return token
+
+
+def invalidate_slack_token(tenant_id: Optional[str] = None) -> None:
+    """Forget a tenant's cached token after it changed (every tenant's if tenant_id is None)."""
+    with _token_cache_lock:
+        if tenant_id is None:
+            _token_cache.clear()
+        else:
+            _token_cache.pop(tenant_id, None)
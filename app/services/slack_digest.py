@@ -0,0 +1,168 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy import func, or_, text
+from sqlalchemy.orm import Session
+from app.db.session import SessionLocal
+from app.models.slack_digest import SlackDigestItem
+from app.services.slack_client import slack_client
+from app.services.slack_credentials import get_slack_token
+from app.transformers.ui_update_to_slack_message import UIUpdateToSlackMessage
+
+logger = logging.getLogger(__name__)
+
+DIGEST_TICK_SECONDS = 60
+
+# Failed posts back off exponentially; updates are dropped once they have failed this many times
+MAX_DIGEST_ATTEMPTS = 6
+DIGEST_RETRY_BASE_SECONDS = 60
+DIGEST_RETRY_MAX_SECONDS = 3600
+
+# Errors no retry can fix: the channel is gone or closed to the bot, or the tenant has no working token
+PERMANENT_SLACK_ERRORS = {
+    "channel_not_found", "not_in_channel", "is_archived",
+    "invalid_auth", "token_revoked", "account_inactive", "missing_token",
+}
+
+# Channels whose oldest postable update has waited out the channel's window; a channel switched back
+# to immediate posting is flushed on the next tick so nothing stays stuck in the queue
+DUE_CHANNELS_SQL = text(
+    "SELECT i.channel_id FROM slack_digest_items i "
+    "JOIN channels c ON c.channel_id = i.channel_id "
+    "WHERE i.next_attempt_at IS NULL OR i.next_attempt_at <= now() "
+    "GROUP BY i.channel_id, c.digest_enabled, c.digest_window_minutes "
+    "HAVING NOT c.digest_enabled "
+    "OR min(i.created_at) <= now() - make_interval(mins => c.digest_window_minutes)"
+)
+
+
+def enqueue_digest(db: Session, tenant_id: str, channel_ids: Iterable[str], message_data: dict) -> None:
+    """Queue one update for the next digest of each channel, with a single multi-row insert."""
+    rows = [
+        SlackDigestItem(channel_id=channel_id, tenant_id=tenant_id, message_data=message_data)
+        for channel_id in dict.fromkeys(channel_ids)
+    ]
+    if not rows:
+        return
+    db.add_all(rows)
+    db.commit()
+
+
+class SlackDigestDispatcher:
+    """Posts the queued updates of digest channels as one message (or a few) per channel and window.
+
+    Runs in the background of each worker. A channel's updates stay locked (FOR UPDATE SKIP LOCKED)
+    while they are posted, so two workers never post the same update, and are only deleted once
+    Slack accepted the message carrying them. Whatever was not posted is retried with backoff, or
+    dropped after a permanent Slack error or too many attempts.
+    """
+
+    def __init__(self, interval: float = DIGEST_TICK_SECONDS):
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def dispatch(self) -> Dict[str, int]:
+        """Send every due digest now; returns the number of updates sent per channel."""
+        channel_ids = await asyncio.to_thread(self._due_channels)
+        sent = {}
+        for channel_id in channel_ids:
+            try:
+                posted = await self._dispatch_channel(channel_id)
+            except Exception as e:
+                logger.error(f"Slack digest for {channel_id} failed: {e}")
+                continue
+            if posted:
+                sent[channel_id] = posted
+        if sent:
+            logger.info(f"Sent Slack digests: {sent}")
+        return sent
+
+    async def _dispatch_channel(self, channel_id: str) -> int:
+        db = SessionLocal()
+        try:
+            items = await asyncio.to_thread(self._lock_items, db, channel_id)
+            if not items:
+                return 0  # another worker holds them
+            token = await asyncio.to_thread(get_slack_token, db, items[0].tenant_id)
+            posted, error = 0, None
+            if token is None:
+                error = "missing_token"
+            else:
+                digest = UIUpdateToSlackMessage().transform_digest([item.message_data for item in items])
+                for blocks, count in digest:
+                    try:
+                        data = await slack_client.call("chat.postMessage", token, {
+                            "channel": channel_id,
+                            "blocks": blocks,
+                            "text": f"Digest of {len(items)} updates",
+                        })
+                    except Exception as e:
+                        data = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+                    if not data.get("ok"):
+                        error = data.get("error", "Unknown error")
+                        break
+                    posted += count
+            await asyncio.to_thread(self._settle, db, channel_id, items[:posted], items[posted:], error)
+            return posted
+        finally:
+            await asyncio.to_thread(db.close)  # releases the row locks if _settle never committed
+
+    def _due_channels(self) -> List[str]:
+        db = SessionLocal()
+        try:
+            return db.execute(DUE_CHANNELS_SQL).scalars().all()
+        finally:
+            db.close()
+
+    def _lock_items(self, db: Session, channel_id: str) -> List[SlackDigestItem]:
+        return db.query(SlackDigestItem)\
+            .filter(
+                SlackDigestItem.channel_id == channel_id,
+                or_(SlackDigestItem.next_attempt_at.is_(None), SlackDigestItem.next_attempt_at <= func.now()),
+            )\
+            .order_by(SlackDigestItem.created_at, SlackDigestItem.id)\
+            .with_for_update(skip_locked=True)\
+            .all()
+
+    def _settle(self, db: Session, channel_id: str, posted: List[SlackDigestItem],
+                unposted: List[SlackDigestItem], error: Optional[str]) -> None:
+        """Delete what Slack accepted; reschedule or drop the rest. One commit, which releases the locks."""
+        for item in posted:
+            db.delete(item)
+        dropped = 0
+        now = datetime.now(timezone.utc)
+        for item in unposted:
+            item.attempts += 1
+            if error in PERMANENT_SLACK_ERRORS or item.attempts >= MAX_DIGEST_ATTEMPTS:
+                db.delete(item)
+                dropped += 1
+            else:
+                delay = min(DIGEST_RETRY_BASE_SECONDS * 2 ** (item.attempts - 1), DIGEST_RETRY_MAX_SECONDS)
+                item.next_attempt_at = now + timedelta(seconds=delay)
+        db.commit()
+        if error:
+            logger.error(
+                f"Posting digest to {channel_id} failed: {error}; "
+                f"{len(unposted) - dropped} updates will be retried, {dropped} dropped"
+            )
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.dispatch()
+            except Exception as e:
+                logger.error(f"Slack digest pass failed: {e}")
+            await asyncio.sleep(self.interval)
+
+
+slack_digest_dispatcher = SlackDigestDispatcher()
@@ -1,20 +1,67 @@
+import time
 import requests
 from fastapi import HTTPException
 from app.core.config import settings
-from app.crud import channel as channel_crud
+from app.models.channel import Channel
+from app.models.workspace import Workspace
+from sqlalchemy.dialects.postgresql import insert
 from app.schemas.channel import ChannelResponse
-from cryptography.fernet import Fernet
+from app.services.slack_credentials import get_cipher, get_slack_token
 from app.crud import tenant as tenant_crud
 from sqlalchemy.orm import Session
-from app.schemas.channel import ChannelSchema
-import httpx
+from typing import Dict, List
+from app.services.slack_client import DEFAULT_RETRY_AFTER_SECONDS, MAX_RATE_LIMIT_RETRIES, slack_client
+from app.services.slack_digest import enqueue_digest
 from app.transformers.ui_update_to_slack_message import UIUpdateToSlackMessage
 
+# Slack allows up to 1000 per page; fewer pages means fewer round trips and rate limit hits
+CONVERSATIONS_PAGE_SIZE = 1000
+CHANNEL_UPSERT_BATCH_SIZE = 500
+CHANNEL_SYNCED_COLUMNS = (
+    "name", "is_channel", "is_private", "created", "is_archived", "is_general",
+    "creator", "purpose", "topic", "num_members",
+)
+
+
+def list_all_conversations(api_url: str, slack_token: str) -> list:
+    """Every channel from conversations.list, following next_cursor until the last page.
+
+    A 429 waits out Retry-After and re-requests the same page, so a rate limit hit halfway through
+    a large workspace does not throw away the pages already fetched. Blocking; call it from a thread.
+    """
+    headers = {"Authorization": f"Bearer {slack_token}"}
+    channels = []
+    cursor = None
+    rate_limited = 0
+    with requests.Session() as session:
+        while True:
+            params = {"limit": CONVERSATIONS_PAGE_SIZE}
+            if cursor:
+                params["cursor"] = cursor
+            response = session.get(api_url + "conversations.list", headers=headers, params=params)
+            if response.status_code == 429 and rate_limited < MAX_RATE_LIMIT_RETRIES:
+                rate_limited += 1
+                time.sleep(float(response.headers.get("Retry-After", DEFAULT_RETRY_AFTER_SECONDS)))
+                continue
+            rate_limited = 0
+            if response.status_code != 200:
+                raise HTTPException(status_code=response.status_code, detail="Error fetching channels from Slack")
+
+            data = response.json()
+            if not data.get("ok"):
+                raise HTTPException(status_code=400, detail=data.get("error", "Unknown error") + f" Response: {data}")
+
+            channels.extend(data.get("channels", []))
+            cursor = (data.get("response_metadata") or {}).get("next_cursor")
+            if not cursor:
+                return channels
+
+
 class SlackService:
 
     def __init__(self, db: Session):
         self.db = db
-        self.cipher_suite = Fernet(settings.FERNET_KEY)
+        self.cipher_suite = get_cipher()
     
     def encrypt_slack_token(self, token: str) -> str:
         """Encrypt the Slack bot token."""
@@ -35,13 +82,11 @@ class SlackService:
         return decrypted_token.decode('utf-8')  # Return as a string
 
     def refresh_channels(self, tenant_id, authorization = None):
-        # Get the encrypted Slack bot token for the tenant
-        encrypted_token = tenant_crud.get_encrypted_slack_token_for_tenant(self.db, tenant_id)
-
-        print(f"Encrypted token: {encrypted_token}")
+        # Get the Slack bot token for the tenant (cached and already decrypted)
+        slack_token = get_slack_token(self.db, tenant_id)
 
         # Check if the token is empty
-        if not encrypted_token:
+        if not slack_token:
             # Extract the token from the authorization header
             token = authorization.split(" ")[1]  # Slack bot token from the header
 
@@ -52,93 +97,91 @@ class SlackService:
             # Save the encrypted token to the database
             if not tenant_crud.add_slack_token(self.db, tenant_id, encrypted_token):
                 raise HTTPException(status_code=400, detail="Tenant not found.")
+            slack_token = token
 
-        # Decrypt the token for use
-        slack_token = self.decrypt_slack_token(encrypted_token)
-        print(f"Slack token: {slack_token}")
-
-        headers = {
-            "Authorization": f"Bearer {slack_token}",
-            "Content-Type": "application/json"
-        }
-
-        response = requests.get(settings.SLACK_API_URL + "conversations.list", headers=headers)
-        print(f"Response: {response}")
-
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail="Error fetching channels from Slack")
-        
-        data = response.json()
-        
-        if not data.get("ok"):
-            raise HTTPException(status_code=400, detail=data.get("error", "Unknown error") + f" Response: {data}")
-        
-        channels = data.get("channels", [])
+        channels = list_all_conversations(settings.SLACK_API_URL, slack_token)
         self.store_channels_in_db(channels, tenant_id)
         return channels 
 
     def store_channels_in_db(self, channels_data, tenant_id):
-        for channel_data in channels_data:
-            # Extract the necessary fields from the channel_data
-            purpose = channel_data.get("purpose", {}).get("value", "")  # Extract purpose as a string
-            topic = channel_data.get("topic", {}).get("value", "")      # Extract topic as a string
-
-            # Check if the channel already exists in the database
-            existing_channel = channel_crud.get_channel_by_id(self.db, channel_data["id"])
-            
-            if existing_channel:
-                # Skip the channel if it already exists
-                continue
-            
-            # Create a new channel if it doesn't exist
-            channel_schema = ChannelSchema(
-                channel_id=channel_data["id"],
-                name=channel_data["name"],
-                is_channel=channel_data["is_channel"],
-                is_private=channel_data["is_private"],
-                created=channel_data["created"],
-                creator=channel_data["creator"],
-                purpose=purpose,
-                topic=topic,
-                num_members=channel_data.get("num_members", 0),
-                tenant_id=tenant_id
-            )
-            channel_crud.add_channel(self.db, channel_schema)
+        """Upsert every channel in batches and archive the ones Slack no longer returns, in one commit."""
+        workspace = self.db.query(Workspace.workspace_id).filter(Workspace.tenant_id == tenant_id).first()
+        if not workspace:
+            raise HTTPException(status_code=404, detail="Workspace not found for tenant.")
+
+        rows = [
+            {
+                "channel_id": channel_data["id"],
+                "name": channel_data["name"],
+                "is_channel": channel_data.get("is_channel", True),
+                "is_private": channel_data.get("is_private", False),
+                "created": channel_data.get("created"),
+                "is_archived": channel_data.get("is_archived", False),
+                "is_general": channel_data.get("is_general", False),
+                "creator": channel_data.get("creator"),
+                "purpose": (channel_data.get("purpose") or {}).get("value", ""),
+                "topic": (channel_data.get("topic") or {}).get("value", ""),
+                "num_members": channel_data.get("num_members", 0),
+                "workspace_id": workspace.workspace_id,
+            }
+            for channel_data in channels_data
+        ]
+        for start in range(0, len(rows), CHANNEL_UPSERT_BATCH_SIZE):
+            stmt = insert(Channel).values(rows[start:start + CHANNEL_UPSERT_BATCH_SIZE])
+            self.db.execute(stmt.on_conflict_do_update(
+                index_elements=[Channel.channel_id],
+                set_={column: stmt.excluded[column] for column in CHANNEL_SYNCED_COLUMNS}
+            ))
+
+        # Channels deleted in Slack (or no longer visible to the bot) are archived, not removed,
+        # so links from initiatives and projects survive
+        self.db.query(Channel).filter(
+            Channel.workspace_id == workspace.workspace_id,
+            Channel.is_archived.isnot(True),
+            Channel.channel_id.notin_([row["channel_id"] for row in rows]),
+        ).update({Channel.is_archived: True}, synchronize_session=False)
+        self.db.commit()
 
 
     async def post_message_to_channel(self, tenant_id: str, channel_id: str, message_data: dict):
+        results = await self.post_message_to_channels(tenant_id, [channel_id], message_data)
+        result = results[channel_id]
+        if not result["ok"]:
+            raise Exception(f"Error posting message: {result['error']}")
+        return result
+
+    async def post_message_to_channels(self, tenant_id: str, channel_ids: List[str], message_data: dict) -> Dict[str, dict]:
+        """Post one update to several channels concurrently over the shared Slack client.
+
+        The message is rendered once and the token comes from the credential cache; returns {channel_id: {"ok", "ts" | "error"}}.
+        Channels in digest mode get the update queued for their next digest instead, reported as {"ok": True, "queued": True}.
+        """
+        channel_ids = list(dict.fromkeys(channel_ids))
+        digest_channel_ids = {
+            channel_id for (channel_id,) in self.db.query(Channel.channel_id).filter(
+                Channel.channel_id.in_(channel_ids),
+                Channel.digest_enabled.is_(True),
+            )
+        }
+        results = {}
+        if digest_channel_ids:
+            enqueue_digest(self.db, tenant_id, digest_channel_ids, message_data)
+            results = {channel_id: {"ok": True, "queued": True} for channel_id in digest_channel_ids}
+        channel_ids = [channel_id for channel_id in channel_ids if channel_id not in digest_channel_ids]
+        if not channel_ids:
+            return results
+
         transformer = UIUpdateToSlackMessage()
         blocks = transformer.transform(message_data)
 
-        encrypted_token = tenant_crud.get_encrypted_slack_token_for_tenant(self.db, tenant_id)
-        if not encrypted_token:
+        slack_token = get_slack_token(self.db, tenant_id)
+        if not slack_token:
             raise ValueError("No Slack token available for this tenant.")
 
-        slack_token = self.decrypt_slack_token(encrypted_token)
-        headers = {
-            "Authorization": f"Bearer {slack_token}",
-            "Content-Type": "application/json"
+        # Post the message directly without joining the channel
+        payload = {
+            "blocks": blocks,
+            "text": "New update posted"
         }
-
-        async with httpx.AsyncClient() as client:
-            # Post the message directly without joining the channel
-            payload = {
-                "channel": channel_id,
-                "blocks": blocks,
-                "text": "New update posted"
-            }
-
-            response = await client.post(
-                "https://slack.com/api/chat.postMessage",
-                headers=headers,
-                json=payload
-            )
-
-            response_data = response.json()
-            print(f"Post message response: {response_data}")  # Log the response
-
-            if not response_data.get("ok"):
-                error_msg = response_data.get("error", "Unknown error")
-                raise Exception(f"Error posting message: {error_msg}")
-
-            return response_data
+        results.update(await slack_client.post_to_channels(slack_token, channel_ids, payload))
+        return results
@@ -0,0 +1,112 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Dict, Optional
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from app.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+SWEEP_INTERVAL_SECONDS = 300
+SWEEP_BATCH_SIZE = 1000
+
+# table -> predicate of the rows to prune; each predicate is backed by an expires_at index created at startup
+SWEEP_TARGETS = {
+    "magic_links": "expires_at < now()",
+    # Accepted invitations are kept as the record of who joined through them
+    "workspace_invitations": "expires_at < now() AND is_accepted = false",
+}
+
+
+def delete_in_batches(db: Session, table: str, predicate: str, batch_size: int = SWEEP_BATCH_SIZE) -> int:
+    """Delete matching rows batch_size at a time, committing each batch; returns the rows removed.
+
+    Short transactions keep row locks and WAL bursts small, so logins and invitation lookups are
+    never blocked behind one large delete.
+    """
+    removed = 0
+    while True:
+        result = db.execute(text(
+            f"DELETE FROM {table} WHERE ctid IN "
+            f"(SELECT ctid FROM {table} WHERE {predicate} LIMIT :batch_size)"
+        ), {"batch_size": batch_size})
+        db.commit()
+        removed += result.rowcount
+        if result.rowcount < batch_size:
+            return removed
+
+
+class TokenSweeper:
+    """Periodically prunes expired magic links and invitations in the background of each worker."""
+
+    def __init__(self, interval: float = SWEEP_INTERVAL_SECONDS, batch_size: int = SWEEP_BATCH_SIZE):
+        self.interval = interval
+        self.batch_size = batch_size
+        self._task: Optional[asyncio.Task] = None
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, dict] = {
+            table: {"runs": 0, "removed_total": 0, "last_removed": 0, "last_run_at": None, "last_duration_ms": None, "last_error": None}
+            for table in SWEEP_TARGETS
+        }
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def metrics(self) -> Dict[str, dict]:
+        with self._lock:
+            return {table: dict(values) for table, values in self._metrics.items()}
+
+    def sweep(self, table: Optional[str] = None) -> Dict[str, int]:
+        """Run one pass over every target (or just `table`) and return the rows removed per table."""
+        removed = {}
+        db = SessionLocal()
+        try:
+            for name, predicate in SWEEP_TARGETS.items():
+                if table is not None and name != table:
+                    continue
+                started = time.monotonic()
+                error = None
+                count = 0
+                try:
+                    count = delete_in_batches(db, name, predicate, self.batch_size)
+                except Exception as e:
+                    db.rollback()
+                    error = str(e)
+                    logger.error(f"Sweeping expired rows from {name} failed: {error}")
+                removed[name] = count
+                self._record(name, count, time.monotonic() - started, error)
+        finally:
+            db.close()
+        if any(removed.values()):
+            logger.info(f"Swept expired tokens: {removed}")
+        return removed
+
+    def _record(self, table: str, count: int, duration: float, error: Optional[str]) -> None:
+        with self._lock:
+            entry = self._metrics[table]
+            entry["runs"] += 1
+            entry["removed_total"] += count
+            entry["last_removed"] = count
+            entry["last_run_at"] = int(time.time())
+            entry["last_duration_ms"] = round(duration * 1000, 1)
+            entry["last_error"] = error
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                # The deletes are blocking database calls; keep them off the event loop
+                await asyncio.to_thread(self.sweep)
+            except Exception as e:
+                logger.error(f"Token sweeper pass failed: {e}")
+            await asyncio.sleep(self.interval)
+
+
+token_sweeper = TokenSweeper()
@@ -0,0 +1,86 @@
+"""Micro-benchmark: per-object DTO validation vs plain dicts checked once per page, for list_issues.
+
+Builds one page of issues twice: the way issue_to_dto used to, with a validated UserDTO, TeamDTO
+and LabelDTO model per nested object, and the way it does now, with plain dicts validated in one
+TypeAdapter call (issues_crud._checked_list). Both are timed alone and together with rendering
+the response, and must render the same JSON, key order included.
+
+Run from the repository root:  python -m app.test_scripts.benchmark_dto_construction [issues] [repeats]
+"""
+import sys
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from app.core.responses import FastJSONResponse
+from app.crud import issues as issues_crud
+from app.dto.dtos import UserDTO, TeamDTO, LabelDTO
+
+
+def _rows(count: int):
+    users = [
+        SimpleNamespace(user_id=f"user-{i}", name=f"User {i}", email=f"user{i}@example.com", picture=None)
+        for i in range(20)
+    ]
+    labels = [SimpleNamespace(id=f"label-{i}", name=f"label {i}", color="#336699", description=None) for i in range(3)]
+    team = SimpleNamespace(team_id="TEAM-ENG", name="Engineering")
+    now = datetime.now(timezone.utc)
+    issues = [
+        SimpleNamespace(
+            id=f"ISS-{i:06d}", display_id=f"ENG-{i}", title=f"Issue {i}",
+            description={"type": "doc", "content": [{"type": "text", "text": f"Body {i}"}]}, acceptance_criteria=None,
+            status="TODO", priority="MEDIUM", issue_type="FEATURE", created_at=now, updated_at=now,
+            start_date=None, due_date=None, story_points=3, cycle_id=None, is_archived=False,
+        )
+        for i in range(count)
+    ]
+    return [(issue, users[i % 20], users[(i * 7) % 20], team, labels) for i, issue in enumerate(issues)]
+
+
+def _validated_page(rows):
+    """issue_to_dto as it was: a validated model for every nested user, team and label."""
+    page = []
+    for issue, assignee, created_by, team, labels in rows:
+        row = issues_crud.issue_to_dto(issue, assignee, created_by, team, [])
+        row["assignee"] = UserDTO(user_id=assignee.user_id, name=assignee.name, email=assignee.email, picture=assignee.picture)
+        row["created_by"] = UserDTO(user_id=created_by.user_id, name=created_by.name, email=created_by.email, picture=created_by.picture)
+        row["team"] = TeamDTO(team_id=team.team_id, name=team.name)
+        row["labels"] = [LabelDTO(id=label.id, name=label.name, color=label.color, description=label.description) for label in labels]
+        page.append(row)
+    return page
+
+
+def _checked_page(rows):
+    """issue_to_dto as it is: plain dicts, validated once for the whole page."""
+    return issues_crud._checked_list([
+        issues_crud.issue_to_dto(issue, assignee, created_by, team, [issues_crud._label_dict(label) for label in labels])
+        for issue, assignee, created_by, team, labels in rows
+    ])
+
+
+def _time(label: str, func, repeats: int) -> None:
+    func()
+    started = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    print(f"{label:<30} {(time.perf_counter() - started) * 1000 / repeats:8.3f} ms/page")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    rows = _rows(count)
+
+    print(f"{count} issues per page, {repeats} repeats")
+    _time("validated models: build", lambda: _validated_page(rows), repeats)
+    _time("checked dicts: build", lambda: _checked_page(rows), repeats)
+    _time("validated models: + render", lambda: FastJSONResponse(content=_validated_page(rows)).body, repeats)
+    _time("checked dicts: + render", lambda: FastJSONResponse(content=_checked_page(rows)).body, repeats)
+
+    validated = FastJSONResponse(content=_validated_page(rows)).body
+    checked = FastJSONResponse(content=_checked_page(rows)).body
+    assert validated == checked, "plain dicts changed the serialized page"
+
+
+if __name__ == "__main__":
+    main()
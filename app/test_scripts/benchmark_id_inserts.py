@@ -0,0 +1,83 @@
+"""Compare insert throughput and primary key index size for random vs time-ordered IDs.
+
+Creates scratch tables shaped like `issues`' key (String primary key plus a small payload) and
+inserts the same number of rows into each, in batches. Every ID carries name initials drawn from a
+realistic spread of titles, the way the generators derive them:
+
+  * random:         "<initials>-" + 10 random characters, what the ID generators produced before
+  * initials_ulid:  "<initials>-" + generate_ulid(); time-ordered only within each initials
+                    group, so inserts still scatter across one insertion point per group
+  * prefix_ulid:    "ISS-" + generate_ulid() + "-<initials>", what generate_id produces now: a
+                    constant per-table prefix (ISS-, PRJ-, USR-, ...), so all keys share one
+                    insertion point
+
+then reports rows/second and the size of each table's primary key index. Random keys land on
+random B-tree leaf pages and leave them half full after splits; keys whose ULID follows a constant
+prefix fill pages left to right. The tables are dropped afterwards.
+
+Run from the repository root:  python -m app.test_scripts.benchmark_id_inserts [rows] [batch]
+"""
+import random
+import string
+import sys
+import time
+
+from sqlalchemy import text
+
+from app.core.utils import generate_id, generate_ulid
+from app.db.session import engine
+
+
+# Title initials as generate_id derives them: up to two words' first three letters
+_WORDS = ["FIX", "ADD", "UPD", "REM", "LOG", "API", "BUG", "DOC", "TES", "UI", "DB", "AUT", "PAY", "SEA", "NOT"]
+
+
+def _initials() -> str:
+    return "".join(random.choices(_WORDS, k=random.randint(1, 2)))
+
+
+def _random_id() -> str:
+    return f"{_initials()}-" + ''.join(random.choices(string.ascii_uppercase + string.digits, k=10))
+
+
+def _initials_ulid_id() -> str:
+    return f"{_initials()}-{generate_ulid()}"
+
+
+def _prefix_ulid_id() -> str:
+    return generate_id("ISS", random.choice(_WORDS))
+
+
+def run(name: str, make_id, rows: int, batch: int) -> dict:
+    table = f"benchmark_ids_{name}"
+    with engine.begin() as connection:
+        connection.execute(text(f"DROP TABLE IF EXISTS {table}"))
+        connection.execute(text(f"CREATE TABLE {table} (id VARCHAR PRIMARY KEY, title VARCHAR NOT NULL)"))
+
+    started = time.perf_counter()
+    for offset in range(0, rows, batch):
+        values = [{"id": make_id(), "title": f"issue {offset + i}"} for i in range(min(batch, rows - offset))]
+        with engine.begin() as connection:
+            connection.execute(text(f"INSERT INTO {table} (id, title) VALUES (:id, :title)"), values)
+    elapsed = time.perf_counter() - started
+
+    with engine.begin() as connection:
+        index_bytes = connection.execute(text(f"SELECT pg_relation_size('{table}_pkey')")).scalar()
+        connection.execute(text(f"DROP TABLE {table}"))
+    return {"rows_per_second": rows / elapsed, "index_bytes": index_bytes}
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    batch = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    print(f"{rows} rows in batches of {batch}")
+    generators = (("random", _random_id), ("initials_ulid", _initials_ulid_id), ("prefix_ulid", _prefix_ulid_id))
+    results = {name: run(name, make_id, rows, batch) for name, make_id in generators}
+    for name, result in results.items():
+        print(f"  {name:<13} {result['rows_per_second']:>10.0f} rows/s   pkey {result['index_bytes'] / 1024 / 1024:>7.2f} MiB")
+    # ULID keys are 16 characters longer, so any size advantage comes from fuller leaf pages alone
+    for name in ("initials_ulid", "prefix_ulid"):
+        print(f"  index size random/{name}: {results['random']['index_bytes'] / results[name]['index_bytes']:.2f}")
+
+if __name__ == "__main__":
+    main()
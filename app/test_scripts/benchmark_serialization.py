@@ -0,0 +1,111 @@
+"""Compare serialization CPU and bytes on the wire for a list_issues-sized payload.
+
+Builds synthetic issues shaped like issues_crud.issue_to_dto output (JSONB descriptions, user,
+team and label DTOs) and times:
+
+  * default:  jsonable_encoder + stdlib JSONResponse (what FastAPI did before)
+  * fast:     FastJSONResponse(content=...) rendering the DTOs directly with orjson
+
+then reports response sizes raw, gzip and brotli (if installed).
+
+Run from the repository root:  python -m app.test_scripts.benchmark_serialization [issues] [repeats]
+"""
+import gzip
+import random
+import string
+import sys
+import time
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.core.responses import FastJSONResponse, orjson
+from app.dto.dtos import UserDTO, TeamDTO, LabelDTO
+from app.middleware.compression import brotli
+
+
+def _words(count: int) -> str:
+    return " ".join("".join(random.choices(string.ascii_lowercase, k=random.randint(3, 9))) for _ in range(count))
+
+
+def _description() -> dict:
+    return {
+        "type": "doc",
+        "content": [
+            {"type": "paragraph", "content": [{"type": "text", "text": _words(40)}]},
+            {"type": "bulletList", "content": [
+                {"type": "listItem", "content": [
+                    {"type": "paragraph", "content": [{"type": "text", "text": _words(12), "marks": [{"type": "bold"}]}]}
+                ]}
+                for _ in range(4)
+            ]},
+            {"type": "paragraph", "content": [{"type": "text", "text": _words(60)}]},
+        ],
+    }
+
+
+def build_issues(count: int) -> list:
+    users = [
+        UserDTO(user_id=f"user-{i}", name=_words(2), email=f"user{i}@example.com", picture=f"https://example.com/{i}.png")
+        for i in range(20)
+    ]
+    team = TeamDTO(team_id="TEAM-ENG-1234567890", name="Engineering")
+    labels = [LabelDTO(id=f"label-{i}", name=_words(1), color="#ff8800", description=_words(5)) for i in range(6)]
+    now = int(time.time())
+    return [
+        {
+            "id": f"ISS-{i:06d}",
+            "display_id": f"ENG-{i}",
+            "title": _words(8),
+            "description": _description(),
+            "acceptance_criteria": _description(),
+            "status": random.choice(["TODO", "IN_PROGRESS", "DONE"]),
+            "priority": random.choice(["LOW", "MEDIUM", "HIGH"]),
+            "issue_type": "FEATURE",
+            "assignee": random.choice(users),
+            "created_at": now - i * 60,
+            "updated_at": now - i * 30,
+            "start_date": None,
+            "due_date": now + i * 3600,
+            "story_points": random.randint(1, 8),
+            "cycle_id": "CYC-1",
+            "epic_id": None,
+            "created_by": random.choice(users),
+            "team": team,
+            "labels": random.sample(labels, 3),
+            "is_archived": False,
+        }
+        for i in range(count)
+    ]
+
+
+def _time(label: str, render, repeats: int) -> bytes:
+    body = render()
+    started = time.perf_counter()
+    for _ in range(repeats):
+        render()
+    elapsed_ms = (time.perf_counter() - started) * 1000 / repeats
+    print(f"{label:<10} {elapsed_ms:8.2f} ms/response")
+    return body
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    random.seed(7)
+    issues = build_issues(count)
+
+    print(f"{count} issues, {repeats} repeats, orjson {'available' if orjson else 'MISSING (stdlib fallback)'}")
+    default_body = _time("default", lambda: JSONResponse(content=jsonable_encoder(issues)).body, repeats)
+    fast_body = _time("fast", lambda: FastJSONResponse(content=issues).body, repeats)
+
+    print()
+    print(f"{'':<10} {'raw':>10} {'gzip':>10} {'brotli':>10}")
+    for label, body in (("default", default_body), ("fast", fast_body)):
+        gzipped = len(gzip.compress(body, compresslevel=6))
+        brotlied = len(brotli.compress(body, quality=4)) if brotli else None
+        print(f"{label:<10} {len(body):>10} {gzipped:>10} {brotlied if brotlied is not None else 'n/a':>10}")
+
+
+if __name__ == "__main__":
+    main()
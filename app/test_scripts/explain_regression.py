@@ -0,0 +1,210 @@
+"""EXPLAIN-based regression check for the hot CRUD queries.
+
+Builds the schema from the models (with the indexes they declare) inside a scratch Postgres schema,
+seeds it with a sizeable synthetic workspace using generate_series and ANALYZEs. Then it calls each
+CRUD function in HOT_OPERATIONS and records every SELECT it sends to the driver, which is the SQL
+the postgresql dialect compiled from the CRUD layer's own query objects: eager-loaded joins,
+OFFSET, loader and lazy-load queries included. Each distinct statement is run again, with the
+parameters it was first sent with, under EXPLAIN (ANALYZE, FORMAT JSON). A statement fails when its
+plan reads a seeded table with a Seq Scan, or when its best execution time over a few runs exceeds
+the operation's budget. The scratch schema is dropped afterwards; the application's own tables are
+never touched.
+
+Exits non-zero on any failure, so it can gate CI next to a throwaway Postgres.
+
+Run from the repository root:  python -m app.test_scripts.explain_regression [--scale N] [--keep]
+"""
+import argparse
+import contextlib
+import io
+import json
+import sys
+import time
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.db.session import engine
+# Every model module, so create_all builds the full schema with its declared indexes
+from app.models import (  # noqa: F401
+    channel, cycle, cycle_update, dependencies, email_digest, git_link, initiative, initiative_channels,
+    initiative_interactions, initiative_teams, issue, issue_activity, issue_interactions, label, magic_link,
+    project, project_channels, project_interactions, project_teams, resource, slack_digest, teams, tenant,
+    updates, user, workspace, workspace_invitation,
+)
+from app.crud import issues as issue_crud
+from app.crud import project as project_crud
+from app.crud import teams as team_crud
+from app.crud import updates as update_crud
+from app.crud import user as user_crud
+from app.crud import workspace as workspace_crud
+
+SCHEMA = "explain_regression"
+RUNS = 5
+DEFAULT_BUDGET_MS = 5.0
+
+# Row counts at scale 1; --scale multiplies them
+SEED_SQL = [
+    "INSERT INTO tenants (tenant_id, name) VALUES ('TEN-1', 'Regression tenant')",
+    """INSERT INTO users (user_id, name, email, tenant_id)
+       SELECT 'USR-' || g, 'User ' || g, 'user' || g || '@example.com', 'TEN-1'
+       FROM generate_series(1, 20000 * :scale) g""",
+    """INSERT INTO workspaces (workspace_id, name, tenant_id, created_by)
+       SELECT 'WSP-' || g, 'Workspace ' || g, 'TEN-1', 'USR-' || g FROM generate_series(1, 20) g""",
+    """INSERT INTO workspace_members (workspace_id, user_id, role)
+       SELECT 'WSP-' || (g % 20 + 1), 'USR-' || g, 'Member' FROM generate_series(1, 20000 * :scale) g""",
+    """INSERT INTO teams (team_id, name, workspace_id, priority)
+       SELECT 'TEAM-' || g, 'Team ' || g, 'WSP-' || (g % 20 + 1), 5 FROM generate_series(1, 400) g""",
+    """INSERT INTO team_members (team_id, user_id)
+       SELECT DISTINCT 'TEAM-' || ((g * 7 + k) % 400 + 1), 'USR-' || g
+       FROM generate_series(1, 20000 * :scale) g, generate_series(1, 3) k""",
+    """INSERT INTO projects (project_id, workspace_id, title)
+       SELECT 'PRJ-' || g, 'WSP-' || (g % 20 + 1), 'Project ' || g FROM generate_series(1, 4000) g""",
+    """INSERT INTO project_teams (project_id, team_id)
+       SELECT 'PRJ-' || g, 'TEAM-' || (g % 400 + 1) FROM generate_series(1, 4000) g""",
+    """INSERT INTO project_updates (update_id, project_id, content, created_by, created_at, current_status)
+       SELECT 'PU-' || g, 'PRJ-' || (g % 4000 + 1), '{}'::jsonb, 'USR-' || (g % 20000 + 1),
+              now() - (g || ' minutes')::interval, 'on_track'
+       FROM generate_series(1, 100000 * :scale) g""",
+    """INSERT INTO cycles (id, display_id, name, start_date, due_date, team_id)
+       SELECT 'CYC-' || g, 'C-' || g, 'Cycle ' || g, now() - interval '14 days', now(), 'TEAM-' || (g % 400 + 1)
+       FROM generate_series(1, 2000) g""",
+    """INSERT INTO issues (id, display_id, title, status, priority, issue_type, created_by, assignee, team_id,
+                           cycle_id, is_archived, created_at)
+       SELECT 'ISS-' || g, 'T-' || g, 'Issue ' || g,
+              (ARRAY['TODO', 'IN_PROGRESS', 'IN_REVIEW', 'DONE', 'CANCELLED'])[g % 5 + 1], 'MEDIUM', 'FEATURE',
+              'USR-' || (g % 20000 + 1), 'USR-' || ((g * 13) % 20000 + 1), 'TEAM-' || (g % 400 + 1),
+              'CYC-' || (g % 2000 + 1), g % 10 = 0, now() - (g || ' seconds')::interval
+       FROM generate_series(1, 400000 * :scale) g""",
+    """INSERT INTO labels (id, name, color, created_by)
+       SELECT 'LBL-' || g, 'Label ' || g, '#888888', 'USR-1' FROM generate_series(1, 2000) g""",
+    """INSERT INTO issue_labels (issue_id, label_id, created_by)
+       SELECT 'ISS-' || g, 'LBL-' || (g % 2000 + 1), 'USR-1' FROM generate_series(1, 400000 * :scale) g""",
+]
+
+SEEDED_TABLES = [
+    "tenants", "users", "workspaces", "workspace_members", "teams", "team_members",
+    "projects", "project_teams", "project_updates", "cycles", "issues", "labels", "issue_labels",
+]
+
+# name -> (call into the CRUD layer, budget in ms for each statement it issues)
+HOT_OPERATIONS = {
+    "issues by team and status": (
+        lambda db: issue_crud.list_issues(db, limit=50, team_id="TEAM-7", statuses=["TODO", "IN_PROGRESS"]),
+        DEFAULT_BUDGET_MS,
+    ),
+    "issues by team": (lambda db: issue_crud.list_issues(db, limit=50, team_id="TEAM-7"), DEFAULT_BUDGET_MS),
+    "issues by team, page 3": (
+        lambda db: issue_crud.list_issues(db, offset=100, limit=50, team_id="TEAM-7"), DEFAULT_BUDGET_MS,
+    ),
+    "issues by cycle": (lambda db: issue_crud.list_issues(db, cycle_id="CYC-7"), DEFAULT_BUDGET_MS),
+    "issues by assignee": (lambda db: issue_crud.list_issues(db, limit=50, assignee="USR-42"), DEFAULT_BUDGET_MS),
+    "project update feed": (lambda db: update_crud.get_project_updates(db, "PRJ-7", limit=20), DEFAULT_BUDGET_MS),
+    "project update feed summary": (
+        lambda db: update_crud.get_project_updates(db, "PRJ-7", limit=20, summary=True), DEFAULT_BUDGET_MS,
+    ),
+    "teams of a user": (
+        lambda db: team_crud.get_all_teams(db, member_id="USR-42", workspace_id="WSP-3"), DEFAULT_BUDGET_MS,
+    ),
+    "workspace membership": (
+        lambda db: workspace_crud.get_workspace_members(db, "WSP-3", "USR-42"), DEFAULT_BUDGET_MS,
+    ),
+    "user by email": (lambda db: user_crud.get_user_by_email(db, "user42@example.com"), DEFAULT_BUDGET_MS),
+    "projects of a team": (lambda db: project_crud.get_projects(db, teams=["TEAM-7"]), DEFAULT_BUDGET_MS),
+}
+
+
+def _capture(connection, operation) -> list:
+    """Distinct SELECTs the operation sends to the driver, each with the first parameters it got."""
+    statements = {}
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.setdefault(statement, parameters)
+
+    event.listen(connection, "before_cursor_execute", record)
+    db = Session(bind=connection)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):  # some CRUD functions print debug lines
+            operation(db)
+    finally:
+        event.remove(connection, "before_cursor_execute", record)
+        db.close()
+    return list(statements.items())
+
+
+def _seq_scans(plan: dict) -> list:
+    """Seeded relations read with a Seq Scan anywhere in the plan tree.
+
+    Tables left empty are not counted: scanning them is what the planner should do.
+    """
+    found = [plan["Relation Name"]] if plan.get("Node Type") == "Seq Scan" and plan.get("Relation Name") in SEEDED_TABLES else []
+    for child in plan.get("Plans", []):
+        found += _seq_scans(child)
+    return found
+
+
+def _explain(connection, sql: str, params) -> tuple:
+    best_ms, plan = None, None
+    for _ in range(RUNS):
+        # Driver-level SQL and parameters, exactly as the CRUD call sent them
+        result = connection.exec_driver_sql(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}", params).scalar()
+        explained = (json.loads(result) if isinstance(result, str) else result)[0]
+        if best_ms is None or explained["Execution Time"] < best_ms:
+            best_ms, plan = explained["Execution Time"], explained["Plan"]
+    return best_ms, plan
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=1, help="multiply seeded row counts")
+    parser.add_argument("--keep", action="store_true", help="keep the scratch schema for manual EXPLAINs")
+    args = parser.parse_args()
+
+    failures = []
+    with engine.connect() as connection:
+        connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        connection.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        connection.execute(text(f"SET search_path TO {SCHEMA}"))
+        try:
+            Base.metadata.create_all(connection)
+            started = time.perf_counter()
+            for statement in SEED_SQL:
+                connection.execute(text(statement), {"scale": args.scale})
+            for table in SEEDED_TABLES:  # only the scratch copies, not the application's tables
+                connection.execute(text(f"ANALYZE {SCHEMA}.{table}"))
+            connection.commit()
+            print(f"Seeded {SCHEMA} at scale {args.scale} in {time.perf_counter() - started:.1f}s")
+
+            for name, (operation, budget_ms) in HOT_OPERATIONS.items():
+                statements = _capture(connection, operation)
+                print(f"  {name} ({len(statements)} distinct statements)")
+                for number, (sql, params) in enumerate(statements, 1):
+                    best_ms, plan = _explain(connection, sql, params)
+                    problems = []
+                    seq_scans = _seq_scans(plan)
+                    if seq_scans:
+                        problems.append(f"seq scan on {', '.join(sorted(set(seq_scans)))}")
+                    if best_ms > budget_ms:
+                        problems.append(f"{best_ms:.2f} ms over the {budget_ms:.1f} ms budget")
+                    status = "FAIL" if problems else "ok"
+                    print(f"    {status:<4} #{number:<3} {best_ms:>8.2f} ms  {plan['Node Type']}{': ' + '; '.join(problems) if problems else ''}")
+                    if problems:
+                        failures.append(f"{name} #{number}")
+                        print("         " + " ".join(sql.split()))
+        finally:
+            connection.rollback()
+            if not args.keep:
+                connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+            connection.execute(text("RESET search_path"))  # the connection goes back to the pool
+            connection.commit()
+
+    if failures:
+        print(f"{len(failures)} statements regressed: {', '.join(failures)}")
+        sys.exit(1)
+    print(f"All statements of the {len(HOT_OPERATIONS)} hot operations use indexes within budget")
+
+
+if __name__ == "__main__":
+    main()
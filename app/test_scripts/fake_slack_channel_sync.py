@@ -0,0 +1,181 @@
+"""Check Slack channel sync against a local fake conversations.list server.
+
+Serves a synthetic workspace of N channels with cursor pagination (honouring `limit` and
+`cursor` like Slack does, and answering one request with a 429 + Retry-After) and runs
+slack_service.list_all_conversations against it, verifying that every channel comes back exactly
+once despite the rate limit and how many requests that took.
+
+Then, inside a scratch Postgres schema, runs SlackService.store_channels_in_db twice over the
+fetched channels and checks the upsert and archive logic: stale rows are updated in place, rows
+Slack no longer returns are archived, channels Slack lists again are unarchived, settings that are
+not synced survive, and other workspaces are never touched. Pass --no-db to skip this part.
+
+Run from the repository root:  python -m app.test_scripts.fake_slack_channel_sync [channels] [--no-db]
+"""
+import argparse
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.db.session import engine
+# Every model module, so create_all builds the full schema the channels table depends on
+from app.models import (  # noqa: F401
+    channel, cycle, cycle_update, dependencies, email_digest, git_link, initiative, initiative_channels,
+    initiative_interactions, initiative_teams, issue, issue_activity, issue_interactions, label, magic_link,
+    project, project_channels, project_interactions, project_teams, resource, slack_digest, teams, tenant,
+    updates, user, workspace, workspace_invitation,
+)
+from app.services.slack_service import CONVERSATIONS_PAGE_SIZE, SlackService, list_all_conversations
+
+SCHEMA = "fake_slack_channel_sync"
+RATE_LIMITED_REQUEST = 2  # 1-based index of the request answered with a 429
+
+SEED_SQL = [
+    "INSERT INTO tenants (tenant_id, name) VALUES ('TEN-1', 'Synced tenant'), ('TEN-2', 'Other tenant')",
+    "INSERT INTO users (user_id, name, email, tenant_id) VALUES ('USR-1', 'Owner', 'owner@example.com', 'TEN-1')",
+    """INSERT INTO workspaces (workspace_id, name, tenant_id, created_by)
+       VALUES ('WSP-1', 'Synced', 'TEN-1', 'USR-1'), ('WSP-2', 'Other', 'TEN-2', 'USR-1')""",
+    # Renamed in Slack since the last sync; its digest setting is ours and must survive the upsert
+    """INSERT INTO channels (channel_id, name, workspace_id, is_archived, digest_enabled)
+       VALUES ('C00000000', 'old-name', 'WSP-1', false, true)""",
+    # Archived locally, listed again by Slack
+    "INSERT INTO channels (channel_id, name, workspace_id, is_archived) VALUES ('C00000001', 'channel-1', 'WSP-1', true)",
+    # Deleted in Slack
+    "INSERT INTO channels (channel_id, name, workspace_id, is_archived) VALUES ('CSTALE', 'gone', 'WSP-1', false)",
+    # Another tenant's workspace
+    "INSERT INTO channels (channel_id, name, workspace_id, is_archived) VALUES ('COTHER', 'other', 'WSP-2', false)",
+]
+
+
+def _channel(i: int) -> dict:
+    return {
+        "id": f"C{i:08d}",
+        "name": f"channel-{i}",
+        "is_channel": True,
+        "is_private": False,
+        "created": 1700000000 + i,
+        "creator": "U00000001",
+        "purpose": {"value": f"purpose {i}"},
+        "topic": {"value": ""},
+        "num_members": i % 50,
+    }
+
+
+def _handler(channels: list, requests_seen: list):
+    class FakeSlack(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = parse_qs(url.query)
+            requests_seen.append(query)
+            if len(requests_seen) == RATE_LIMITED_REQUEST:
+                self._reply({"ok": False, "error": "ratelimited"}, status=429, headers={"Retry-After": "1"})
+                return
+            if url.path != "/api/conversations.list" or self.headers.get("Authorization") != "Bearer xoxb-fake":
+                self._reply({"ok": False, "error": "invalid_auth"})
+                return
+            limit = min(int(query.get("limit", ["100"])[0]), 1000)
+            start = int(query.get("cursor", ["0"])[0] or 0)
+            page = channels[start:start + limit]
+            next_cursor = str(start + limit) if start + limit < len(channels) else ""
+            self._reply({"ok": True, "channels": page, "response_metadata": {"next_cursor": next_cursor}})
+
+        def _reply(self, body: dict, status: int = 200, headers: dict = None):
+            payload = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    return FakeSlack
+
+
+def _check_pagination(count: int) -> list:
+    channels = [_channel(i) for i in range(count)]
+    requests_seen = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(channels, requests_seen))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        api_url = f"http://127.0.0.1:{server.server_port}/api/"
+        fetched = list_all_conversations(api_url, "xoxb-fake")
+    finally:
+        server.shutdown()
+
+    ids = [entry["id"] for entry in fetched]
+    assert len(ids) == count, f"expected {count} channels, got {len(ids)}"
+    assert len(set(ids)) == count, "duplicate channels across pages"
+    expected_pages = max(1, -(-count // CONVERSATIONS_PAGE_SIZE))
+    rate_limited = expected_pages >= RATE_LIMITED_REQUEST
+    expected_requests = expected_pages + (1 if rate_limited else 0)
+    assert len(requests_seen) == expected_requests, f"expected {expected_requests} requests, made {len(requests_seen)}"
+    assert all(query.get("limit") == [str(CONVERSATIONS_PAGE_SIZE)] for query in requests_seen)
+    if rate_limited:
+        # The rate-limited page is asked for again, with the same cursor
+        assert requests_seen[RATE_LIMITED_REQUEST - 1] == requests_seen[RATE_LIMITED_REQUEST]
+    print(f"OK: {count} channels in {expected_pages} pages of up to {CONVERSATIONS_PAGE_SIZE}, "
+          f"{len(requests_seen)} requests{' including one 429' if rate_limited else ''}")
+    return fetched
+
+
+def _check_store(fetched: list) -> None:
+    with engine.connect() as connection:
+        connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        connection.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        connection.execute(text(f"SET search_path TO {SCHEMA}"))
+        try:
+            Base.metadata.create_all(connection)
+            for statement in SEED_SQL:
+                connection.execute(text(statement))
+
+            db = Session(bind=connection)
+            service = SlackService(db=db)
+            service.store_channels_in_db(fetched, "TEN-1")
+            service.store_channels_in_db(fetched, "TEN-1")  # a second sync must change nothing
+
+            rows = {
+                row.channel_id: row
+                for row in connection.execute(text(
+                    "SELECT channel_id, name, workspace_id, is_archived, digest_enabled, num_members FROM channels"
+                ))
+            }
+            expected = {entry["id"]: entry for entry in fetched}
+            assert len(rows) == len(expected) + 2, f"expected {len(expected) + 2} channel rows, found {len(rows)}"
+            for channel_id, channel_data in expected.items():
+                row = rows[channel_id]
+                assert row.workspace_id == "WSP-1" and not row.is_archived, f"{channel_id} not active in WSP-1"
+                assert row.name == channel_data["name"] and row.num_members == channel_data["num_members"], \
+                    f"{channel_id} not updated from Slack"
+            assert rows["C00000000"].digest_enabled, "upsert overwrote a column that is not synced"
+            assert rows["CSTALE"].is_archived, "channel missing from Slack was not archived"
+            assert not rows["COTHER"].is_archived, "another workspace's channel was archived"
+            print(f"OK: store_channels_in_db upserted {len(expected)} channels, archived 1, left other workspaces alone")
+        finally:
+            connection.rollback()
+            connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+            connection.execute(text("RESET search_path"))  # the connection goes back to the pool
+            connection.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("channels", type=int, nargs="?", default=2500, help="channels in the fake workspace")
+    parser.add_argument("--no-db", action="store_true", help="only check pagination, without Postgres")
+    args = parser.parse_args()
+
+    fetched = _check_pagination(args.channels)
+    if not args.no_db:
+        _check_store(fetched)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""Run the email digest job once, by hand.
+
+With --dry-run DIR every due digest is written to DIR as an .eml file (open it in any mail client)
+and no subscriber is marked as sent, so the same run can be repeated while tweaking the templates.
+Without it the digests are sent over SMTP and the subscribers are marked as sent; the ones whose
+email failed stay due and are retried on the next run.
+
+Run from the repository root:  python -m app.test_scripts.send_email_digests [--dry-run DIR]
+"""
+import argparse
+
+from app.services.email_digest import EmailDigestJob
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dry-run", metavar="DIR", help="write .eml files to DIR instead of sending")
+    args = parser.parse_args()
+
+    results = EmailDigestJob().run_once(dry_run_dir=args.dry_run)
+    sent = sum(results.values())
+    action = f"written to {args.dry_run}" if args.dry_run else "sent"
+    print(f"{sent}/{len(results)} digests {action}")
+    for email, ok in sorted(results.items()):
+        if not ok:
+            print(f"  failed: {email}")
+
+
+if __name__ == "__main__":
+    main()
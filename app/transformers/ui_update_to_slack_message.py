@@ -1,4 +1,5 @@
-from typing import Dict, Any, List
+import json
+from typing import Dict, Any, List, Tuple
 from slack_sdk.models.blocks import (
     SectionBlock,
     MarkdownTextObject,
@@ -6,7 +7,38 @@ from slack_sdk.models.blocks import (
     HeaderBlock
 )
 
+# Slack rejects messages with more than 50 blocks; the character budget keeps well under its payload limit
+MAX_BLOCKS_PER_MESSAGE = 50
+MAX_CHARS_PER_MESSAGE = 40000
+
 class UIUpdateToSlackMessage:
+    def transform_digest(self, messages: List[dict]) -> List[Tuple[list, int]]:
+        """Render several updates as one digest, split into as few Slack messages as the limits allow.
+
+        Each update keeps the blocks transform() gives it and is never split across messages; returns,
+        in order, the blocks of each message to post with how many of the updates it carries.
+        """
+        chunks = []
+        current, current_chars, current_count = [], 0, 0
+        for message_data in messages:
+            blocks = self.transform(message_data)[:MAX_BLOCKS_PER_MESSAGE - 1]
+            size = sum(len(json.dumps(block)) for block in blocks)
+            if current and (len(current) + len(blocks) > MAX_BLOCKS_PER_MESSAGE - 1 or current_chars + size > MAX_CHARS_PER_MESSAGE):
+                chunks.append((current, current_count))
+                current, current_chars, current_count = [], 0, 0
+            current.extend(blocks)
+            current_chars += size
+            current_count += 1
+        if current:
+            chunks.append((current, current_count))
+
+        for index, (chunk, _) in enumerate(chunks):
+            title = f"*Digest: {len(messages)} update{'s' if len(messages) != 1 else ''}*"
+            if len(chunks) > 1:
+                title += f" ({index + 1}/{len(chunks)})"
+            chunk.insert(0, {"type": "section", "text": {"type": "mrkdwn", "text": title}})
+        return chunks
+
     def transform(self, message_data: dict) -> list:
         content = message_data.get("content", {})
         metadata = message_data.get("metadata", {})
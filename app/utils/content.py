@@ -0,0 +1,53 @@
+from typing import Any, List, Optional
+from sqlalchemy import func, select
+
+# Length of the plain-text preview returned instead of full rich-text content
+DEFAULT_PREVIEW_LENGTH = 280
+
+# Every string `text` member of an editor document, in document order
+_TEXT_NODES_PATH = 'strict $.**.text ? (@.type() == "string")'
+
+
+def content_preview(content: Optional[Any], max_length: int = DEFAULT_PREVIEW_LENGTH) -> str:
+    """Flatten an editor JSON document to plain text and cut it at max_length characters.
+
+    Walks the document depth-first collecting `text` nodes and stops as soon as enough text has
+    been gathered, so large updates are not fully traversed just to build a preview.
+    """
+    parts: List[str] = []
+    length = 0
+    stack = [content] if content is not None else []
+    while stack and length <= max_length:
+        node = stack.pop()
+        if isinstance(node, dict):
+            text = node.get("text")
+            if isinstance(text, str) and text.strip():
+                parts.append(text.strip())
+                length += len(text) + 1
+            children = node.get("content")
+            if isinstance(children, list):
+                stack.extend(reversed(children))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+        elif isinstance(node, str) and node.strip():
+            parts.append(node.strip())
+            length += len(node) + 1
+
+    preview = " ".join(parts)
+    if len(preview) <= max_length:
+        return preview
+    cut = preview[:max_length].rsplit(" ", 1)[0] or preview[:max_length]
+    return cut.rstrip() + "…"
+
+
+def content_text_sql(content_column, max_length: int = DEFAULT_PREVIEW_LENGTH):
+    """SQL expression for the plain text of a JSONB editor document, cut just past max_length.
+
+    Selecting this instead of the column lets listings build previews without fetching whole
+    documents; pass the result through content_preview for the final cut at a word boundary.
+    """
+    text_node = func.jsonb_array_elements_text(
+        func.jsonb_path_query_array(content_column, _TEXT_NODES_PATH)
+    ).column_valued("text_node")
+    plain_text = select(func.string_agg(text_node, " ")).scalar_subquery()
+    return func.left(plain_text, max_length + 1)
@@ -0,0 +1,51 @@
+import hashlib
+from typing import Any, Optional, Sequence
+from fastapi import Response
+from sqlalchemy import func, literal
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+
+# Sent with every ETag so browsers and proxies revalidate instead of serving a stale copy
+ETAG_CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(version: Optional[Sequence[Any]]) -> Optional[str]:
+    """Weak ETag for a version tuple returned by one of the *_version pre-queries."""
+    if version is None:
+        return None
+    digest = hashlib.sha1(repr(tuple(version)).encode("utf-8")).hexdigest()[:24]
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    """Weak comparison of an If-None-Match header against our ETag, as required for GET."""
+    if not if_none_match or not etag:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    ours = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == ours:
+            return True
+    return False
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": ETAG_CACHE_CONTROL})
+
+
+def set_etag(response: Response, etag: Optional[str]) -> None:
+    if etag:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = ETAG_CACHE_CONTROL
+
+
+def rows_fingerprint(*columns):
+    """Aggregate expression hashing the given columns of all rows in a version subquery.
+
+    Catches rows being added, removed or edited even when the parent row's timestamp did not move.
+    """
+    row = func.concat_ws("|", *columns)
+    return func.md5(func.coalesce(func.string_agg(row, aggregate_order_by(literal(","), row)), ""))
@@ -1,9 +1,8 @@
-import uuid
-import random
-import string
+from app.core.utils import generate_ulid
 
 def generate_custom_id(title: str) -> str:
+    # Goes behind a constant per-table prefix (USR-, TEAM-, PRJ-, ...): ULID first, so IDs sort by
+    # creation time, then the title's initials, if any
     words = title.split()
     initials = ''.join(word[0].upper() for word in words if word.isalnum())[:3]
-    alphanumeric = ''.join(random.choices(string.ascii_uppercase + string.digits, k=10))
-    return f"{initials}-{alphanumeric}"
\ No newline at end of file
+    return f"{generate_ulid()}-{initials}" if initials else generate_ulid()